@@ -0,0 +1,83 @@
+import os
+import sys
+import argparse
+import statistics
+
+# Compares bytes transferred and page-load time per page between browser profiles
+# (the default "full" Chrome and the "lean" one that blocks images, media, fonts and
+# trackers). Needs Chrome and, against linkedin.com, a saved session in cookies.pkl.
+# Every profile starts a fresh browser, so each one pays the same cold cache.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from scraper import LinkedInProfileScraper
+
+# The default Resource Timing buffer stops at 250 entries, fewer than a profile page loads
+ENLARGE_TIMING_BUFFER = "performance.setResourceTimingBufferSize(10000);"
+
+
+def measure_profile(browser_profile, urls, base_url, headless, login=True):
+    """Load every URL in a new browser with `browser_profile`; returns one weight dict per page."""
+    scraper = LinkedInProfileScraper("page_weight.xlsx", [], checkpoint_file=None, selector_stats_file=None,
+                                     base_url=base_url, browser_profile=browser_profile, headless=headless,
+                                     wait_strategy="ready")
+    weights = []
+    try:
+        scraper.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": ENLARGE_TIMING_BUFFER})
+        if login:
+            scraper.login_from_cookies()
+        for url in urls:
+            scraper.driver.get(url)
+            scraper.wait_until_ready()
+            weight = scraper.page_weight()
+            weight["url"] = url
+            weights.append(weight)
+            print(f"  {browser_profile:<5} {weight['bytes'] / 1024:>9.0f} KiB {weight['load_ms']:>8.0f} ms  {url}")
+    finally:
+        scraper.driver.quit()
+    return weights
+
+
+def summarize(weights):
+    return {
+        "pages": len(weights),
+        "kib_per_page": statistics.mean(weight["bytes"] for weight in weights) / 1024,
+        "load_ms_median": statistics.median(weight["load_ms"] for weight in weights),
+        "resources_per_page": statistics.mean(weight["resources"] for weight in weights),
+        "opaque_per_page": statistics.mean(weight["opaque"] for weight in weights),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare page weight and load time between browser profiles.")
+    parser.add_argument("urls", nargs="*", help="Pages to load (profile, details or interests URLs)")
+    parser.add_argument("--urls-file", help="File with one URL per line")
+    parser.add_argument("--profiles", default="full,lean", help="Comma-separated browser profiles; the first is the reference")
+    parser.add_argument("--headless", action="store_true", help="Run every profile headless")
+    parser.add_argument("--base-url", default="https://www.linkedin.com", help="Site root (point at mock_linkedin.py offline)")
+    parser.add_argument("--no-login", action="store_true", help="Skip seeding the session from cookies.pkl")
+    args = parser.parse_args()
+
+    urls = list(args.urls)
+    if args.urls_file:
+        with open(args.urls_file, "r", encoding="utf-8") as file:
+            urls += [line.strip() for line in file if line.strip()]
+    if not urls:
+        parser.error("give at least one URL")
+
+    summaries = {}
+    for browser_profile in args.profiles.split(","):
+        summaries[browser_profile] = summarize(
+            measure_profile(browser_profile, urls, args.base_url, args.headless, login=not args.no_login)
+        )
+
+    reference = next(iter(summaries.values()))
+    print(f"\n{'profile':<8} {'KiB/page':>10} {'load ms':>9} {'requests':>9} {'opaque':>7}  vs first")
+    for browser_profile, summary in summaries.items():
+        bytes_change = summary["kib_per_page"] / reference["kib_per_page"] - 1 if reference["kib_per_page"] else 0
+        load_change = summary["load_ms_median"] / reference["load_ms_median"] - 1 if reference["load_ms_median"] else 0
+        print(f"{browser_profile:<8} {summary['kib_per_page']:>10.0f} {summary['load_ms_median']:>9.0f} "
+              f"{summary['resources_per_page']:>9.0f} {summary['opaque_per_page']:>7.0f}  "
+              f"{bytes_change:+.0%} bytes, {load_change:+.0%} load time")
+    print("Opaque cross-origin requests report no size, so byte totals are lower bounds.")
@@ -0,0 +1,243 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import contextlib
+from datetime import datetime
+
+# Offline micro-benchmarks for the CPU-side work of the scraper: date parsing,
+# experience math, output serialization and snapshot extraction. No browser or
+# network is used; profile pages come from the mock_linkedin fixtures.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from scraper import LinkedInProfileScraper
+from output_sink import StreamingExcelSink
+from mock_linkedin import MockLinkedIn, fake_profile
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+ALL_COLUMNS = [
+    "fullName", "summary", "headline", "location", "flagshipProfileUrl", "numOfConnections", "Degree",
+    "Position Title", "Position Description", "Company Name", "More Positions", "Descriptions", "Skills",
+    "Education Degree", "SchoolName", "More Educations", "Total Years of Exp(in Yrs)",
+    "Exp in Current Firm(In Yrs.Months)", "ContactInfo", "Birthday", "ConnectedOn", "Profiles for You",
+    "Connection Status", "message", "sent time",
+]
+
+
+def offline_scraper(output_file="benchmark.xlsx"):
+    return LinkedInProfileScraper(output_file, ALL_COLUMNS, launch_browser=False, checkpoint_file=None,
+                                  selector_stats_file=None)
+
+
+def caption_corpus(size, rng):
+    captions = []
+    for _ in range(size):
+        start = f"{rng.choice(MONTHS)} {rng.randint(1995, 2024)}"
+        kind = rng.random()
+        if kind < 0.4:
+            captions.append(f"{start} - Present · {rng.randint(1, 9)} yrs {rng.randint(1, 11)} mos")
+        elif kind < 0.8:
+            captions.append(f"{start} - {rng.choice(MONTHS)} {rng.randint(1995, 2024)} · {rng.randint(1, 9)} yrs")
+        elif kind < 0.9:
+            captions.append(f"{rng.randint(1995, 2020)} - {rng.randint(2000, 2024)}")
+        else:
+            captions.append(start)
+    return captions
+
+
+def experience_histories(size, rng):
+    histories = []
+    for _ in range(size):
+        history = []
+        for _ in range(rng.randint(1, 12)):
+            start = f"{rng.randint(1, 12):02d}/{rng.randint(1995, 2023)}"
+            end = " " if rng.random() < 0.2 else f"{rng.randint(1, 12):02d}/{rng.randint(1995, 2024)}"
+            history.append({"start_date": start, "end_date": end})
+        histories.append(history)
+    return histories
+
+
+def output_rows(size, rng):
+    rows = []
+    for number in range(size):
+        row = {column: f"{column} value {rng.randint(0, 10 ** 6)}" for column in ALL_COLUMNS}
+        row["flagshipProfileUrl"] = f"https://www.linkedin.com/in/person-{number}"
+        rows.append(row)
+    return rows
+
+
+def measure(function, repeat):
+    """Best wall time of `repeat` runs of function(); prints from the code under test are discarded."""
+    timings = []
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(repeat):
+            started = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def benchmark_dates(scraper, rng, repeat):
+    captions = caption_corpus(20000, rng)
+    return {"extract_dates_and_duration[20k]": (
+        measure(lambda: [scraper.extract_dates_and_duration(caption) for caption in captions], repeat), len(captions)
+    )}
+
+
+def benchmark_experience_math(scraper, rng, repeat):
+    histories = experience_histories(5000, rng)
+    groups = [[(entry["start_date"], entry["end_date"]) for entry in history] for history in histories]
+    return {
+        "calculate_total_experience[5k]": (
+            measure(lambda: [scraper.calculate_total_experience(history) for history in histories], repeat), len(histories)
+        ),
+        "calculate_current_firm_experience[5k]": (
+            measure(lambda: [scraper.calculate_current_firm_experience([group]) for group in groups], repeat), len(groups)
+        ),
+    }
+
+
+def benchmark_output(rng, repeat, sizes):
+    results = {}
+    with tempfile.TemporaryDirectory() as folder:
+        for size in sizes:
+            rows = output_rows(size, rng)
+            output_file = os.path.join(folder, "benchmark.xlsx")
+
+            scraper = offline_scraper(output_file)
+            results[f"save_to_excel[{size}]"] = (measure(lambda: scraper.save_to_excel(rows), repeat), size)
+
+            def stream():
+                sink = StreamingExcelSink(output_file, ALL_COLUMNS)
+                for row in rows:
+                    sink.write(row)
+                sink.close()
+
+            results[f"streaming_sink[{size}]"] = (measure(stream, repeat), size)
+    return results
+
+
+def snapshot_corpus(count, html_dir=None):
+    """(kind, html, url) triples: mock profile pages, plus any pages saved by save_html_content."""
+    site = MockLinkedIn()
+    base = "https://www.linkedin.com"
+    pages = []
+    for number in range(count):
+        slug = f"person-{number}"
+        profile = fake_profile(slug)
+        url = f"{base}/in/{slug}"
+        pages.append(("top_card", site.top_card(profile), url))
+        pages.append(("experience", site.experience(base, profile), url))
+        pages.append(("education", site.education(profile), url))
+        pages.append(("interest_tabs", site.interests(base, profile, 0), url))
+        pages.append(("contact", site.contact_info(profile), url))
+        pages.append(("profiles_for_you", site.browsemap(base, profile), url))
+
+    if html_dir and os.path.isdir(html_dir):
+        for name in sorted(os.listdir(html_dir)):
+            if name.endswith(".html"):
+                with open(os.path.join(html_dir, name), "r", encoding="utf-8") as file:
+                    pages.append(("experience", file.read(), None))
+    return pages
+
+
+def benchmark_snapshots(scraper, repeat, html_dir=None):
+    pages = snapshot_corpus(200, html_dir)
+    fields = set(ALL_COLUMNS)
+
+    def extract_all():
+        for kind, html, url in pages:
+            scraper.extract_snapshot(html, kind, url, fields=fields)
+
+    return {f"snapshot_extraction[{len(pages)} pages]": (measure(extract_all, repeat), len(pages))}
+
+
+def run(repeat, quick=False, html_dir=None):
+    rng = random.Random(1234)
+    scraper = offline_scraper()
+    results = {}
+    results.update(benchmark_dates(scraper, rng, repeat))
+    results.update(benchmark_experience_math(scraper, rng, repeat))
+    results.update(benchmark_output(rng, repeat if quick else max(1, repeat // 2), [100, 1000] if quick else [100, 1000, 10000]))
+    results.update(benchmark_snapshots(scraper, repeat, html_dir))
+    return {
+        name: {"seconds": round(seconds, 6), "items": items, "items_per_second": round(items / seconds, 1) if seconds else None}
+        for name, (seconds, items) in results.items()
+    }
+
+
+# Run-to-run jitter measured on these benchmark sizes reaches ~30 ms, and a single run
+# is noisier still: with fewer than MIN_REPEATS runs regressions are reported, not failed.
+DEFAULT_NOISE_FLOOR = 0.05
+MIN_REPEATS = 3
+
+
+def compare(results, baseline, threshold, noise_floor=DEFAULT_NOISE_FLOOR):
+    """
+    Print a comparison report and return the names of benchmarks that regressed beyond `threshold`.
+    Slowdowns smaller than `noise_floor` seconds are reported but never flagged.
+    """
+    regressions = []
+    print(f"{'benchmark':<42} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            print(f"{name:<42} {'-':>10} {current['seconds']:>10.4f} {'new':>8}")
+            continue
+        change = current["seconds"] / previous["seconds"] - 1 if previous["seconds"] else 0.0
+        flag = ""
+        if change > threshold and current["seconds"] - previous["seconds"] > noise_floor:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<42} {previous['seconds']:>10.4f} {current['seconds']:>10.4f} {change:>+7.1%}{flag}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offline micro-benchmarks for parsing, date math and output serialization.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per benchmark (the best is reported)")
+    parser.add_argument("--quick", action="store_true", help="Skip the 10k-row output benchmarks")
+    parser.add_argument("--html-dir", default=os.path.join(os.getcwd(), "html_files"), help="Pages saved by save_html_content to include")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown before a benchmark is flagged (0.25 = 25%%)")
+    parser.add_argument("--noise-floor", type=float, default=DEFAULT_NOISE_FLOOR, help="Ignore slowdowns below this many seconds")
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    results = run(args.repeat, quick=args.quick, html_dir=args.html_dir)
+    report = {"created": datetime.now().isoformat(timespec="seconds"), "python": sys.version.split()[0], "results": results}
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        for name, result in results.items():
+            print(f"{name:<42} {result['seconds']:>10.4f}s")
+        sys.exit(0)
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline first.")
+        sys.exit(0)
+
+    with open(args.baseline, "r", encoding="utf-8") as file:
+        baseline = json.load(file)["results"]
+
+    regressions = compare(results, baseline, args.threshold, args.noise_floor)
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}.")
+        if args.repeat < MIN_REPEATS:
+            print(f"Only {args.repeat} run(s) per benchmark; use --repeat {MIN_REPEATS} or more to confirm.")
+            sys.exit(0)
+        sys.exit(1)
+    print("No regressions.")
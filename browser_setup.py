@@ -0,0 +1,151 @@
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import threading
+import subprocess
+
+import chromedriver_autoinstaller
+
+# Where Chrome usually lives when it is not on PATH. CHROME_BINARY (or the
+# scraper's browser_binary argument) overrides the search.
+KNOWN_BROWSER_PATHS = {
+    "darwin": [
+        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+        "/Applications/Chromium.app/Contents/MacOS/Chromium",
+    ],
+    "linux": [
+        "/usr/bin/google-chrome",
+        "/usr/bin/google-chrome-stable",
+        "/usr/bin/chromium",
+        "/usr/bin/chromium-browser",
+        "/snap/bin/chromium",
+        "/opt/google/chrome/chrome",
+    ],
+    "win32": [
+        r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+        r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+    ],
+}
+BROWSER_COMMANDS = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"]
+
+
+def find_browser_binary(explicit=None):
+    """Path of the Chrome binary: `explicit`, then $CHROME_BINARY, then the usual install paths and PATH."""
+    for candidate in (explicit, os.environ.get("CHROME_BINARY")):
+        if candidate:
+            if not os.path.exists(candidate):
+                raise FileNotFoundError(f"Chrome binary not found at {candidate}")
+            return candidate
+
+    for path in KNOWN_BROWSER_PATHS.get(sys.platform, []):
+        if os.path.exists(path):
+            return path
+    for command in BROWSER_COMMANDS:
+        path = shutil.which(command)
+        if path:
+            return path
+    return None  # Let undetected_chromedriver search on its own
+
+
+def browser_version(binary):
+    """Full version string reported by `binary --version`, or None."""
+    if not binary:
+        return None
+    try:
+        output = subprocess.run([binary, "--version"], capture_output=True, text=True, timeout=15).stdout
+    except Exception as e:
+        print(f"Error reading the Chrome version of {binary}: {e}")
+        return None
+    match = re.search(r"(\d+)\.\d+\.\d+\.\d+", output)
+    return match.group(0) if match else None
+
+
+class DriverCache:
+    """
+    JSON file remembering the resolved Chrome binary, its version and the matching
+    chromedriver, so a warm start skips the binary search, the version probe and the
+    driver download. Entries are reused while the binary's mtime is unchanged. It also
+    records when the session of each persistent browser profile was last validated.
+    """
+
+    def __init__(self, path="driver_cache.json"):
+        self.path = path
+        self.lock = threading.Lock()
+        self.data = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as file:
+                    self.data = json.load(file)
+            except Exception as e:
+                print(f"Error loading driver cache from {path}: {e}")
+
+    def save(self):
+        if not self.path:
+            return
+        temp_path = f"{self.path}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(self.data, file, indent=2)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            print(f"Error saving driver cache to {self.path}: {e}")
+
+    def resolve(self, browser_binary=None):
+        """Return {"binary", "version", "major", "driver"}, from the cache when the binary is unchanged."""
+        with self.lock:
+            cached = self.data.get("browser")
+            if cached and self._still_valid(cached, browser_binary):
+                return cached
+
+            binary = find_browser_binary(browser_binary)
+            version = browser_version(binary)
+            try:
+                driver = chromedriver_autoinstaller.install()  # Downloads the chromedriver matching the installed Chrome
+            except Exception as e:
+                print(f"Error installing chromedriver, leaving it to undetected_chromedriver: {e}")
+                driver = None
+            resolved = {
+                "binary": binary,
+                "binary_mtime": os.path.getmtime(binary) if binary else None,
+                "version": version,
+                "major": int(version.split(".")[0]) if version else None,
+                "driver": driver,
+                "requested": browser_binary or os.environ.get("CHROME_BINARY"),
+                "resolved_at": time.time(),
+            }
+            self.data["browser"] = resolved
+            self.save()
+            return resolved
+
+    def _still_valid(self, cached, browser_binary):
+        requested = browser_binary or os.environ.get("CHROME_BINARY")
+        if requested != cached.get("requested"):
+            return False
+        binary = cached.get("binary")
+        if binary and (not os.path.exists(binary) or os.path.getmtime(binary) != cached.get("binary_mtime")):
+            return False  # Chrome was updated or removed
+        driver = cached.get("driver")
+        return not driver or os.path.exists(driver)
+
+    def session_fresh(self, user_data_dir, max_age):
+        """True when the session in this browser profile was validated less than `max_age` seconds ago."""
+        if not user_data_dir or not max_age:
+            return False
+        with self.lock:
+            validated_at = self.data.get("sessions", {}).get(os.path.abspath(user_data_dir))
+        return validated_at is not None and time.time() - validated_at < max_age
+
+    def mark_session(self, user_data_dir, valid=True):
+        """Record (or forget) a validated session for a browser profile."""
+        if not user_data_dir:
+            return
+        with self.lock:
+            sessions = self.data.setdefault("sessions", {})
+            if valid:
+                sessions[os.path.abspath(user_data_dir)] = time.time()
+            else:
+                sessions.pop(os.path.abspath(user_data_dir), None)
+            self.save()
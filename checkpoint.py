@@ -0,0 +1,164 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from urllib.parse import urlsplit, urlunsplit
+
+
+def normalize_profile_url(url):
+    """Canonical form of a profile URL: lower-case host, no query, fragment or trailing slash."""
+    parts = urlsplit(url.strip())
+    return urlunsplit((parts.scheme.lower() or "https", parts.netloc.lower(), parts.path.rstrip("/"), "", ""))
+
+
+class CheckpointStore:
+    """
+    SQLite record of a run: the harvested connection list, the finished sections
+    of every profile and the output row of every finished profile. Keyed by
+    normalized profile URL so a restarted run can skip completed work.
+    """
+
+    def __init__(self, path="checkpoint.db"):
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript('''
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+            CREATE TABLE IF NOT EXISTS harvest (
+                position INTEGER PRIMARY KEY,
+                connection TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS profiles (
+                url TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                row TEXT,
+                updated_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS sections (
+                url TEXT NOT NULL,
+                section TEXT NOT NULL,
+                data TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (url, section)
+            );
+        ''')
+        self.connection.commit()
+
+    def _execute(self, query, params=()):
+        with self.lock:
+            cursor = self.connection.execute(query, params)
+            self.connection.commit()
+            return cursor
+
+    def _query(self, query, params=()):
+        with self.lock:
+            return self.connection.execute(query, params).fetchall()
+
+    def reset(self):
+        """Forget everything recorded by a previous run."""
+        with self.lock:
+            self.connection.executescript('''
+                DELETE FROM meta;
+                DELETE FROM harvest;
+                DELETE FROM profiles;
+                DELETE FROM sections;
+            ''')
+            self.connection.commit()
+
+    def use_columns(self, columns):
+        """
+        Record the output columns of this run. Finished profiles and sections recorded
+        for a different column set are dropped, since they lack or carry other columns;
+        the harvest is kept. Returns True when stored work was dropped.
+        """
+        key = json.dumps(sorted(set(columns)))
+        with self.lock:
+            stored = self.connection.execute("SELECT value FROM meta WHERE key = 'columns'").fetchone()
+            changed = stored is not None and stored[0] != key
+            if changed:
+                self.connection.execute("DELETE FROM profiles")
+                self.connection.execute("DELETE FROM sections")
+            self.connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('columns', ?)", (key,))
+            self.connection.commit()
+        return changed
+
+    def save_harvest(self, harvest_key, connections):
+        """Store the harvested connection list together with the settings that produced it."""
+        with self.lock:
+            self.connection.execute("DELETE FROM harvest")
+            self.connection.executemany(
+                "INSERT INTO harvest (position, connection) VALUES (?, ?)",
+                [(position, json.dumps(connection)) for position, connection in enumerate(connections)]
+            )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('harvest_key', ?)", (harvest_key,)
+            )
+            self.connection.commit()
+
+    def load_harvest(self, harvest_key):
+        """Return the stored connection list, or None if it was harvested with different settings."""
+        stored_key = self._query("SELECT value FROM meta WHERE key = 'harvest_key'")
+        if not stored_key or stored_key[0][0] != harvest_key:
+            return None
+        return self.harvested_connections()
+
+    def harvested_connections(self):
+        """Every stored connection, whatever settings harvested it."""
+        rows = self._query("SELECT connection FROM harvest ORDER BY position")
+        return [json.loads(connection) for (connection,) in rows]
+
+    def save_section(self, url, section, data):
+        """Record the result columns of one finished profile section."""
+        self._execute(
+            "INSERT OR REPLACE INTO sections (url, section, data, updated_at) VALUES (?, ?, ?, ?)",
+            (normalize_profile_url(url), section, json.dumps(data, default=str), datetime.now().isoformat())
+        )
+
+    def load_sections(self, url):
+        """Return {section: result columns} for the sections already finished for a profile."""
+        rows = self._query("SELECT section, data FROM sections WHERE url = ?", (normalize_profile_url(url),))
+        return {section: json.loads(data) for section, data in rows}
+
+    def mark_profile_done(self, url, row):
+        """Record a finished profile and its output row."""
+        self._execute(
+            "INSERT OR REPLACE INTO profiles (url, status, row, updated_at) VALUES (?, 'done', ?, ?)",
+            (normalize_profile_url(url), json.dumps(row, default=str), datetime.now().isoformat())
+        )
+
+    def mark_profile_blocked(self, url, state):
+        """Record a profile given up on after blocked pages; a resumed run scrapes it again."""
+        self._execute(
+            "INSERT OR REPLACE INTO profiles (url, status, row, updated_at) VALUES (?, ?, NULL, ?)",
+            (normalize_profile_url(url), state, datetime.now().isoformat())
+        )
+
+    def mark_profile_partial(self, url, row):
+        """Record a profile whose time budget ran out; a resumed run scrapes its unfinished sections again."""
+        self._execute(
+            "INSERT OR REPLACE INTO profiles (url, status, row, updated_at) VALUES (?, 'partial', ?, ?)",
+            (normalize_profile_url(url), json.dumps(row, default=str), datetime.now().isoformat())
+        )
+
+    def blocked_profiles(self):
+        """{url: page state} of the profiles given up on after blocked pages."""
+        return dict(self._query("SELECT url, status FROM profiles WHERE status NOT IN ('done', 'partial')"))
+
+    def partial_profiles(self):
+        """URLs of the profiles whose time budget ran out before every section was scraped."""
+        return [url for (url,) in self._query("SELECT url FROM profiles WHERE status = 'partial'")]
+
+    def completed_row(self, url):
+        """Return the stored output row of a finished profile, or None."""
+        rows = self._query(
+            "SELECT row FROM profiles WHERE url = ? AND status = 'done'", (normalize_profile_url(url),)
+        )
+        return json.loads(rows[0][0]) if rows else None
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
@@ -0,0 +1,202 @@
+import os
+import time
+import signal
+import threading
+
+try:
+    import psutil
+except ImportError:
+    psutil = None  # Memory is read from /proc instead (Linux only)
+
+
+def process_tree(pid):
+    """The pid and every descendant of it."""
+    if psutil is not None:
+        try:
+            parent = psutil.Process(pid)
+            return [pid] + [child.pid for child in parent.children(recursive=True)]
+        except psutil.Error:
+            return []
+
+    if not os.path.isdir("/proc"):
+        return [pid]
+    children = {}
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{name}/stat", "r") as file:
+                # The command name may contain spaces; the parent pid follows its closing parenthesis
+                parent_pid = int(file.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(parent_pid, []).append(int(name))
+
+    tree, pending = [], [pid]
+    while pending:
+        current = pending.pop()
+        tree.append(current)
+        pending.extend(children.get(current, []))
+    return tree
+
+
+def process_rss(pid):
+    """Resident memory of one process in bytes, or 0 when it is gone."""
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss
+        except psutil.Error:
+            return 0
+    try:
+        with open(f"/proc/{pid}/status", "r") as file:
+            for line in file:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def tree_rss(pid):
+    """Resident memory of a process and all of its children (Chrome's renderers, GPU and utility processes)."""
+    return sum(process_rss(member) for member in process_tree(pid))
+
+
+def kill_tree(pid):
+    for member in reversed(process_tree(pid)):
+        try:
+            os.kill(member, signal.SIGKILL)
+        except OSError:
+            pass
+
+
+class DriverLifecycle:
+    """
+    Keeps one scraper's browser usable over a long run. It sets page-load and script
+    timeouts, and a watchdog thread kills the browser when a single WebDriver command
+    has been running longer than `command_timeout`. The browser is restarted, and the
+    session restored, when it crashes or is killed, after `recycle_every` profiles, or
+    once the browser's process tree uses more than `max_memory_mb`. A profile lost to
+    a crash or to a page-load timeout is scraped again in the new browser.
+    """
+
+    def __init__(self, scraper, page_load_timeout=60, script_timeout=30, command_timeout=180,
+                 recycle_every=None, max_memory_mb=None, retries=1):
+        self.scraper = scraper
+        self.page_load_timeout = page_load_timeout
+        self.script_timeout = script_timeout
+        self.command_timeout = command_timeout
+        self.recycle_every = recycle_every
+        self.max_memory_mb = max_memory_mb
+        self.retries = retries
+        self.profiles = 0  # Profiles scraped by the current browser
+        self.restarts = 0
+        self.command_started = None
+        self.killed = False
+        self.stopped = threading.Event()
+        self.watchdog = threading.Thread(target=self._watch, daemon=True)
+        self.watch(scraper.driver)
+        self.watchdog.start()
+
+    def watch(self, driver):
+        """Apply the timeouts and time every command of `driver`."""
+        driver.set_page_load_timeout(self.page_load_timeout)
+        driver.set_script_timeout(self.script_timeout)
+        execute = driver.execute
+
+        def timed_execute(driver_command, params=None):
+            self.command_started = time.monotonic()
+            try:
+                return execute(driver_command, params)
+            finally:
+                self.command_started = None
+
+        driver.execute = timed_execute
+        self.killed = False
+
+    def _watch(self):
+        while not self.stopped.wait(1):
+            started = self.command_started
+            if started is not None and time.monotonic() - started > self.command_timeout:
+                print(f"WebDriver command stuck for over {self.command_timeout}s; killing the browser.")
+                self.killed = True
+                self.command_started = None
+                self.kill()
+
+    def browser_pid(self):
+        return getattr(self.scraper.driver, "browser_pid", None)
+
+    def kill(self):
+        """Kill the browser process tree; the hung command then fails instead of blocking forever."""
+        pid = self.browser_pid()
+        if pid:
+            kill_tree(pid)
+
+    def memory_mb(self):
+        pid = self.browser_pid()
+        return tree_rss(pid) / 1024 ** 2 if pid else 0
+
+    def alive(self):
+        """Whether the browser still answers; only asked after a profile failed."""
+        if self.killed:
+            return False
+        try:
+            self.scraper.driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def recycle_reason(self):
+        if self.recycle_every and self.profiles >= self.recycle_every:
+            return f"{self.profiles} profiles"
+        if self.max_memory_mb:
+            memory = self.memory_mb()
+            if memory > self.max_memory_mb:
+                return f"{memory:.0f} MB in use"
+        return None
+
+    def restart(self, reason):
+        """Replace the browser with a fresh one and restore the session."""
+        print(f"Restarting the browser ({reason}).")
+        try:
+            self.scraper.driver.quit()
+        except Exception:
+            self.kill()
+        self.scraper.driver = self.scraper.instrument(self.scraper.init_driver())
+        self.watch(self.scraper.driver)
+        self.scraper.login_from_cookies()
+        self.profiles = 0
+        self.restarts += 1
+
+    def scrape(self, url, connection):
+        """
+        scrape_connection under supervision: a profile lost to a browser crash or to a page
+        that never finished loading is retried in a new browser.
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                reason = self.recycle_reason()
+                if reason:
+                    self.restart(reason)
+            except Exception as e:
+                print(f"Error restarting the browser: {e}")
+                return None
+
+            row = self.scraper.scrape_connection(url, connection)
+            self.profiles += 1
+            # A page-load timeout leaves the browser answering, but stuck on a page that never loaded
+            timed_out = self.scraper.last_load_timed_out
+            if row is not None or (not timed_out and self.alive()):
+                return row
+
+            try:
+                self.restart("page load timed out" if timed_out else "browser hung" if self.killed else "browser crashed")
+            except Exception as e:
+                print(f"Error restarting the browser: {e}")
+                return None
+            if attempt < self.retries:
+                print(f"Re-queueing {url} after the browser restart.")
+        return None
+
+    def stop(self):
+        self.stopped.set()
@@ -0,0 +1,200 @@
+import os
+import sys
+import gzip
+import sqlite3
+import hashlib
+import argparse
+import threading
+from datetime import datetime
+
+from checkpoint import normalize_profile_url
+
+
+def segment_path(directory, segment):
+    return os.path.join(directory, f"segment-{segment:05d}.gz")
+
+
+def read_record(directory, segment, offset, length):
+    """Decompress the single record at `offset` of a segment; needs no index, so worker processes can call it."""
+    with open(segment_path(directory, segment), "rb") as file:
+        file.seek(offset)
+        return gzip.decompress(file.read(length)).decode("utf-8")
+
+
+class HtmlArchive:
+    """
+    Append-only archive of page snapshots. Pages are written as independent gzip
+    members appended to numbered segment files (each segment is a valid multi-member
+    .gz file), and a sidecar SQLite index maps every (url, kind) fetch to the
+    segment, offset and length of its record. Identical pages are stored once by
+    sha256; reading one page decompresses only its own record.
+    """
+
+    def __init__(self, directory="html_archive", segment_bytes=256 * 1024 ** 2):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+        self.connection = sqlite3.connect(os.path.join(directory, "index.db"), check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript('''
+            CREATE TABLE IF NOT EXISTS blobs (
+                sha256 TEXT PRIMARY KEY,
+                segment INTEGER NOT NULL,
+                offset INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                size INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS pages (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                sha256 TEXT NOT NULL REFERENCES blobs (sha256),
+                fetched_at TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS pages_url ON pages (url, kind, id);
+        ''')
+        self.connection.commit()
+
+        last_segment = self.connection.execute("SELECT MAX(segment) FROM blobs").fetchone()[0]
+        self.segment = last_segment or 1
+        self.writer = None
+
+    def _open_writer(self):
+        if self.writer is None:
+            self.writer = open(segment_path(self.directory, self.segment), "ab")
+        if self.writer.tell() >= self.segment_bytes:
+            self.writer.close()
+            self.segment += 1
+            self.writer = open(segment_path(self.directory, self.segment), "ab")
+        return self.writer
+
+    def add(self, url, kind, html, fetched_at=None):
+        """Archive one page snapshot and return its sha256; unchanged content only adds an index entry."""
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        fetched_at = fetched_at or datetime.now().isoformat()
+
+        with self.lock:
+            known = self.connection.execute("SELECT 1 FROM blobs WHERE sha256 = ?", (digest,)).fetchone()
+            if not known:
+                record = gzip.compress(data)
+                writer = self._open_writer()
+                offset = writer.tell()
+                writer.write(record)
+                writer.flush()
+                self.connection.execute(
+                    "INSERT INTO blobs (sha256, segment, offset, length, size) VALUES (?, ?, ?, ?, ?)",
+                    (digest, self.segment, offset, len(record), len(data))
+                )
+            self.connection.execute(
+                "INSERT INTO pages (url, kind, sha256, fetched_at) VALUES (?, ?, ?, ?)",
+                (normalize_profile_url(url), kind, digest, fetched_at)
+            )
+            self.connection.commit()
+        return digest
+
+    def read(self, segment, offset, length):
+        """Decompress the single record at `offset` of a segment."""
+        return read_record(self.directory, segment, offset, length)
+
+    def lookup(self, url, kind=None):
+        """Index entry of the latest fetch of a URL (optionally of one page kind), or None."""
+        query = '''
+            SELECT pages.url, pages.kind, blobs.segment, blobs.offset, blobs.length, pages.fetched_at, pages.sha256
+            FROM pages JOIN blobs ON blobs.sha256 = pages.sha256
+            WHERE pages.url = ?
+        '''
+        params = [normalize_profile_url(url)]
+        if kind is not None:
+            query += " AND pages.kind = ?"
+            params.append(kind)
+        with self.lock:
+            row = self.connection.execute(query + " ORDER BY pages.id DESC LIMIT 1", params).fetchone()
+        return self._entry(row) if row else None
+
+    def get(self, url, kind=None):
+        """HTML of the latest fetch of a URL, or None."""
+        entry = self.lookup(url, kind)
+        return self.read(entry["segment"], entry["offset"], entry["length"]) if entry else None
+
+    def entries(self, kinds=None):
+        """Index entries of the latest fetch of every (url, kind), ordered by URL and kind."""
+        query = '''
+            SELECT pages.url, pages.kind, blobs.segment, blobs.offset, blobs.length, pages.fetched_at, pages.sha256
+            FROM pages JOIN blobs ON blobs.sha256 = pages.sha256
+            WHERE pages.id IN (SELECT MAX(id) FROM pages GROUP BY url, kind)
+        '''
+        params = []
+        if kinds:
+            query += f" AND pages.kind IN ({', '.join('?' for _ in kinds)})"
+            params = list(kinds)
+        with self.lock:
+            rows = self.connection.execute(query + " ORDER BY pages.url, pages.kind", params).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def _entry(self, row):
+        return dict(zip(("url", "kind", "segment", "offset", "length", "fetched_at", "sha256"), row))
+
+    def import_directory(self, folder, kind="html_file"):
+        """Archive every .html file in a folder, such as the html_files/ dumps of save_html_content."""
+        count = 0
+        for name in sorted(os.listdir(folder)):
+            if not name.endswith(".html"):
+                continue
+            path = os.path.join(folder, name)
+            with open(path, "r", encoding="utf-8") as file:
+                html = file.read()
+            fetched_at = datetime.fromtimestamp(os.path.getmtime(path)).isoformat()
+            self.add(f"file:///{name[:-len('.html')]}", kind, html, fetched_at)
+            count += 1
+        return count
+
+    def stats(self):
+        with self.lock:
+            pages, urls = self.connection.execute("SELECT COUNT(*), COUNT(DISTINCT url) FROM pages").fetchone()
+            blobs, stored, raw = self.connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(length), 0), COALESCE(SUM(size), 0) FROM blobs"
+            ).fetchone()
+        return {"fetches": pages, "urls": urls, "unique_pages": blobs, "stored_bytes": stored, "raw_bytes": raw,
+                "segments": self.segment}
+
+    def close(self):
+        with self.lock:
+            if self.writer is not None:
+                self.writer.close()
+                self.writer = None
+            self.connection.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Inspect or fill an HTML archive.")
+    parser.add_argument("--archive", default="html_archive", help="Archive directory")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("stats", help="Print page counts and compression")
+    import_command = commands.add_parser("import", help="Archive the .html files of a folder (e.g. html_files)")
+    import_command.add_argument("folder")
+    get_command = commands.add_parser("get", help="Print the latest archived HTML of a URL")
+    get_command.add_argument("url")
+    get_command.add_argument("kind", nargs="?")
+    args = parser.parse_args()
+
+    archive = HtmlArchive(args.archive)
+    try:
+        if args.command == "import":
+            print(f"Archived {archive.import_directory(args.folder)} files from {args.folder}.")
+        elif args.command == "get":
+            html = archive.get(args.url, args.kind)
+            if html is None:
+                print(f"{args.url} is not archived.", file=sys.stderr)
+                sys.exit(1)
+            sys.stdout.write(html)
+        if args.command in ("stats", "import"):
+            stats = archive.stats()
+            ratio = stats["raw_bytes"] / stats["stored_bytes"] if stats["stored_bytes"] else 0
+            print(f"{stats['fetches']} fetches of {stats['urls']} URLs, {stats['unique_pages']} unique pages "
+                  f"in {stats['segments']} segment(s): {stats['stored_bytes'] / 1e6:.1f} MB stored, "
+                  f"{stats['raw_bytes'] / 1e6:.1f} MB raw ({ratio:.1f}x).")
+    finally:
+        archive.close()
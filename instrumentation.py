@@ -0,0 +1,215 @@
+import os
+import json
+import time
+import threading
+from collections import Counter
+from datetime import datetime
+
+from selenium.webdriver.remote.command import Command
+
+# WebDriver commands grouped the way the report counts them
+COMMAND_KINDS = {
+    Command.FIND_ELEMENT: "find",
+    Command.FIND_ELEMENTS: "find",
+    Command.FIND_CHILD_ELEMENT: "find",
+    Command.FIND_CHILD_ELEMENTS: "find",
+    Command.W3C_EXECUTE_SCRIPT: "script",
+    Command.W3C_EXECUTE_SCRIPT_ASYNC: "script",
+    Command.GET: "get",
+    Command.GET_ELEMENT_TEXT: "text",
+    Command.GET_ELEMENT_ATTRIBUTE: "attribute",
+    Command.GET_ELEMENT_PROPERTY: "attribute",
+}
+
+# Histogram buckets in seconds, wide enough for a whole profile
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 90, 120, 300)
+
+
+def command_kind(command, params):
+    kind = COMMAND_KINDS.get(command, "other")
+    # WebElement.get_attribute is shipped as an execute_script call
+    if kind == "script" and str((params or {}).get("script", "")).startswith("/* getAttribute */"):
+        return "attribute"
+    return kind
+
+
+def instrument_driver(driver, scraper):
+    """
+    Count every WebDriver round trip against the scraper's current profile section.
+    Patches the driver instance's execute(), which every find, script, text and
+    attribute call funnels through, so elements stay real WebElements.
+    """
+    execute = driver.execute
+
+    def counted_execute(command, params=None):
+        metrics = scraper.profile_metrics
+        if metrics is not None:
+            metrics.count(command_kind(command, params))
+        return execute(command, params)
+
+    driver.execute = counted_execute
+    return driver
+
+
+class ProfileMetrics:
+    """
+    Timings and WebDriver call counts for one profile, split into sections.
+    Sections are consecutive laps: entering a section closes the previous one.
+    Time inside a section is divided into intentional sleep, waiting for the page
+    and the remainder, which counts as active extraction.
+    """
+
+    def __init__(self, url):
+        self.url = url
+        self.started = time.monotonic()
+        self.sections = {}
+        self.current = None
+        self.section_started = None
+        self.enter("navigation")
+
+    def _section(self, name):
+        if name not in self.sections:
+            self.sections[name] = {"seconds": 0.0, "sleep": 0.0, "wait": 0.0, "calls": Counter()}
+        return self.sections[name]
+
+    def enter(self, name):
+        now = time.monotonic()
+        if self.current is not None:
+            self._section(self.current)["seconds"] += now - self.section_started
+        self.current = name
+        self.section_started = now
+        self._section(name)
+
+    def count(self, kind):
+        self.sections[self.current]["calls"][kind] += 1
+
+    def add(self, phase, seconds):
+        """Attribute `seconds` of the current section to "sleep" or "wait"."""
+        self.sections[self.current][phase] += seconds
+
+    def finish(self, status="ok"):
+        self.enter("done")
+        del self.sections["done"]
+
+        sections = {}
+        for name, section in self.sections.items():
+            active = max(0.0, section["seconds"] - section["sleep"] - section["wait"])
+            sections[name] = {
+                "seconds": round(section["seconds"], 3),
+                "sleep": round(section["sleep"], 3),
+                "wait": round(section["wait"], 3),
+                "active": round(active, 3),
+                "calls": dict(section["calls"]),
+            }
+
+        return {
+            "url": self.url,
+            "finished_at": datetime.now().isoformat(timespec="seconds"),
+            "status": status,
+            "seconds": round(time.monotonic() - self.started, 3),
+            "sleep": round(sum(section["sleep"] for section in sections.values()), 3),
+            "wait": round(sum(section["wait"] for section in sections.values()), 3),
+            "active": round(sum(section["active"] for section in sections.values()), 3),
+            "round_trips": sum(sum(section["calls"].values()) for section in sections.values()),
+            "sections": sections,
+        }
+
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS)
+        self.total = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        for index, bound in enumerate(BUCKETS):
+            if value <= bound:
+                self.counts[index] += 1
+        self.total += 1
+        self.sum += value
+
+    def render(self, name, labels):
+        label_text = ",".join(f'{key}="{value}"' for key, value in labels)
+        prefix = f"{label_text}," if label_text else ""
+        lines = [f'{name}_bucket{{{prefix}le="{bound}"}} {count}' for bound, count in zip(BUCKETS, self.counts)]
+        lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {self.total}')
+        lines.append(f"{name}_sum{{{label_text}}} {self.sum:.3f}")
+        lines.append(f"{name}_count{{{label_text}}} {self.total}")
+        return lines
+
+
+class MetricsRecorder:
+    """
+    Collects finished ProfileMetrics from every worker. Each profile is appended to
+    a JSONL file; aggregate histograms and call counters are rewritten to a
+    Prometheus textfile (node_exporter textfile collector format).
+    """
+
+    def __init__(self, jsonl_path=None, prometheus_path=None):
+        self.jsonl_path = jsonl_path
+        self.prometheus_path = prometheus_path
+        self.lock = threading.Lock()
+        self.profile_seconds = {}  # phase -> Histogram
+        self.section_seconds = {}  # (section, phase) -> Histogram
+        self.calls = Counter()  # (section, kind) -> count
+        self.profiles = Counter()  # status -> count
+
+    def record(self, report):
+        with self.lock:
+            if self.jsonl_path:
+                try:
+                    with open(self.jsonl_path, "a", encoding="utf-8") as file:
+                        file.write(json.dumps(report) + "\n")
+                except Exception as e:
+                    print(f"Error writing metrics to {self.jsonl_path}: {e}")
+
+            self.profiles[report["status"]] += 1
+            for phase in ("seconds", "sleep", "wait", "active"):
+                self.profile_seconds.setdefault(phase, Histogram()).observe(report[phase])
+            for name, section in report["sections"].items():
+                for phase in ("seconds", "sleep", "wait", "active"):
+                    self.section_seconds.setdefault((name, phase), Histogram()).observe(section[phase])
+                for kind, count in section["calls"].items():
+                    self.calls[(name, kind)] += count
+
+            if self.prometheus_path:
+                self.write_prometheus()
+
+    def write_prometheus(self):
+        lines = [
+            "# HELP linkedin_profiles_total Profiles scraped, by outcome.",
+            "# TYPE linkedin_profiles_total counter",
+        ]
+        lines += [f'linkedin_profiles_total{{status="{status}"}} {count}' for status, count in sorted(self.profiles.items())]
+
+        lines += [
+            "# HELP linkedin_profile_seconds Time per profile; phase is total (seconds), sleep, wait or active.",
+            "# TYPE linkedin_profile_seconds histogram",
+        ]
+        for phase, histogram in sorted(self.profile_seconds.items()):
+            lines += histogram.render("linkedin_profile_seconds", [("phase", phase)])
+
+        lines += [
+            "# HELP linkedin_section_seconds Time per profile section, split by phase.",
+            "# TYPE linkedin_section_seconds histogram",
+        ]
+        for (section, phase), histogram in sorted(self.section_seconds.items()):
+            lines += histogram.render("linkedin_section_seconds", [("section", section), ("phase", phase)])
+
+        lines += [
+            "# HELP linkedin_webdriver_calls_total WebDriver round trips by section and command kind.",
+            "# TYPE linkedin_webdriver_calls_total counter",
+        ]
+        lines += [
+            f'linkedin_webdriver_calls_total{{section="{section}",kind="{kind}"}} {count}'
+            for (section, kind), count in sorted(self.calls.items())
+        ]
+
+        # Write then rename so the collector never reads a half-written file
+        temp_path = f"{self.prometheus_path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                file.write("\n".join(lines) + "\n")
+            os.replace(temp_path, self.prometheus_path)
+        except Exception as e:
+            print(f"Error writing Prometheus metrics to {self.prometheus_path}: {e}")
@@ -0,0 +1,143 @@
+import sqlite3
+import threading
+from datetime import datetime
+
+from checkpoint import normalize_profile_url
+
+
+class InvitationIndex:
+    """
+    SQLite index of the sent-invitations list: profile URL -> message, sent time,
+    list position and when the invitation was first and last seen. Positions count
+    pending invitations from the newest (0) down, like the list on the site.
+    Invitations that were withdrawn or accepted are kept with status 'gone'.
+    """
+
+    def __init__(self, path="invitations.db"):
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript('''
+            CREATE TABLE IF NOT EXISTS invitations (
+                url TEXT PRIMARY KEY,
+                profile_url TEXT NOT NULL,
+                message TEXT,
+                sent_time TEXT,
+                position INTEGER,
+                status TEXT NOT NULL,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS invitations_position ON invitations (status, position);
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        ''')
+        self.connection.commit()
+
+    def _query(self, query, params=()):
+        with self.lock:
+            return self.connection.execute(query, params).fetchall()
+
+    def get(self, url):
+        """Return the stored invitation for a profile URL as a dict, or None."""
+        rows = self._query("SELECT * FROM invitations WHERE url = ?", (normalize_profile_url(url),))
+        return dict(rows[0]) if rows else None
+
+    def is_pending(self, url):
+        entry = self.get(url)
+        return entry is not None and entry["status"] == "pending"
+
+    def pending_count(self):
+        return self._query("SELECT COUNT(*) FROM invitations WHERE status = 'pending'")[0][0]
+
+    def pending_urls_between(self, first, last):
+        """Normalized URLs of the pending invitations at positions first..last-1."""
+        rows = self._query(
+            "SELECT url FROM invitations WHERE status = 'pending' AND position >= ? AND position < ? ORDER BY position",
+            (first, last)
+        )
+        return [url for (url,) in rows]
+
+    def connection_record(self, entry):
+        """The harvest record for a stored invitation, as the live harvester yields it."""
+        return {"profile_url": entry["profile_url"], "message": entry["message"], "sent_time": entry["sent_time"]}
+
+    def replace_all(self, connections):
+        """Rebuild the index from a full crawl (newest first); invitations no longer listed become 'gone'."""
+        now = datetime.now().isoformat()
+        with self.lock:
+            self.connection.execute("UPDATE invitations SET status = 'gone', position = NULL WHERE status = 'pending'")
+            self._insert(connections, 0, now)
+            self.connection.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('full_crawl_at', ?)", (now,)
+            )
+            self.connection.commit()
+
+    def add_newest(self, connections):
+        """
+        Put invitations found above the known ones at the top, shifting every pending position down.
+        Re-sent invitations that were already pending move up and leave a gap, which is closed.
+        """
+        if not connections:
+            return
+        now = datetime.now().isoformat()
+        with self.lock:
+            self.connection.execute(
+                "UPDATE invitations SET position = position + ? WHERE status = 'pending'", (len(connections),)
+            )
+            self._insert(connections, 0, now)
+            end, count = self.connection.execute(
+                "SELECT MAX(position) + 1, COUNT(*) FROM invitations WHERE status = 'pending'"
+            ).fetchone()
+            if end != count:
+                self._renumber()
+            self.connection.commit()
+
+    def _insert(self, connections, first_position, now):
+        self.connection.executemany('''
+            INSERT INTO invitations (url, profile_url, message, sent_time, position, status, first_seen, last_seen)
+            VALUES (?, ?, ?, ?, ?, 'pending', ?, ?)
+            ON CONFLICT (url) DO UPDATE SET
+                profile_url = excluded.profile_url, message = excluded.message, sent_time = excluded.sent_time,
+                position = excluded.position, status = 'pending', last_seen = excluded.last_seen
+        ''', [
+            (normalize_profile_url(connection["profile_url"]), connection["profile_url"], connection["message"],
+             connection["sent_time"], first_position + offset, now, now)
+            for offset, connection in enumerate(connections)
+        ])
+
+    def touch(self, urls):
+        """Record that these invitations were still listed."""
+        now = datetime.now().isoformat()
+        with self.lock:
+            self.connection.executemany(
+                "UPDATE invitations SET last_seen = ? WHERE url = ?", [(now, normalize_profile_url(url)) for url in urls]
+            )
+            self.connection.commit()
+
+    def mark_gone(self, urls):
+        """Mark invitations as withdrawn or accepted and close the gaps they leave in the positions."""
+        with self.lock:
+            self.connection.executemany(
+                "UPDATE invitations SET status = 'gone', position = NULL WHERE url = ?",
+                [(normalize_profile_url(url),) for url in urls]
+            )
+            self._renumber()
+            self.connection.commit()
+
+    def _renumber(self):
+        """Close the gaps in the pending positions, keeping their order."""
+        rows = self.connection.execute(
+            "SELECT url FROM invitations WHERE status = 'pending' ORDER BY position"
+        ).fetchall()
+        self.connection.executemany(
+            "UPDATE invitations SET position = ? WHERE url = ?", [(position, url) for position, (url,) in enumerate(rows)]
+        )
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
@@ -0,0 +1,561 @@
+import re
+import copy
+import json
+import time
+import random
+import argparse
+import threading
+from html import escape
+from urllib.parse import urlsplit, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import lxml.html
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException
+
+# Local stand-in for the LinkedIn pages the scraper visits, for load testing with
+# no network. Run it, then start the scraper with --base-url http://127.0.0.1:8765.
+# Page markup only reproduces the classes and attributes the scraper selects on.
+
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries", "Wayne Enterprises", "Soylent"]
+TITLES = ["Software Engineer", "Data Analyst", "Product Manager", "Designer", "Engineering Manager", "Consultant"]
+SCHOOLS = ["State University", "Institute of Technology", "City College", "Polytechnic School"]
+DEGREES = ["Bachelor of Science", "Master of Science", "MBA", "Bachelor of Arts"]
+CITIES = ["Berlin, Germany", "London, United Kingdom", "New York, United States", "Lagos, Nigeria", "Toronto, Canada"]
+INTEREST_TABS = ["Top Voices", "Companies", "Groups", "Newsletters", "Schools"]
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+
+def fake_profile(slug):
+    """Deterministic profile content for a slug."""
+    rng = random.Random(slug)
+    year = rng.randint(2005, 2016)
+    positions = []
+    for _ in range(rng.randint(1, 5)):
+        company = rng.choice(COMPANIES)
+        roles = []
+        for _ in range(rng.choice([1, 1, 1, 2, 3])):
+            start = f"{rng.choice(MONTHS)} {year}"
+            year += rng.randint(1, 3)
+            roles.append({"title": rng.choice(TITLES), "start": start, "end": f"{rng.choice(MONTHS)} {year}"})
+        positions.append({"company": company, "roles": roles})
+    positions[-1]["roles"][-1]["end"] = "Present"
+    positions.reverse()
+
+    return {
+        "name": f"{rng.choice(['Ada', 'Grace', 'Alan', 'Linus', 'Tim', 'Margaret'])} {rng.choice(['Lovelace', 'Hopper', 'Turing', 'Torvalds', 'Berners-Lee', 'Hamilton'])}",
+        "headline": f"{rng.choice(TITLES)} at {rng.choice(COMPANIES)}",
+        "location": rng.choice(CITIES),
+        "connections": rng.choice(["87", "312", "500+", "1,204"]),
+        "degree": rng.choice(["2nd", "3rd"]),
+        "pending": rng.random() < 0.3,
+        "about": "Builds things.\nLikes data." if rng.random() < 0.7 else None,
+        "positions": positions,
+        "education": [
+            {"school": rng.choice(SCHOOLS), "degree": rng.choice(DEGREES), "years": f"{2000 + i * 4} - {2004 + i * 4}"}
+            for i in range(rng.randint(0, 3))
+        ],
+        "interests": {
+            tab: [f"{tab[:-1]} {n}" for n in range(rng.choice([0, 3, 8, 45]))]
+            for tab in INTEREST_TABS if rng.random() < 0.8
+        },
+        "email": f"{slug}@example.com" if rng.random() < 0.5 else None,
+        "phone": "+1 555 0100" if rng.random() < 0.2 else None,
+        "birthday": "November 15" if rng.random() < 0.3 else None,
+        "connected_on": None,
+        "similar": [f"person-{rng.randint(0, 99999)}" for _ in range(rng.randint(0, 6))],
+    }
+
+
+def page(title, body, script=""):
+    return f'''<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{escape(title)}</title>
+<style>li {{ min-height: 90px; }} body {{ min-height: 1200px; }}</style></head>
+<body><nav><img class="global-nav__me-photo" alt="me" width="24" height="24"></nav>
+<main>{body}</main>
+<script>{script}</script></body></html>'''
+
+
+class MockLinkedIn:
+    """Content and latency settings shared by all request handlers."""
+
+    def __init__(self, invites=250, page_size=100, batch=10, latency=0.0, jitter=0.0, failure_rate=0.0,
+                 failure_status=429, seed=None):
+        self.invitations = [f"person-{index}" for index in range(invites)]  # Pending sent invitations, newest first
+        self.page_size = page_size  # Invitations per artdeco-pagination page
+        self.batch = batch  # Cards appended per infinite-scroll step
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = {}  # Request counts by page kind
+
+    def count(self, kind):
+        with self.lock:
+            self.requests[kind] = self.requests.get(kind, 0) + 1
+
+    def delay(self):
+        with self.lock:
+            seconds = self.latency + self.rng.uniform(0, self.jitter)
+            fail = self.rng.random() < self.failure_rate
+        if seconds:
+            time.sleep(seconds)
+        return fail
+
+    # Pages
+
+    def sent_invitations(self, base, page_number, static=False):
+        """
+        One pagination page of the sent invitations. The cards are appended by script as
+        the page is scrolled, or all rendered up front when `static` (for MockDriver).
+        """
+        invites = len(self.invitations)
+        pages = max(1, -(-invites // self.page_size))
+        page_number = min(max(page_number, 1), pages)
+        first = (page_number - 1) * self.page_size
+        cards = []
+        for index in range(first, min(first + self.page_size, invites)):
+            slug = self.invitations[index]
+            rng = random.Random(slug)
+            message = "Hi, I'd like to join your network. " * rng.randint(0, 3)
+            cards.append({
+                "url": f"{base}/in/{slug}/",
+                "name": slug.replace("-", " ").title(),
+                "message": message.strip(),
+                "sent": f"Sent {1 + index // 7} weeks ago",
+            })
+
+        card_js = '''
+            function card(c) {
+                const li = document.createElement('li');
+                li.className = 'invitation-card';
+                li.innerHTML = '<a href="' + c.url + '">' + c.name + '</a>' +
+                    (c.message ? '<div class="invitation-card__custom-message"><span class="lt-line-clamp__line">' +
+                        c.message.slice(0, 40) + '</span><a class="lt-line-clamp__more" href="#">see more</a></div>' : '') +
+                    '<span class="time-badge t-12 t-black--light t-normal">' + c.sent + '</span>';
+                const more = li.querySelector('a.lt-line-clamp__more');
+                if (more) more.addEventListener('click', e => {
+                    e.preventDefault();
+                    li.querySelector('span.lt-line-clamp__line').textContent = c.message;
+                    more.remove();
+                });
+                return li;
+            }
+        '''
+        script = card_js + f'''
+            const cards = {json.dumps(cards)};
+            const list = document.querySelector('ul.invitations');
+            let shown = 0, loading = false;
+            function append(n) {{
+                cards.slice(shown, shown + n).forEach(c => list.appendChild(card(c)));
+                shown = Math.min(cards.length, shown + n);
+            }}
+            append({self.batch});
+            window.addEventListener('scroll', () => {{
+                if (loading || shown >= cards.length) return;
+                if (window.innerHeight + window.scrollY < document.body.scrollHeight - 600) return;
+                loading = true;
+                setTimeout(() => {{ append({self.batch}); loading = false; }}, 300);
+            }});
+            document.querySelectorAll('button[data-page]').forEach(button => button.addEventListener('click', () => {{
+                window.location.search = '?page=' + button.dataset.page;
+            }}));
+        '''
+
+        current = ' aria-current="true"'
+        buttons = "".join(
+            f'<li><button aria-label="Page {n}" data-page="{n}"{current if n == page_number else ""}>{n}</button></li>'
+            for n in range(1, pages + 1)
+        )
+        next_disabled = " disabled" if page_number >= pages else ""
+        rendered = ""
+        if static:
+            script = ""
+            rendered = "".join(
+                f'<li class="invitation-card"><a href="{c["url"]}">{escape(c["name"])}</a>'
+                + (f'<div class="invitation-card__custom-message"><span class="lt-line-clamp__line">{escape(c["message"])}</span></div>'
+                   if c["message"] else "")
+                + f'<span class="time-badge t-12 t-black--light t-normal">{c["sent"]}</span></li>'
+                for c in cards
+            )
+        body = f'''
+            <button aria-label="{invites} sent People invitations"><span class="artdeco-pill__text">People ({invites:,})</span></button>
+            <ul class="invitations">{rendered}</ul>
+            <div class="artdeco-pagination">
+                <ul class="artdeco-pagination__pages">{buttons}</ul>
+                <button class="artdeco-pagination__button--next" data-page="{page_number + 1}"{next_disabled}>Next</button>
+            </div>'''
+        return page("Sent invitations", body, script)
+
+    def top_card(self, profile):
+        pending = ('<button><svg data-test-icon="clock-small"></svg>'
+                   '<span class="artdeco-button__text">Pending</span></button>') if profile["pending"] else ""
+        about = ""
+        if profile["about"]:
+            about = f'''<section class="artdeco-card"><h2 class="pvs-header__title"><span aria-hidden="true">About</span></h2>
+                <div class="display-flex ph5 pv3"><span aria-hidden="true">{escape(profile["about"]).replace(chr(10), "<br>")}</span></div></section>'''
+        body = f'''<section class="artdeco-card">
+                <h1>{escape(profile["name"])}</h1>
+                <div class="text-body-medium">{escape(profile["headline"])}</div>
+                <span class="text-body-small inline t-black--light break-words">{escape(profile["location"])}</span>
+                <span class="dist-value">{profile["degree"]}</span>
+                <ul><li><p class="text-body-small"><span>{profile["connections"]} connections</span></p></li></ul>
+                {pending}
+            </section>{about}'''
+        return page(profile["name"], body)
+
+    def experience(self, base, profile):
+        items = []
+        for number, position in enumerate(profile["positions"]):
+            company_link = f"{base}/company/{number}/"
+            if len(position["roles"]) == 1:
+                role = position["roles"][0]
+                items.append(f'''<li class="pvs-list__paged-list-item">
+                    <a class="optional-action-target-wrapper display-flex flex-column full-width" href="{company_link}">
+                        <div class="mr1 hoverable-link-text t-bold"><span aria-hidden="true">{escape(role["title"])}</span></div>
+                        <span class="t-14 t-normal"><span aria-hidden="true">{escape(position["company"])} · Full-time</span></span>
+                        <span class="t-14 t-normal t-black--light"><span class="pvs-entity__caption-wrapper" aria-hidden="true">{role["start"]} - {role["end"]} · 2 yrs</span></span>
+                    </a>
+                    <div class="t-14 t-normal t-black"><span aria-hidden="true">Worked on {escape(role["title"].lower())} things.</span></div>
+                    <div class="t-14 t-normal t-black"><span aria-hidden="true"><strong>Skills:</strong> Python · SQL</span></div>
+                </li>''')
+                continue
+
+            roles = "".join(f'''<li class="pvs-list__paged-list-item">
+                    <a class="optional-action-target-wrapper display-flex flex-column full-width" href="{company_link}#role-{index}">
+                        <div class="mr1 hoverable-link-text t-bold"><span aria-hidden="true">{escape(role["title"])}</span></div>
+                        <span class="t-14 t-normal t-black--light"><span class="pvs-entity__caption-wrapper" aria-hidden="true">{role["start"]} - {role["end"]} · 1 yr</span></span>
+                        <div class="t-14 t-normal t-black"><span aria-hidden="true">Led {escape(role["title"].lower())} work.</span></div>
+                    </a>
+                </li>''' for index, role in enumerate(position["roles"]))
+            items.append(f'''<li class="pvs-list__paged-list-item">
+                    <a class="optional-action-target-wrapper display-flex flex-column full-width" href="{company_link}">
+                        <div class="mr1 hoverable-link-text t-bold"><span aria-hidden="true">{escape(position["company"])}</span></div>
+                        <span class="t-14 t-normal"><span aria-hidden="true">Full-time · 4 yrs</span></span>
+                    </a>
+                    <ul>{roles}</ul>
+                    <span aria-hidden="true">Skills: Leadership · Planning</span>
+                </li>''')
+        return page("Experience", f'<ul>{"".join(items)}</ul>')
+
+    def education(self, profile):
+        items = "".join(f'''<li class="pvs-list__paged-list-item">
+                <a class="optional-action-target-wrapper display-flex flex-column full-width" href="#">
+                    <div class="mr1 hoverable-link-text t-bold"><span aria-hidden="true">{escape(entry["school"])}</span></div>
+                    <span class="t-14 t-normal"><span aria-hidden="true">{escape(entry["degree"])}</span></span>
+                    <span class="t-14 t-normal t-black--light"><span class="pvs-entity__caption-wrapper" aria-hidden="true">{entry["years"]}</span></span>
+                </a></li>''' for entry in profile["education"])
+        return page("Education", f'<ul>{items}</ul>')
+
+    def interests(self, base, profile, active):
+        tabs = list(profile["interests"])
+        active = min(max(active, 0), max(len(tabs) - 1, 0))
+        buttons = "".join(
+            f'<button class="artdeco-tab" data-tab="{index}" aria-selected="{"true" if index == active else "false"}">'
+            f'<span aria-hidden="true">{tab}</span></button>'
+            for index, tab in enumerate(tabs)
+        )
+
+        def item(name, number):
+            return (f'<li class="pvs-list__paged-list-item"><a class="optional-action-target-wrapper" href="{base}/company/i{number}/">'
+                    f'<div class="hoverable-link-text t-bold"><span aria-hidden="true">{escape(name)}</span></div></a></li>')
+
+        panels = []
+        data = {}
+        for index, tab in enumerate(tabs):
+            names = profile["interests"][tab]
+            data[index] = [item(name, number) for number, name in enumerate(names)]
+            more = '<button class="scaffold-finite-scroll__load-button">Show more results</button>' if len(names) > 20 else ""
+            hidden = "" if index == active else " hidden"
+            panels.append(f'<div role="tabpanel" data-tab="{index}"{hidden}><ul>{"".join(data[index][:20])}</ul>{more}</div>')
+
+        script = f'''
+            const items = {json.dumps(data)};
+            document.querySelectorAll('button.artdeco-tab').forEach(button => button.addEventListener('click', () => {{
+                document.querySelectorAll('button.artdeco-tab').forEach(b => b.setAttribute('aria-selected', b === button ? 'true' : 'false'));
+                document.querySelectorAll('[role="tabpanel"]').forEach(p => p.hidden = p.dataset.tab !== button.dataset.tab);
+            }}));
+            document.querySelectorAll('button.scaffold-finite-scroll__load-button').forEach(button => button.addEventListener('click', () => {{
+                const panel = button.closest('[role="tabpanel"]');
+                const list = panel.querySelector('ul');
+                const shown = list.children.length;
+                setTimeout(() => {{
+                    list.insertAdjacentHTML('beforeend', items[panel.dataset.tab].slice(shown, shown + 20).join(''));
+                    if (list.children.length >= items[panel.dataset.tab].length) button.remove();
+                }}, 200);
+            }}));
+        '''
+        body = f'<div class="artdeco-tablist">{buttons}</div>{"".join(panels)}'
+        return page("Interests", body, script)
+
+    def contact_info(self, profile):
+        sections = []
+        if profile["email"]:
+            sections.append(f'<section class="pv-contact-info__contact-type"><h3>Email</h3><a href="mailto:{profile["email"]}">{profile["email"]}</a></section>')
+        for header, value in (("Phone", profile["phone"]), ("Birthday", profile["birthday"]), ("Connected", profile["connected_on"])):
+            if value:
+                sections.append(f'<section class="pv-contact-info__contact-type"><h3>{header}</h3><span class="t-14 t-black t-normal">{value}</span></section>')
+        return page("Contact info", f'<div class="artdeco-modal__content">{"".join(sections)}</div>')
+
+    def browsemap(self, base, profile):
+        items = "".join(f'''<li class="artdeco-list__item">
+                <a class="optional-action-target-wrapper" href="{base}/in/{slug}/?miniProfileUrn=x">
+                    <div class="hoverable-link-text t-bold"><span aria-hidden="true">{escape(fake_profile(slug)["name"])}</span></div></a>
+                <div class="t-14 t-normal display-flex align-items-center"><span aria-hidden="true">{escape(fake_profile(slug)["headline"])}</span></div>
+            </li>''' for slug in profile["similar"])
+        return page("People also viewed", f'<ul>{items}</ul>')
+
+    def route(self, base, path, query, static=False):
+        """Return (status, kind, html) for a request path; `static` pages have everything rendered up front."""
+        path = re.sub(r"/{2,}", "/", path)  # Browsers and servers treat "//details" like "/details"
+        if path in ("", "/"):
+            return 200, "home", page("Feed", "<h1>Feed</h1>")
+        if path == "/login":
+            return 200, "login", page("Login", "<form><input name='session_key'></form>")
+        if path.rstrip("/") == "/mynetwork/invitation-manager/sent":
+            return 200, "invitations", self.sent_invitations(base, int(query.get("page", ["1"])[0]), static)
+
+        match = re.match(r"^/in/([^/]+)(/.*)?$", path)
+        if not match:
+            return 404, "not_found", page("Not found", "<h1>Page not found</h1>")
+
+        profile = fake_profile(match.group(1))
+        rest = (match.group(2) or "/").rstrip("/")
+        if rest == "":
+            return 200, "top_card", self.top_card(profile)
+        if rest == "/details/experience":
+            return 200, "experience", self.experience(base, profile)
+        if rest == "/details/education":
+            return 200, "education", self.education(profile)
+        if rest == "/details/interests":
+            return 200, "interests", self.interests(base, profile, int(query.get("detailScreenTabIndex", ["0"])[0]))
+        if rest == "/overlay/contact-info":
+            return 200, "contact", self.contact_info(profile)
+        if rest == "/overlay/browsemap-recommendations":
+            return 200, "profiles_for_you", self.browsemap(base, profile)
+        return 404, "not_found", page("Not found", "<h1>Page not found</h1>")
+
+
+class MockElement:
+    """The few WebElement calls the scraper makes, over one lxml element of a MockDriver page."""
+
+    def __init__(self, driver, node):
+        self.driver = driver
+        self.node = node
+
+    def __eq__(self, other):
+        return isinstance(other, MockElement) and other.node is self.node
+
+    def __hash__(self):
+        return hash(self.node)
+
+    @property
+    def text(self):
+        # Content of a hidden element is not rendered, so Selenium reports no text for it
+        node = self.node
+        while node is not None:
+            if node.get("hidden") is not None:
+                return ""
+            node = node.getparent()
+        node = copy.deepcopy(self.node)
+        for line_break in node.iter("br"):
+            line_break.tail = "\n" + (line_break.tail or "")
+        lines = node.text_content().split("\n")
+        return "\n".join(" ".join(line.split()) for line in lines).strip()
+
+    def get_attribute(self, name):
+        return self.node.get(name)
+
+    def find_elements(self, by=By.ID, value=None):
+        return [MockElement(self.driver, node) for node in select(self.node, by, value)]
+
+    def find_element(self, by=By.ID, value=None):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"No element for {by}={value}")
+        return elements[0]
+
+    def click(self):
+        # Pagination buttons load their page of sent invitations
+        if self.node.get("data-page") is not None:
+            self.driver.get(f"{self.driver.base}/mynetwork/invitation-manager/sent/?page={self.node.get('data-page')}")
+            return
+        # Only the interest tabs react otherwise: select the tab and show its panel
+        if self.node.get("data-tab") is None:
+            return
+        for button in self.driver.root.cssselect("button.artdeco-tab"):
+            button.set("aria-selected", "true" if button is self.node else "false")
+        for panel in self.driver.root.cssselect('[role="tabpanel"]'):
+            if panel.get("data-tab") == self.node.get("data-tab"):
+                panel.attrib.pop("hidden", None)
+            else:
+                panel.set("hidden", "")
+
+
+def select(node, by, value):
+    if by == By.CSS_SELECTOR:
+        return node.cssselect(value)
+    if by == By.TAG_NAME:
+        return node.cssselect(value)
+    if by == By.CLASS_NAME:
+        return node.cssselect(f".{value}")
+    if by == By.XPATH:
+        return node.xpath(value)
+    raise ValueError(f"Unsupported locator {by}")
+
+
+class MockDriver:
+    """
+    WebDriver stand-in serving MockLinkedIn pages from memory, without a browser or
+    server: pages are parsed with lxml and queried with the scraper's own selectors.
+    Scripts are not run, so it drives the live-DOM code paths (backend="live" with
+    experience_mode="dom") and the snapshot backend, for comparing the two. Pages come
+    fully rendered, and the invitation-list scripts are answered from the DOM.
+    """
+
+    def __init__(self, site=None, base="http://mock.linkedin"):
+        self.site = site or MockLinkedIn()
+        self.base = base
+        self.current_url = None
+        self.root = lxml.html.fromstring("<html><body></body></html>")
+
+    def get(self, url):
+        parts = urlsplit(url)
+        status, kind, html = self.site.route(self.base, parts.path, parse_qs(parts.query), static=True)
+        self.site.count(kind)
+        self.current_url = url
+        self.root = lxml.html.fromstring(html)
+        self.root.make_links_absolute(url)
+
+    def refresh(self):
+        self.get(self.current_url)
+
+    @property
+    def page_source(self):
+        return lxml.html.tostring(self.root, encoding="unicode")
+
+    def find_elements(self, by=By.ID, value=None):
+        return [MockElement(self, node) for node in select(self.root, by, value)]
+
+    def find_element(self, by=By.ID, value=None):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"No element for {by}={value}")
+        return elements[0]
+
+    def execute_script(self, script, *args):
+        if script.strip() == "arguments[0].click();":
+            args[0].click()
+            return None
+        if "li.invitation-card" in script and len(args) == 4:
+            return self.invitation_cards(*args)
+        if ".artdeco-pagination__pages button" in script:
+            return [int(button.text_content()) for button in self.root.cssselect(".artdeco-pagination__pages button")]
+        if "scrollHeight" in script:
+            return 1000  # A static page never grows
+        if "button.artdeco-tab" in script and "click()" in script and args:
+            tabs = self.find_elements(By.CSS_SELECTOR, "div.artdeco-tablist button.artdeco-tab")
+            if args[0] < len(tabs):
+                tabs[args[0]].click()
+        return None
+
+    def invitation_cards(self, offset, link_selector, expand, limit):
+        """What INVITATION_CARDS_SCRIPT returns; static cards carry their whole message, so nothing expands."""
+        cards = self.find_elements(By.CSS_SELECTOR, "li.invitation-card")
+        end = len(cards) if limit is None else min(len(cards), offset + limit)
+
+        def text(card, selector):
+            elements = card.find_elements(By.CSS_SELECTOR, selector)
+            return (elements[0].text if elements else "") or "N/A"
+
+        batch = []
+        for card in cards[offset:end]:
+            links = card.find_elements(By.CSS_SELECTOR, link_selector)
+            batch.append({
+                "url": links[0].get_attribute("href") if links else None,
+                "message": text(card, ".invitation-card__custom-message span.lt-line-clamp__line"),
+                "sent_time": text(card, ".time-badge.t-12.t-black--light.t-normal"),
+            })
+        return {"total": len(cards), "expanded": 0, "cards": batch}
+
+    def execute_async_script(self, script, *args):
+        return {"ready": True}  # Nothing loads after the page itself
+
+    def set_page_load_timeout(self, seconds):
+        self.page_load_timeout = seconds
+
+    def set_script_timeout(self, seconds):
+        self.script_timeout = seconds
+
+    def execute(self, driver_command, params=None):
+        return None  # Every command the scraper sends is served by a method above
+
+    def quit(self):
+        pass
+
+
+def make_handler(site):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            if parts.path == "/__stats":
+                self.respond(200, json.dumps(site.requests), "application/json")
+                return
+
+            base = f"http://{self.headers.get('Host', 'localhost')}"
+            status, kind, html = site.route(base, parts.path, parse_qs(parts.query))
+            site.count(kind)
+            if site.delay():
+                status, html = site.failure_status, page("Error", f"<h1>Error {site.failure_status}</h1>")
+                site.count("failed")
+            self.respond(status, html)
+
+        def respond(self, status, content, content_type="text/html; charset=utf-8"):
+            data = content.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass  # Keep load tests quiet
+
+    return Handler
+
+
+def start_mock_server(host="127.0.0.1", port=8765, **settings):
+    """Start the mock site on a background thread and return (server, site)."""
+    site = MockLinkedIn(**settings)
+    server = ThreadingHTTPServer((host, port), make_handler(site))
+    threading.Thread(target=server.serve_forever, name="mock-linkedin", daemon=True).start()
+    return server, site
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve LinkedIn-like fixture pages for offline scraper load tests.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--invites", type=int, default=250, help="Number of pending sent invitations")
+    parser.add_argument("--page-size", type=int, default=100, help="Invitations per pagination page")
+    parser.add_argument("--batch", type=int, default=10, help="Cards appended per infinite-scroll step")
+    parser.add_argument("--latency", type=float, default=0.0, help="Fixed seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra seconds (0..jitter) per response")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of requests answered with an error")
+    parser.add_argument("--failure-status", type=int, default=429, help="HTTP status used for injected failures")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server, site = start_mock_server(
+        args.host, args.port, invites=args.invites, page_size=args.page_size, batch=args.batch,
+        latency=args.latency, jitter=args.jitter, failure_rate=args.failure_rate,
+        failure_status=args.failure_status, seed=args.seed,
+    )
+    print(f"Mock LinkedIn on http://{args.host}:{args.port} (stats at /__stats). Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
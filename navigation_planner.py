@@ -0,0 +1,113 @@
+from collections import namedtuple
+
+# Output columns produced by each extractor in scrape_profile
+METHOD_COLUMN_MAP = {
+    "scrape_name": {"fullName"},
+    "scrape_summary": {"summary"},
+    "scrape_headline": {"headline"},
+    "scrape_location": {"location"},
+    "scrape_connections": {"numOfConnections"},
+    "scrape_degree": {"Degree"},
+    "scrape_contact_info": {"ContactInfo", "Birthday", "ConnectedOn"},
+    "scrape_experience": {
+        "Position Title", "Position Description", "Company Name",
+        "More Positions", "Descriptions", "Skills"
+    },
+    "scrape_education": {"Education Degree", "SchoolName", "More Educations"},
+    "scrape_total_experience": {"Total Years of Exp(in Yrs)"},
+    "scrape_current_firm_experience": {"Exp in Current Firm(In Yrs.Months)"},
+    "scrape_interests": {
+        "Interest: Groups", "Interest: Newsletters",
+        "Interest: Companies", "Interest: Top Voices",
+        "Interest: Schools"
+    },
+    "scrape_profiles_for_you": {"Profiles for You"},
+    "scrape_connection_status": {"Connection Status"},  # New Column
+}
+
+PageVisit = namedtuple("PageVisit", ["kind", "path", "extractors"])
+
+# Every page a profile can need, in the order scrape_profile visits them.
+# The extractors listed for a page all share its single load.
+PAGE_VISITS = [
+    PageVisit("top_card", "", (
+        "scrape_name", "scrape_summary", "scrape_headline", "scrape_connection_status",
+        "scrape_location", "scrape_connections", "scrape_degree",
+    )),
+    PageVisit("contact", "/overlay/contact-info/", ("scrape_contact_info",)),
+    PageVisit("experience", "/details/experience/", (
+        "scrape_experience", "scrape_total_experience", "scrape_current_firm_experience",
+    )),
+    PageVisit("education", "/details/education/", ("scrape_education",)),
+    PageVisit("interests", "/details/interests/?detailScreenTabIndex=0", ("scrape_interests",)),
+    PageVisit("profiles_for_you", "/overlay/browsemap-recommendations/", ("scrape_profiles_for_you",)),
+]
+
+# Columns read from the profile page itself, by every top-card extractor (wait, probe and snapshot)
+TOP_CARD_COLUMNS = frozenset().union(*(METHOD_COLUMN_MAP[method] for method in PAGE_VISITS[0].extractors))
+
+# Rough seconds per visit with the default "fixed" waits: navigation pause,
+# human_scroll and scroll_to_end. Interests adds one load per detected tab with
+# interests_mode="reload", or one in-page tab switch with "tabs".
+ESTIMATED_SECONDS = {
+    "top_card": 6.0,
+    "contact": 2.5,
+    "experience": 9.0,
+    "education": 9.0,
+    "interests": 7.0,
+    "profiles_for_you": 6.0,
+}
+ESTIMATED_INTEREST_TABS = 3
+ESTIMATED_SECONDS_PER_INTEREST_TAB = 6.0
+ESTIMATED_SECONDS_PER_TAB_SWITCH = 2.0
+
+
+def visit_columns(visit):
+    """All output columns served by one page visit."""
+    return set().union(*(METHOD_COLUMN_MAP[method] for method in visit.extractors))
+
+
+def plan_page_visits(include_columns):
+    """Return the ordered, unique page visits needed to fill `include_columns`."""
+    include_columns = set(include_columns)
+    return [visit for visit in PAGE_VISITS if visit_columns(visit) & include_columns]
+
+
+def estimate_seconds(plan, interests_mode="reload"):
+    """Estimated seconds per profile for a plan."""
+    total = 0.0
+    for visit in plan:
+        total += ESTIMATED_SECONDS[visit.kind]
+        if visit.kind == "interests":
+            per_tab = ESTIMATED_SECONDS_PER_TAB_SWITCH if interests_mode == "tabs" else ESTIMATED_SECONDS_PER_INTEREST_TAB
+            total += ESTIMATED_INTEREST_TABS * per_tab
+    return total
+
+
+def estimate_page_loads(plan, interests_mode="reload"):
+    """Page loads per profile for a plan: "tabs" mode switches interest tabs without reloading."""
+    loads = len(plan)
+    if interests_mode != "tabs" and any(visit.kind == "interests" for visit in plan):
+        loads += ESTIMATED_INTEREST_TABS
+    return loads
+
+
+def describe_plan(include_columns, profile_url="https://www.linkedin.com/in/<profile>", interests_mode="reload"):
+    """Print the page loads and estimated time per profile for a column set and scraper settings (dry run)."""
+    plan = plan_page_visits(include_columns)
+    print(f"Page loads per profile for {len(include_columns)} columns:")
+
+    for number, visit in enumerate(plan, start=1):
+        columns = sorted(visit_columns(visit) & set(include_columns))
+        print(f"  {number}. {visit.kind:<17} {profile_url}{visit.path}  ->  {', '.join(columns)}")
+        if visit.kind == "interests":
+            if interests_mode == "tabs":
+                print(f"     + one in-page switch per interest tab (~{ESTIMATED_INTEREST_TABS} expected), no reloads")
+            else:
+                print(f"     + one load per interest tab (~{ESTIMATED_INTEREST_TABS} expected)")
+
+    if not plan:
+        print("  none: the selected columns come from the invitation list only")
+    print(f"Estimated page loads: {estimate_page_loads(plan, interests_mode)}, "
+          f"estimated time: {estimate_seconds(plan, interests_mode):.0f}s per profile")
+    return plan
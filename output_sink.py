@@ -0,0 +1,143 @@
+import os
+import json
+import queue
+import threading
+from itertools import count
+from datetime import datetime
+from openpyxl import Workbook
+
+
+def hyperlink_formula(url):
+    """Excel formula used for the flagshipProfileUrl column."""
+    return f'=HYPERLINK("{url}", "{url}")'
+
+
+def excel_row(row, ordered_columns):
+    """Build the cell values for one output row, in column order."""
+    row_data = []
+    for col in ordered_columns:
+        if col == "flagshipProfileUrl":
+            row_data.append(hyperlink_formula(row.get("flagshipProfileUrl", "")))
+        else:
+            value = row.get(col, "N/A")
+            if isinstance(value, (list, tuple)):
+                value = "\n".join(str(item) for item in value)  # Empty interest lists from failed scrapes
+            row_data.append(value)
+    return row_data
+
+
+class StreamingExcelSink:
+    """
+    Append-only output writer. Each row is written once to a JSONL journal by a
+    background thread, and the .xlsx workbook is built from the journal in
+    write-only mode once, on close(). Each run gets its own timestamped journal.
+    """
+
+    _STOP = object()
+
+    def __init__(self, output_file, include_columns, journal_path=None, append=False):
+        self.output_file = output_file
+        self.include_columns = include_columns
+        self.rows_written = 0
+        self.previous_output_file = None
+        self.queue = queue.Queue()
+        self.error = None
+
+        if journal_path:
+            # append=True continues an existing journal; otherwise an existing one is never overwritten
+            self.journal_path = journal_path
+            self.journal = open(journal_path, "a" if append else "x", encoding="utf-8")
+        else:
+            self.journal_path, self.journal = self._new_journal()
+        self.thread = threading.Thread(target=self._writer, name="output-sink", daemon=True)
+        self.thread.start()
+
+    def _new_journal(self):
+        """Create `<output>_<timestamp>.jsonl`, adding a counter when a journal of that second exists."""
+        stem = f"{os.path.splitext(self.output_file)[0]}_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}"
+        for number in count(1):
+            path = f"{stem}.jsonl" if number == 1 else f"{stem}_{number}.jsonl"
+            try:
+                return path, open(path, "x", encoding="utf-8")
+            except FileExistsError:
+                continue
+
+    def write(self, row):
+        """Queue a result dict for the writer thread."""
+        self.queue.put(row)
+
+    def close(self, export=True):
+        """Drain the queue, close the journal and build the final workbook."""
+        self.queue.put(self._STOP)
+        self.thread.join()
+        self.journal.close()
+        if export:
+            return self.export_excel()
+        return None
+
+    def _writer(self):
+        while True:
+            row = self.queue.get()
+            if row is self._STOP:
+                break
+
+            try:
+                self.journal.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+                self.rows_written += 1
+
+                # Sync once the queue is drained instead of after every row
+                if self.queue.empty():
+                    self.journal.flush()
+                    os.fsync(self.journal.fileno())
+            except Exception as e:
+                self.error = e
+                print(f"Error writing output row: {e}")
+
+        self.journal.flush()
+        os.fsync(self.journal.fileno())
+
+    def iter_journal(self):
+        """Yield the rows stored in the journal, one at a time."""
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, "r", encoding="utf-8") as journal:
+            for line in journal:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+    def export_excel(self):
+        """Build a timestamped .xlsx from the journal without loading every row into memory."""
+        timestamp = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
+        output_file = f"{os.path.splitext(self.output_file)[0]}_{timestamp}.xlsx"
+
+        try:
+            rows = self.iter_journal()
+            first_row = next(rows, None)
+            if first_row is None:
+                print("No rows to export.")
+                return None
+
+            workbook = Workbook(write_only=True)
+            sheet = workbook.create_sheet("LinkedIn Data")
+
+            # Same header rule as save_to_excel: INCLUDE_COLUMNS order, restricted to scraped keys
+            ordered_columns = [col for col in self.include_columns if col in first_row.keys()]
+            sheet.append(ordered_columns)
+            sheet.append(excel_row(first_row, ordered_columns))
+            for row in rows:
+                sheet.append(excel_row(row, ordered_columns))
+
+            workbook.save(output_file)
+            print(f"Data saved to {output_file}")
+
+            # Keep only the latest export next to the journal
+            if self.previous_output_file and self.previous_output_file != output_file and os.path.exists(self.previous_output_file):
+                os.remove(self.previous_output_file)
+                print(f"Old file {self.previous_output_file} deleted.")
+            self.previous_output_file = output_file
+            return output_file
+
+        except Exception as e:
+            print(f"Error saving to {output_file}: {e}")
+            return None
@@ -0,0 +1,180 @@
+import os
+import gzip
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+from checkpoint import normalize_profile_url
+
+
+class PageCache:
+    """
+    On-disk cache of page snapshots keyed by (normalized profile URL, page kind).
+    HTML is stored gzip-compressed under its sha256, so identical pages share one
+    file; a SQLite index maps keys to content hashes and fetch times. Entries older
+    than `ttl` seconds count as misses and are evicted, as are the oldest entries
+    once the stored files exceed `max_bytes`: at open and close, and whenever a put
+    takes the stored total past it (then down to `low_water` of the limit, so a full
+    cache is not swept on every put).
+    """
+
+    def __init__(self, directory="page_cache", ttl=7 * 24 * 3600, max_bytes=None, low_water=0.9):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.low_water = low_water
+        self.hits = 0
+        self.misses = 0
+        self.stored_bytes = 0  # Size of the stored files, recounted by evict() and grown by put()
+        self.writing = set()  # Digests put() is writing, which evict() must not delete
+        self.lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(os.path.join(directory, "index.db"), check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript('''
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                sha256 TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (url, kind)
+            );
+            CREATE TABLE IF NOT EXISTS connections (
+                url TEXT PRIMARY KEY,
+                position INTEGER NOT NULL,
+                connection TEXT NOT NULL
+            );
+        ''')
+        self.connection.commit()
+        self.evict()
+
+    def _blob_path(self, digest):
+        return os.path.join(self.directory, digest[:2], f"{digest}.html.gz")
+
+    def _expired(self, fetched_at):
+        return bool(self.ttl) and time.time() - fetched_at > self.ttl
+
+    def get(self, url, kind):
+        """Return the cached HTML of a page, or None when it is missing or older than the TTL."""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT sha256, fetched_at FROM pages WHERE url = ? AND kind = ?", (normalize_profile_url(url), kind)
+            ).fetchone()
+
+        html = None
+        if row and not self._expired(row[1]):
+            try:
+                with gzip.open(self._blob_path(row[0]), "rt", encoding="utf-8") as file:
+                    html = file.read()
+            except OSError:
+                html = None
+
+        with self.lock:
+            if html is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return html
+
+    def put(self, url, kind, html):
+        """Store the HTML of a page, replacing any older snapshot of it."""
+        digest = hashlib.sha256(html.encode("utf-8")).hexdigest()
+        path = self._blob_path(digest)
+        with self.lock:
+            self.writing.add(digest)
+        try:
+            added = 0
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                temp_path = f"{path}.{threading.get_ident()}.tmp"
+                with gzip.open(temp_path, "wt", encoding="utf-8") as file:
+                    file.write(html)
+                os.replace(temp_path, path)  # Readers never see a partial file
+                added = os.path.getsize(path)
+
+            with self.lock:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO pages (url, kind, sha256, size, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                    (normalize_profile_url(url), kind, digest, os.path.getsize(path), time.time())
+                )
+                self.connection.commit()
+                self.stored_bytes += added
+                over_limit = bool(self.max_bytes) and self.stored_bytes > self.max_bytes
+        finally:
+            with self.lock:
+                self.writing.discard(digest)
+
+        if over_limit:
+            self.evict(self.max_bytes * self.low_water)
+
+    def put_connection(self, url, connection):
+        """Remember the harvested invitation of a cached profile, so cache-only runs can rebuild its row."""
+        with self.lock:
+            self.connection.execute('''
+                INSERT INTO connections (url, position, connection)
+                VALUES (?, (SELECT COUNT(*) FROM connections), ?)
+                ON CONFLICT (url) DO UPDATE SET connection = excluded.connection
+            ''', (normalize_profile_url(url), json.dumps(connection, default=str)))
+            self.connection.commit()
+
+    def connections(self):
+        """Harvested invitations of every cached profile, in the order they were first scraped."""
+        with self.lock:
+            rows = self.connection.execute("SELECT connection FROM connections ORDER BY position").fetchall()
+        return [json.loads(connection) for (connection,) in rows]
+
+    def evict(self, max_bytes=None):
+        """Drop entries past the TTL, then the oldest entries until the files fit in `max_bytes` (default: the limit)."""
+        max_bytes = max_bytes or self.max_bytes
+        with self.lock:
+            if self.ttl:
+                self.connection.execute("DELETE FROM pages WHERE fetched_at < ?", (time.time() - self.ttl,))
+
+            if max_bytes:
+                kept = set()
+                total = 0
+                for url, kind, digest, size in self.connection.execute(
+                    "SELECT url, kind, sha256, size FROM pages ORDER BY fetched_at DESC"
+                ).fetchall():
+                    if digest not in kept:
+                        if total + size > max_bytes:
+                            self.connection.execute("DELETE FROM pages WHERE url = ? AND kind = ?", (url, kind))
+                            continue
+                        kept.add(digest)
+                        total += size
+
+            self.connection.commit()
+            referenced = {digest for (digest,) in self.connection.execute("SELECT DISTINCT sha256 FROM pages")}
+            referenced |= self.writing
+            self.stored_bytes = self.connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM (SELECT MAX(size) AS size FROM pages GROUP BY sha256)"
+            ).fetchone()[0]
+
+            # Remove files no entry points at any more; under the lock so a put cannot reuse one meanwhile
+            for folder in os.listdir(self.directory):
+                folder_path = os.path.join(self.directory, folder)
+                if not os.path.isdir(folder_path):
+                    continue
+                for name in os.listdir(folder_path):
+                    if name.endswith(".html.gz") and name[:-len(".html.gz")] not in referenced:
+                        try:
+                            os.remove(os.path.join(folder_path, name))
+                        except OSError:
+                            pass
+
+    def stats(self):
+        with self.lock:
+            pages, total = self.connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM (SELECT sha256, MAX(size) AS size, COUNT(*) FROM pages GROUP BY sha256)"
+            ).fetchone()
+            entries = self.connection.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "entries": entries, "files": pages, "bytes": total}
+
+    def close(self):
+        self.evict()
+        with self.lock:
+            self.connection.close()
@@ -0,0 +1,168 @@
+import os
+import json
+import time
+import random
+import argparse
+import threading
+import contextlib
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # No cross-process locking (Windows): share the state file from one process only
+
+
+class RateGovernor:
+    """
+    Token buckets capping page loads per minute and per hour for one account.
+    A bucket holds up to its per-window limit and refills continuously, so the
+    scraper runs at full speed while budget is left and slows to the refill rate
+    once it is spent. Each granted load is followed by a random jitter. back_off()
+    holds every load for an exponentially growing time after consecutive blocks. With a
+    `state_file`, the buckets live in a locked JSON file so several processes
+    (or machines sharing a disk) draw from the same budget.
+    """
+
+    def __init__(self, per_minute=None, per_hour=None, jitter=(0.2, 1.0), state_file=None, account="default"):
+        self.limits = {}
+        if per_minute:
+            self.limits["minute"] = (per_minute, per_minute / 60)  # (capacity, tokens per second)
+        if per_hour:
+            self.limits["hour"] = (per_hour, per_hour / 3600)
+        self.jitter = jitter
+        self.state_file = state_file
+        self.account = account
+        self.lock = threading.Lock()
+        self.buckets = {}  # Used when there is no state file
+        self.granted = 0
+        self.waited = 0.0
+        self.backoffs = 0
+
+    @contextlib.contextmanager
+    def _state(self):
+        """The account's buckets, read and written back under the thread lock and, with a state file, an flock."""
+        with self.lock:
+            if not self.state_file:
+                yield self.buckets
+                return
+
+            with open(f"{self.state_file}.lock", "a") as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    state = {}
+                    if os.path.exists(self.state_file):
+                        try:
+                            with open(self.state_file, "r", encoding="utf-8") as file:
+                                state = json.load(file)
+                        except ValueError:
+                            state = {}  # Damaged file: start with full buckets
+                    buckets = state.setdefault(self.account, {})
+                    yield buckets
+
+                    temp_path = f"{self.state_file}.{os.getpid()}.tmp"
+                    with open(temp_path, "w", encoding="utf-8") as file:
+                        json.dump(state, file, indent=2)
+                    os.replace(temp_path, self.state_file)
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _refill(self, buckets):
+        """Top up every bucket for the time since its last update; returns the seconds until all hold a token."""
+        now = time.time()
+        wait = 0.0
+        for name, (capacity, rate) in self.limits.items():
+            bucket = buckets.setdefault(name, {"tokens": capacity, "updated": now})
+            bucket["tokens"] = min(capacity, bucket["tokens"] + (now - bucket["updated"]) * rate)
+            bucket["updated"] = now
+            if bucket["tokens"] < 1:
+                wait = max(wait, (1 - bucket["tokens"]) / rate)
+        return wait
+
+    def _take(self, buckets):
+        """Take a token from every bucket if all have one; else return the seconds until they do."""
+        wait = self._refill(buckets)
+        if wait == 0:
+            for name in self.limits:
+                buckets[name]["tokens"] -= 1
+        return wait
+
+    def acquire(self, sleep=time.sleep):
+        """Block until a page load is within budget, then add jitter. Returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._state() as buckets:
+                wait = max(0.0, buckets.get("blocked_until", 0) - time.time()) or self._take(buckets)
+            if wait == 0:
+                break
+            # Re-check at least every few seconds: another process may be drawing from the same budget
+            pause = min(wait, 5.0)
+            sleep(pause)
+            waited += pause
+
+        if self.jitter:
+            pause = random.uniform(*self.jitter)
+            sleep(pause)
+            waited += pause
+
+        with self.lock:
+            self.granted += 1
+            self.waited += waited
+        return waited
+
+    def back_off(self, reason, base=60, cap=1800):
+        """
+        Hold every load for this account: `base` seconds after the first block, doubling up to `cap`.
+        Blocks seen while a backoff is running are the same block (other workers' pages
+        loaded before it), so they add no strike. Returns the seconds until loads resume.
+        """
+        with self._state() as buckets:
+            now = time.time()
+            strikes = buckets.get("strikes", 0)
+            if buckets.get("blocked_until", 0) > now:
+                delay = buckets["blocked_until"] - now
+                new_block = False
+            else:
+                strikes += 1
+                delay = min(cap, base * 2 ** (strikes - 1)) * random.uniform(1, 1.25)
+                buckets["strikes"] = strikes
+                buckets["blocked_until"] = now + delay
+                new_block = True
+        if not new_block:
+            print(f"Already backing off after a {reason} page; {delay:.0f}s left.")
+            return delay
+        with self.lock:
+            self.backoffs += 1
+        print(f"Backing off {delay:.0f}s after a {reason} page (block {strikes} in a row).")
+        return delay
+
+    def clear_backoff(self):
+        """A page loaded normally: the next block starts again from the base delay."""
+        with self._state() as buckets:
+            buckets.pop("strikes", None)
+
+    def state(self):
+        """Tokens left in each bucket right now, and any active backoff."""
+        with self._state() as buckets:
+            self._refill(buckets)
+            state = {name: round(buckets[name]["tokens"], 2) for name in self.limits}
+            if buckets.get("blocked_until", 0) > time.time():
+                state["blocked_for"] = round(buckets["blocked_until"] - time.time())
+            return state
+
+    def report(self):
+        return (f"Rate governor: {self.granted} page loads granted, {self.waited:.0f}s spent waiting for budget, "
+                f"{self.backoffs} backoff(s).")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Show the page-load budget left in a shared rate state file.")
+    parser.add_argument("state_file")
+    parser.add_argument("--account", default="default")
+    parser.add_argument("--per-minute", type=int)
+    parser.add_argument("--per-hour", type=int)
+    args = parser.parse_args()
+
+    governor = RateGovernor(args.per_minute, args.per_hour, state_file=args.state_file, account=args.account)
+    print(json.dumps(governor.state(), indent=2))
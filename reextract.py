@@ -0,0 +1,160 @@
+import os
+import sys
+import time
+import argparse
+from itertools import groupby
+from concurrent.futures import ProcessPoolExecutor
+
+from checkpoint import CheckpointStore, normalize_profile_url
+from html_archive import HtmlArchive, read_record
+from navigation_planner import METHOD_COLUMN_MAP
+from scraper import LinkedInProfileScraper
+
+# Re-runs the profile extractors over archived pages on every core, without a
+# browser. Each worker rebuilds rows through the normal scrape_profile cache path,
+# so the output matches a live run with the same INCLUDE_COLUMNS.
+
+PROFILE_KINDS = ("top_card", "contact", "experience", "education", "interest_tabs", "profiles_for_you")
+
+worker_scraper = None
+worker_archive = None
+
+
+class ArchivedProfile:
+    """Page source for one profile's archived pages, read on demand like PageCache.get."""
+
+    def __init__(self, locations):
+        self.locations = locations
+
+    def get(self, url, kind):
+        location = self.locations.get(kind)
+        if location is None:
+            return None
+        return read_record(worker_archive, *location)
+
+
+def init_worker(archive_directory, output_file, include_columns):
+    global worker_scraper, worker_archive
+    worker_archive = archive_directory
+    worker_scraper = LinkedInProfileScraper(output_file, include_columns, launch_browser=False, checkpoint_file=None,
+                                           selector_stats_file=None)
+    worker_scraper.cache_only = True  # Pages missing from the archive come out as N/A
+
+
+def extract_profile(task):
+    """Build the output row of one archived profile; returns (row, pages read, pages missing by kind)."""
+    url, locations, connection = task
+    worker_scraper.page_cache = ArchivedProfile(locations)
+    worker_scraper.cache_misses = {}  # Counted per task and summed by the parent process
+    try:
+        row = worker_scraper.scrape_profile(url)
+    except Exception as e:
+        print(f"Error re-extracting {url}: {e}")
+        return None, len(locations), worker_scraper.cache_misses
+
+    row["profile_url"] = url
+    row["message"] = connection.get("message", "N/A")
+    row["sent time"] = connection.get("sent_time", "N/A")
+    return row, len(locations), worker_scraper.cache_misses
+
+
+def build_tasks(archive, connections):
+    """One (url, {kind: (segment, offset, length)}, connection) task per archived profile."""
+    tasks = []
+    entries = [
+        entry for entry in archive.entries()
+        if entry["kind"] in PROFILE_KINDS or entry["kind"].startswith("interests:")
+    ]
+    for url, group in groupby(entries, key=lambda entry: entry["url"]):
+        locations = {entry["kind"]: (entry["segment"], entry["offset"], entry["length"]) for entry in group}
+        tasks.append((url, locations, connections.get(url, {})))
+    return tasks
+
+
+def reextract(archive_directory, output_file, include_columns, workers=None, checkpoint_file=None):
+    """Re-extract every archived profile into the output sink; returns the number of rows written."""
+    archive = HtmlArchive(archive_directory)
+    connections = {}
+    if checkpoint_file and os.path.exists(checkpoint_file):
+        # Message and sent time come from the harvest of the run that archived the pages
+        checkpoint = CheckpointStore(checkpoint_file)
+        connections = {
+            normalize_profile_url(connection["profile_url"]): connection
+            for connection in checkpoint.harvested_connections() if connection.get("profile_url")
+        }
+        checkpoint.close()
+
+    tasks = build_tasks(archive, connections)
+    archive.close()
+    print(f"Re-extracting {len(tasks)} archived profiles with {workers or os.cpu_count()} processes.")
+
+    owner = LinkedInProfileScraper(output_file, include_columns, launch_browser=False, checkpoint_file=None,
+                                   selector_stats_file=None)
+    sink = owner.open_output_sink()
+    missing = {column: 0 for column in include_columns}
+    dropped = []  # Profiles whose extraction raised, so they have no row at all
+    rows = pages = 0
+    started = time.monotonic()
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                 initargs=(archive_directory, output_file, include_columns)) as executor:
+            for task, (row, page_count, cache_misses) in zip(tasks, executor.map(extract_profile, tasks, chunksize=8)):
+                pages += page_count
+                owner.add_cache_misses(cache_misses)
+                if row is None:
+                    dropped.append(task[0])
+                    continue
+                sink.write(row)
+                rows += 1
+                for column in include_columns:
+                    if row.get(column, "N/A") in ("N/A", "", None):
+                        missing[column] += 1
+
+                if rows % 500 == 0:
+                    elapsed = time.monotonic() - started
+                    print(f"{rows} profiles, {pages / elapsed:.0f} pages/sec")
+    finally:
+        sink.close()
+
+    elapsed = time.monotonic() - started
+    print(f"Re-extracted {rows} profiles ({pages} pages) in {elapsed:.1f}s: "
+          f"{pages / elapsed if elapsed else 0:.0f} pages/sec.")
+
+    # Dropped profiles never reach the N/A rates below
+    if dropped:
+        print(f"  Dropped {len(dropped)} of {len(tasks)} profiles ({len(dropped) / len(tasks):.0%}) on extraction errors:")
+        for url in dropped[:20]:
+            print(f"    {url}")
+        if len(dropped) > 20:
+            print(f"    ... and {len(dropped) - 20} more")
+
+    if owner.cache_misses:
+        print("  Pages missing from the archive (their columns are N/A): " +
+              ", ".join(f"{kind} {count}" for kind, count in sorted(owner.cache_misses.items())))
+
+    # A column that suddenly goes N/A everywhere usually means a selector broke
+    if rows:
+        for column, count in missing.items():
+            if count:
+                print(f"  {column}: N/A in {count / rows:.0%} of rows")
+    return rows
+
+
+if __name__ == "__main__":
+    all_columns = sorted(set().union(*METHOD_COLUMN_MAP.values()))
+    parser = argparse.ArgumentParser(description="Re-run the profile extractors over archived pages on every core.")
+    parser.add_argument("--archive", default="html_archive", help="Archive directory written with html_archive_dir")
+    parser.add_argument("--output", default="linkedin_reextracted.xlsx", help="Output workbook")
+    parser.add_argument("--columns", help="Comma-separated output columns (default: every profile column)")
+    parser.add_argument("--workers", type=int, help="Processes to use (default: one per core)")
+    parser.add_argument("--checkpoint", default="checkpoint.db", help="Checkpoint whose harvest supplies message and sent time")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.archive):
+        print(f"No archive at {args.archive}.")
+        sys.exit(1)
+
+    columns = [column.strip() for column in args.columns.split(",")] if args.columns else all_columns
+    reextract(args.archive, args.output, columns + ["message", "sent time"], workers=args.workers,
+              checkpoint_file=args.checkpoint)
@@ -1,14 +1,20 @@
 import os
+import copy
+import hashlib
+import argparse
 import re
 import time
 import random
 import pickle
+from itertools import count, groupby
+from urllib.parse import urlsplit
 import pandas as pd
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
@@ -16,33 +22,503 @@ from openpyxl import Workbook
 from openpyxl.styles import Font
 from openpyxl.worksheet.hyperlink import Hyperlink
 import undetected_chromedriver as uc
-import chromedriver_autoinstaller
+import snapshot_parser
+from output_sink import StreamingExcelSink, excel_row
+from checkpoint import CheckpointStore, normalize_profile_url
+from invitation_index import InvitationIndex
+from page_cache import PageCache
+from html_archive import HtmlArchive
+from browser_setup import DriverCache
+from driver_lifecycle import DriverLifecycle
+from rate_governor import RateGovernor
+from selector_registry import SelectorRegistry
+from worker_pool import ScraperPipeline, ScraperPool
+from navigation_planner import METHOD_COLUMN_MAP, TOP_CARD_COLUMNS, describe_plan, plan_page_visits
+from instrumentation import MetricsRecorder, ProfileMetrics, instrument_driver
+
+# Pulls every experience entry in a single execute_script call. The selectors and
+# skip rules mirror the element-by-element walk in scrape_experience, and the raw
+# roles it returns are turned into the usual outputs by build_experience_results.
+# arguments[0] is the fallback chain for the list items; the first selector that
+# matches anything is used. legacyCalls estimates how many WebDriver commands the
+# element walk would have sent.
+EXPERIENCE_EXTRACTION_SCRIPT = '''
+    const itemSelector = arguments[0].find(selector => document.querySelector(selector));
+    const text = el => (el ? (el.innerText || '').trim() : '');
+    const processed = new Set();
+    const roles = [];
+    let legacyCalls = 1;
+
+    const describe = scope => {
+        const spans = scope.querySelectorAll('.t-14.t-normal.t-black span[aria-hidden="true"]');
+        const parts = [];
+        legacyCalls += 1 + spans.length;
+        spans.forEach(span => {
+            const value = text(span);
+            if (!value) return;
+            legacyCalls += 3;
+            if (span.querySelector('strong') || span.querySelector('svg')) return;
+            parts.push(value);
+        });
+        return parts.length ? parts.join(' ') : 'N/A';
+    };
+
+    const skillsOf = item => {
+        legacyCalls += 1;
+        for (const span of item.querySelectorAll('span[aria-hidden="true"]')) {
+            const value = span.innerText || '';
+            legacyCalls += 1;
+            if (value.includes('Skills:')) {
+                legacyCalls += 1;
+                return value.split('Skills:').join('').trim();
+            }
+        }
+        return 'N/A';
+    };
+
+    (itemSelector ? document.querySelectorAll(itemSelector) : []).forEach((item, index) => {
+        const bold = item.querySelectorAll('.t-bold span[aria-hidden="true"]');
+        legacyCalls += 1;
+        if (bold.length > 1) {
+            // Company with multiple roles: the first anchor is the company itself
+            const company = text(bold[0]);
+            const anchors = Array.from(item.querySelectorAll('a.optional-action-target-wrapper.display-flex.flex-column.full-width'));
+            legacyCalls += 2;
+            anchors.slice(1).forEach(anchor => {
+                if (processed.has(anchor)) return;
+                processed.add(anchor);
+                const title = anchor.querySelector('.mr1.hoverable-link-text.t-bold span[aria-hidden="true"]');
+                const caption = anchor.querySelector('.pvs-entity__caption-wrapper[aria-hidden="true"]');
+                legacyCalls += 4;
+                roles.push({
+                    group: index,
+                    grouped: true,
+                    title: title ? text(title) : 'N/A',
+                    company: company,
+                    caption: caption ? text(caption) : null,
+                    description: describe(anchor),
+                    skills: skillsOf(item)
+                });
+            });
+            return;
+        }
+
+        const mr1 = item.querySelector('.mr1');
+        const titleElement = mr1 ? mr1.querySelector('span[aria-hidden="true"]') : null;
+        legacyCalls += 3;
+        if (!titleElement) return;
+        const title = text(titleElement);
+        if (title === 'N/A') return;
+
+        const companyElement = item.querySelector('.t-14.t-normal span[aria-hidden="true"]');
+        const company = companyElement ? text(companyElement).split('·')[0].trim() : 'N/A';
+        const anchor = item.querySelector('a.optional-action-target-wrapper');
+        legacyCalls += 3;
+        if (!anchor || processed.has(anchor)) return;
+        processed.add(anchor);
+
+        const caption = item.querySelector('.pvs-entity__caption-wrapper');
+        legacyCalls += 2;
+        if (!caption) return;
+        roles.push({
+            group: index,
+            grouped: false,
+            title: title,
+            company: company,
+            caption: text(caption),
+            description: describe(item),
+            skills: skillsOf(item)
+        });
+    });
+    return { roles: roles, legacyCalls: legacyCalls };
+'''
+
+# Reports every optional top-card field in one call: the text of each element, or
+# null when it is absent, using the fallback chains (arguments[0], field -> selectors)
+# of the per-field waits in scrape_profile.
+TOP_CARD_PROBE_SCRIPT = '''
+    const chains = arguments[0];
+    const text = el => (el ? (el.innerText || '').trim() : null);
+    const pick = (scope, field) => {
+        for (const selector of chains[field]) {
+            const element = scope.querySelector(selector);
+            if (element) return element;
+        }
+        return null;
+    };
+    const probe = {
+        fullName: text(pick(document, 'fullName')),
+        headline: text(pick(document, 'headline')),
+        location: text(pick(document, 'location')),
+        connections: text(pick(document, 'connections')),
+        degree: text(pick(document, 'degree')),
+        pending: null,
+        summary: null
+    };
+
+    const clock = pick(document, 'connection_status');
+    const pendingButton = clock ? clock.closest('button') : null;
+    if (pendingButton) probe.pending = text(pendingButton.querySelector('span.artdeco-button__text'));
+
+    for (const section of document.querySelectorAll('section.artdeco-card')) {
+        const heading = section.querySelector('h2.pvs-header__title span[aria-hidden="true"]');
+        if (!heading || text(heading) !== 'About') continue;
+        const summary = pick(section, 'summary');
+        if (!summary) continue;
+        probe.summary = text(summary);
+        break;
+    }
+    return probe;
+'''
+
+# Interest tabs are switched in-page; the visible tab panel (or the whole document
+# when the page has no panels) is the scope for the scripts below. arguments[0] is
+# the list-item fallback chain; itemsIn returns the items of its first matching selector.
+INTEREST_PANEL_JS = '''
+    const itemSelectors = arguments[0];
+    const itemsIn = root => {
+        for (const selector of itemSelectors) {
+            const items = root.querySelectorAll(selector);
+            if (items.length) return items;
+        }
+        return [];
+    };
+    const panels = Array.from(document.querySelectorAll('[role="tabpanel"]'));
+    const scope = panels.find(panel => panel.offsetParent !== null && itemsIn(panel).length) || document;
+'''
+
+# Clicks the load-more button of the visible panel if there is one, scrolls to the
+# bottom and returns how many items were loaded before doing so.
+INTEREST_LOAD_MORE_SCRIPT = INTEREST_PANEL_JS + '''
+    const count = itemsIn(scope).length;
+    const more = scope.querySelector('button.scaffold-finite-scroll__load-button');
+    if (more && !more.disabled) more.click();
+    window.scrollTo(0, document.body.scrollHeight);
+    return count;
+'''
+
+# True once the tab at index arguments[0] is selected and its panel is shown
+INTEREST_TAB_SHOWN_SCRIPT = '''
+    const tab = document.querySelectorAll('div.artdeco-tablist button.artdeco-tab')[arguments[0]];
+    if (!tab || tab.getAttribute('aria-selected') !== 'true') return false;
+    const panels = Array.from(document.querySelectorAll('[role="tabpanel"]'));
+    const controls = tab.getAttribute('aria-controls');
+    const panel = panels.find(p => (controls && p.id === controls) || (tab.dataset.tab !== undefined && p.dataset.tab === tab.dataset.tab))
+        || panels.find(p => p.offsetParent !== null);
+    return !!panel && panel.offsetParent !== null;
+'''
+
+# Returns [name, url] for every item of the visible panel, with the rules of scrape_interests
+INTEREST_ITEMS_SCRIPT = INTEREST_PANEL_JS + '''
+    const text = el => (el ? (el.innerText || '').trim() : '');
+    const items = [];
+    itemsIn(scope).forEach(item => {
+        const name = text(item.querySelector('div.hoverable-link-text.t-bold span[aria-hidden="true"]'))
+            || text(item.querySelector('span.visually-hidden'));
+        if (!name) return;
+        const anchors = item.querySelectorAll('a.optional-action-target-wrapper');
+        let url = 'N/A';
+        if (anchors.length > 1) url = anchors[1].href;
+        else if (anchors.length) url = anchors[0].href;
+        items.push([name, url]);
+    });
+    return items;
+'''
+
+# Reads the invitation cards from DOM index `offset` on (at most `limit` of them),
+# optionally clicking every "see more" clamp first, and returns each card's
+# profile URL, message and sent time in one round trip.
+INVITATION_CARDS_SCRIPT = '''
+    const offset = arguments[0], linkSelector = arguments[1], expand = arguments[2], limit = arguments[3];
+    const cards = document.querySelectorAll('li.invitation-card');
+    const end = limit === null ? cards.length : Math.min(cards.length, offset + limit);
+    const fresh = Array.prototype.slice.call(cards, offset, end);
+
+    let expanded = 0;
+    if (expand) {
+        fresh.forEach(card => card.querySelectorAll('a.lt-line-clamp__more').forEach(more => {
+            more.click();
+            expanded++;
+        }));
+    }
+
+    const text = (card, selector) => {
+        const element = card.querySelector(selector);
+        const value = element ? (element.innerText || element.textContent || '').trim() : '';
+        return value || 'N/A';
+    };
+    return {
+        total: cards.length,
+        expanded: expanded,
+        cards: fresh.map(card => {
+            const link = card.querySelector(linkSelector);
+            return {
+                url: link ? link.href : null,
+                message: text(card, '.invitation-card__custom-message span.lt-line-clamp__line'),
+                sent_time: text(card, '.time-badge.t-12.t-black--light.t-normal')
+            };
+        })
+    };
+'''
+
+# Page numbers shown in the sent-invitations pagination (the last page is always listed)
+PAGINATION_PAGES_SCRIPT = '''
+    return Array.prototype.map.call(
+        document.querySelectorAll('.artdeco-pagination__pages button'),
+        button => parseInt((button.innerText || button.textContent || '').trim(), 10)
+    ).filter(number => !isNaN(number));
+'''
+
+# Resolves once the document has loaded, `selector` (if any) is present and the DOM
+# has seen no mutations for `quietMs`; gives up after `timeoutMs`.
+READINESS_SCRIPT = '''
+    const selector = arguments[0], quietMs = arguments[1], timeoutMs = arguments[2];
+    const done = arguments[arguments.length - 1];
+    const start = performance.now();
+    let lastChange = start;
+    // Only added or removed nodes count: attribute churn (animations, hover state) never settles.
+    // Once `selector` matches, only its list container is watched.
+    const observer = new MutationObserver(() => { lastChange = performance.now(); });
+    observer.observe(document.body || document.documentElement, { childList: true, subtree: true });
+    let watchingList = false;
+
+    (function check() {
+        const now = performance.now();
+        const match = selector ? document.querySelector(selector) : null;
+        const present = !selector || match !== null;
+        if (match && match.parentElement && !watchingList) {
+            observer.disconnect();
+            observer.observe(match.parentElement, { childList: true, subtree: true });
+            watchingList = true;
+        }
+        const loaded = document.readyState !== 'loading';
+        if ((present && loaded && now - lastChange >= quietMs) || now - start >= timeoutMs) {
+            observer.disconnect();
+            done({ ready: present && loaded && now - lastChange >= quietMs, present: present, elapsed: now - start });
+            return;
+        }
+        setTimeout(check, 50);
+    })();
+'''
+
+# Transfer size and load time of the current page from the Navigation and Resource
+# Timing APIs. Cross-origin resources without Timing-Allow-Origin report 0 bytes and
+# are counted as opaque.
+PAGE_WEIGHT_SCRIPT = '''
+    const navigation = performance.getEntriesByType('navigation')[0];
+    const resources = performance.getEntriesByType('resource');
+    let bytes = navigation ? navigation.transferSize : 0;
+    let opaque = 0;
+    for (const entry of resources) {
+        bytes += entry.transferSize;
+        if (!entry.transferSize && !entry.decodedBodySize) opaque += 1;
+    }
+    return {
+        bytes: bytes,
+        resources: resources.length,
+        opaque: opaque,
+        load_ms: navigation && navigation.loadEventEnd ? navigation.loadEventEnd - navigation.startTime : performance.now(),
+        dom_ms: navigation ? navigation.domContentLoadedEventEnd - navigation.startTime : null
+    };
+'''
+
+# URL patterns the "lean" browser profile blocks through CDP: images, media, fonts
+# and analytics/ad hosts. None of them feed the extractors (icons are inline SVG).
+BLOCKED_URL_PATTERNS = [
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.ico",
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*media.licdn.com*", "*dms.licdn.com*",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*px.ads.linkedin.com*", "*snap.licdn.com*", "*bat.bing.com*", "*connect.facebook.net*",
+]
+
+# Classifies the page just loaded: "normal", "login_wall", "challenge", "throttled"
+# or "unavailable", from the URL, the HTTP status and a few marker elements.
+PAGE_STATE_SCRIPT = '''
+    const path = location.pathname;
+    const navigation = performance.getEntriesByType('navigation')[0];
+    const status = navigation && navigation.responseStatus ? navigation.responseStatus : 0;
+    const has = selector => document.querySelector(selector) !== null;
+    const title = (document.title || '').toLowerCase();
+
+    if (status === 429 || status === 999 || title.includes('too many requests')) return 'throttled';
+    if (path.startsWith('/checkpoint/') || has('#captcha-internal, iframe[src*="captcha"], form#challenge')) return 'challenge';
+    if (path.startsWith('/authwall') || path.startsWith('/login') || path.startsWith('/uas/login') ||
+        has('form.join-form, form.authwall-join-form, form.login__form')) return 'login_wall';
+    if (status === 404 || status === 410 || path.startsWith('/404') || path.startsWith('/in/unavailable') ||
+        has('.profile-unavailable, .not-found__container')) return 'unavailable';
+    return 'normal';
+'''
+
+# Stands in for pages missing from the cache in cache-only mode: every extractor returns N/A
+EMPTY_PAGE = "<html><body></body></html>"
+
+
+class PageLoadTimeout(TimeoutException):
+    """A page of the profile being scraped did not load within the page-load timeout."""
+
+    def __init__(self, url):
+        super().__init__(f"page load timed out at {url}")
+        self.url = url
+
+
+class BlockedPage(Exception):
+    """A profile page came back as a login wall, challenge, throttle or unavailable page."""
+
+    def __init__(self, state, url):
+        super().__init__(f"{state} page at {url}")
+        self.state = state
+        self.url = url
+
 
 class LinkedInProfileScraper:
-    def __init__(self, output_file, include_columns, connection_range=(0, 10), excel_file_path=None):
-        self.driver = self.init_driver()
+    def __init__(self, output_file, include_columns, connection_range=(0, 10), excel_file_path=None,
+                 experience_mode="dom", backend="live", launch_browser=True, output_mode="stream",
+                 checkpoint_file="checkpoint.db", resume=False, workers=1, pace_interval=0.0,
+                 wait_strategy="fixed", floor_delay=(0.5, 1.0), ready_timeout=10, quiet_period=0.5,
+                 top_card_mode="wait", profile_time_budget=None, interests_mode="reload",
+                 base_url="https://www.linkedin.com", metrics_file=None, prometheus_file=None,
+                 invitation_page_size=100, invitation_index_file=None, pipeline=False, queue_size=20,
+                 page_cache_dir=None, cache_ttl=7 * 24 * 3600, cache_max_bytes=None, cache_only=False,
+                 html_archive_dir=None, selector_stats_file="selector_stats.json", browser_profile="full",
+                 headless=False, window_size=(1366, 900), browser_binary=None, user_data_dir=None,
+                 driver_cache_file="driver_cache.json", session_max_age=6 * 3600, page_load_timeout=60,
+                 command_timeout=180, recycle_every=None, max_memory_mb=None, max_pages_per_minute=None,
+                 max_pages_per_hour=None, rate_jitter=(0.2, 1.0), rate_state_file=None, rate_account="default",
+                 detect_blocks=True, block_retries=2, backoff_base=60, backoff_max=1800):
+        if cache_only and not page_cache_dir:
+            raise ValueError("cache_only needs a page_cache_dir to read from")
+        # Snapshots of every loaded page. A cached page is always parsed like backend="snapshot",
+        # whatever the backend: there is only its HTML, no live DOM to query.
+        self.page_cache = PageCache(page_cache_dir, cache_ttl, cache_max_bytes) if page_cache_dir else None
+        self.cache_only = cache_only  # Extract from cached pages only, without a browser or network access
+        self.cache_misses = {}  # Pages a cache-only run found no copy of, by page kind
+        self.html_archive = HtmlArchive(html_archive_dir) if html_archive_dir else None  # Compressed copy of every loaded page
+        self.selectors = SelectorRegistry(selector_stats_file)  # Fallback selectors ordered by persisted hit rates
+        launch_browser = launch_browser and not cache_only
+        self.browser_profile = browser_profile  # "full" loads everything, "lean" blocks images, media, fonts and trackers
+        self.headless = headless  # Run Chrome without a window at `window_size`
+        self.window_size = window_size  # Viewport when headless or lean (a maximized window otherwise)
+        self.browser_binary = browser_binary  # Chrome to run (None = $CHROME_BINARY, then the usual install paths and PATH)
+        # Persistent Chrome profile so the login survives restarts; workers use "<dir>-worker<N>" (None = fresh profile)
+        self.user_data_dir = os.path.abspath(user_data_dir) if user_data_dir else None
+        self.driver_cache = DriverCache(driver_cache_file)  # Resolved binary, version and chromedriver between runs
+        self.session_max_age = session_max_age  # Seconds a validated session in user_data_dir is trusted without checking
+        self.worker_numbers = count(1)
+        # Per-profile timings and WebDriver call counts (None = no instrumentation)
+        self.metrics = MetricsRecorder(metrics_file, prometheus_file) if metrics_file or prometheus_file else None
+        self.profile_metrics = None
+        self.driver = self.instrument(self.init_driver()) if launch_browser else None  # No browser needed to parse saved snapshots
+        # Timeouts, hang watchdog and restarts after N profiles (recycle_every), above max_memory_mb or on a crash
+        self.lifecycle_options = {"page_load_timeout": page_load_timeout, "command_timeout": command_timeout,
+                                  "recycle_every": recycle_every, "max_memory_mb": max_memory_mb}
+        self.lifecycle = DriverLifecycle(self, **self.lifecycle_options) if self.driver else None
         self.output_file = output_file
         self.urls = []
         self.cookies_file = "cookies.pkl"
         self.connection_range = connection_range
         self.include_columns = include_columns  # Save INCLUDE_COLUMNS as an instance attribute
         self.excel_file_path = excel_file_path
+        self.experience_mode = experience_mode  # "dom" walks elements one by one, "script" uses a single execute_script
+        self.round_trips_saved = 0  # WebDriver commands avoided by the "script" experience mode
+        self.backend = backend  # "live" queries the DOM through Selenium, "snapshot" parses page_source locally
+        self.output_mode = output_mode  # "stream" appends rows to a journal, "workbook" rewrites the xlsx after every profile
+        if checkpoint_file and cache_only:
+            checkpoint_file = f"{checkpoint_file}.cache-only"  # Re-extraction never touches the live run's checkpoint
+        self.checkpoint = CheckpointStore(checkpoint_file) if checkpoint_file else None  # Finished profiles and sections
+        self.resume = resume  # Skip work recorded in the checkpoint by a previous run
+        self.workers = workers  # Browser processes scraping profiles in parallel
+        self.pace_interval = pace_interval  # Minimum seconds between profile starts across all workers
+        self.pipeline = pipeline  # Scrape profiles in other browsers while this one is still harvesting
+        self.queue_size = queue_size  # Jobs and rows buffered between pipeline stages
+        self.wait_strategy = wait_strategy  # "fixed" sleeps a guessed load time, "ready" waits for the DOM to settle
+        # Page-load budget per account shared by every worker (and, through rate_state_file, every process).
+        # With a budget the "ready" strategy skips its floor delay: the governor spaces the loads.
+        self.rate_limited = bool(max_pages_per_minute or max_pages_per_hour)
+        self.governor = RateGovernor(max_pages_per_minute, max_pages_per_hour, rate_jitter if self.rate_limited else None,
+                                     rate_state_file, rate_account)  # Also holds the backoff after blocked pages
+        self.detect_blocks = detect_blocks  # Classify every profile page after loading it and stop at the first blocked one
+        self.block_retries = block_retries  # Times a blocked profile is re-queued after backing off
+        self.backoff_base = backoff_base  # Seconds of the first backoff, doubled per consecutive block up to backoff_max
+        self.backoff_max = backoff_max
+        self.page_state = None  # Classification of the current profile's pages (None outside profile scraping)
+        self.last_page_state = None
+        self.load_timed_out = False  # A page of the current profile hit the page-load timeout
+        self.profile_classified = False  # The current profile's first loaded page was classified
+        self.last_load_timed_out = False
+        self.floor_delay = floor_delay  # Deliberate pause range (seconds) after each page in "ready" mode
+        self.ready_timeout = ready_timeout  # Longest readiness wait in seconds
+        self.quiet_period = quiet_period  # Seconds without DOM mutations before a page counts as settled
+        self.top_card_mode = top_card_mode  # "wait" waits per field, "probe" waits once and checks every field in one call
+        self.profile_time_budget = profile_time_budget  # Seconds of waiting allowed per profile (None = unlimited)
+        self.profile_deadline = None
+        self.budget_exhausted = False  # A wait of the current profile was cut short by its time budget
+        self.last_budget_exhausted = False
+        self.timeout_seconds_lost = 0.0  # Time spent in waits that ended in a timeout
+        self.interests_mode = interests_mode  # "reload" loads every interest tab, "tabs" loads once and switches tabs in-page
+        self.base_url = base_url.rstrip("/")  # Point at mock_linkedin.py for offline load tests
+        host = urlsplit(self.base_url).netloc
+        self.profile_link_selector = f'a[href*="{host[4:] if host.startswith("www.") else host}/in/"]'
+        self.invitation_page_size = invitation_page_size  # Invitations per pagination page, used to seek to connection_range (None = always start at page 1)
+        # Local index of sent invitations refreshed incrementally; Excel mode looks URLs up in it (None = crawl every run)
+        self.invitation_index = InvitationIndex(invitation_index_file) if invitation_index_file else None
 
 
     def init_driver(self):
-        chromedriver_autoinstaller.install()  # Ensures ChromeDriver matches your Chrome version
+        started = time.monotonic()
+        browser = self.driver_cache.resolve(self.browser_binary)  # Cached unless Chrome changed since the last run
         options = uc.ChromeOptions()
-        options.binary_location = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+        if browser["binary"]:
+            options.binary_location = browser["binary"]
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
         options.add_argument("--disable-gpu")
-        options.add_argument("--start-maximized")
         options.add_argument("--disable-blink-features=AutomationControlled")
-
-        driver = uc.Chrome(options=options, version_main=132, use_subprocess=True)
+        if self.headless or self.browser_profile == "lean":
+            options.add_argument(f"--window-size={self.window_size[0]},{self.window_size[1]}")
+        else:
+            options.add_argument("--start-maximized")
+        if self.headless:
+            options.add_argument("--headless=new")
+        if self.browser_profile == "lean":
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_argument("--mute-audio")
+            options.add_argument("--disable-extensions")
+            options.add_argument("--disable-background-networking")
+            options.add_argument("--disable-component-update")
+            options.add_argument("--disable-features=Translate,MediaRouter,OptimizationHints,AutofillServerCommunication")
+            # Keep timers and rendering at full speed while the window is hidden or occluded
+            options.add_argument("--disable-background-timer-throttling")
+            options.add_argument("--disable-backgrounding-occluded-windows")
+            options.add_argument("--disable-renderer-backgrounding")
+
+        driver = uc.Chrome(options=options, version_main=browser["major"], use_subprocess=True,
+                           driver_executable_path=browser["driver"], user_data_dir=self.user_data_dir)
+        driver.set_script_timeout(30)  # Room for the asynchronous readiness script
+        if self.browser_profile == "lean":
+            try:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+            except Exception as e:
+                print(f"Error blocking resources, loading everything: {e}")
+        print(f"Browser started in {time.monotonic() - started:.1f}s ({browser['version'] or 'unknown version'}).")
         return driver
 
+    def page_weight(self):
+        """Bytes transferred and load time of the current page, from the browser's resource timing."""
+        return self.driver.execute_script(PAGE_WEIGHT_SCRIPT)
+
     def save_html_content(self, company_name):
+        if self.html_archive:
+            # One compressed record in the archive instead of a loose file per page
+            try:
+                self.html_archive.add(self.driver.current_url, f"company:{company_name}", self.driver.page_source)
+                print(f"HTML content archived for {company_name}")
+            except Exception as e:
+                print(f"Error archiving HTML content: {e}")
+            return
+
         try:
             # Create folder if it doesn't exist
             folder_path = os.path.join(os.getcwd(), "html_files")
@@ -94,18 +570,81 @@ class LinkedInProfileScraper:
             print(f"Error loading cookies: {e}")
 
     def manual_login(self):
-        self.driver.get("https://www.linkedin.com/login")
+        self.navigate(f"{self.base_url}/login")
         input("Log in manually and press Enter when done.")
         self.save_cookies()
 
-    def login(self):
-        self.driver.get("https://www.linkedin.com")
+    def session_is_fresh(self):
+        """True when the persistent profile's session was validated recently enough to skip checking it."""
+        if self.driver_cache.session_fresh(self.user_data_dir, self.session_max_age):
+            print(f"Reusing the session in {self.user_data_dir}.")
+            return True
+        return False
+
+    def restore_session(self):
+        """Open the site and make sure it is logged in: a persistent profile may already be, else inject cookies.pkl."""
+        self.navigate(self.base_url)
+        if self.user_data_dir and self.is_session_valid():
+            return True
         self.load_cookies()
         time.sleep(2)
-        self.driver.refresh()
-        if not self.is_session_valid():
+        self.reload()
+        return self.is_session_valid()
+
+    def login(self):
+        if self.session_is_fresh():
+            return
+        if not self.restore_session():
             print("Session invalid. Please log in manually.")
             self.manual_login()
+        self.driver_cache.mark_session(self.user_data_dir)
+
+    def login_from_cookies(self):
+        """Seed this browser with the saved session; unlike login() it never falls back to a manual prompt."""
+        if self.session_is_fresh():
+            return
+        if not self.restore_session():
+            self.driver_cache.mark_session(self.user_data_dir, valid=False)
+            raise RuntimeError("Saved session in cookies.pkl is not valid.")
+        self.driver_cache.mark_session(self.user_data_dir)
+
+    def spawn_worker(self):
+        """Create a scraper with the same settings, checkpoint and session but its own browser."""
+        worker = copy.copy(self)
+        worker.profile_metrics = None
+        if self.user_data_dir:
+            worker.user_data_dir = f"{self.user_data_dir}-worker{next(self.worker_numbers)}"  # Chrome locks a profile to one process
+        worker.driver = worker.instrument(worker.init_driver())
+        worker.lifecycle = DriverLifecycle(worker, **self.lifecycle_options)
+        worker.round_trips_saved = 0  # Both merged into the owner's by merge_worker_counters when the pool shuts down
+        worker.cache_misses = {}
+        return worker
+
+    def quit_driver(self):
+        """Stop the watchdog and close this scraper's browser."""
+        if self.lifecycle:
+            self.lifecycle.stop()
+            if self.lifecycle.restarts:
+                print(f"Browser restarted {self.lifecycle.restarts} time(s).")
+        if self.driver:
+            self.driver.quit()
+
+    def instrument(self, driver):
+        """Count this scraper's WebDriver round trips when metrics are enabled."""
+        return instrument_driver(driver, self) if self.metrics else driver
+
+    def mark_section(self, name):
+        """Start timing a new section of the current profile."""
+        if self.profile_metrics is not None:
+            self.profile_metrics.enter(name)
+
+    def sleep(self, seconds, budgeted=True):
+        """Intentional pause, accounted separately from page waits and cut short by the profile time budget."""
+        if budgeted:
+            seconds = self.wait_timeout(seconds)
+        time.sleep(seconds)
+        if self.profile_metrics is not None:
+            self.profile_metrics.add("sleep", seconds)
 
     def is_session_valid(self):
         try:
@@ -116,9 +655,157 @@ class LinkedInProfileScraper:
         except:
             return False
 
+    def wait_timeout(self, timeout):
+        """Cap a wait by what is left of the current profile's time budget."""
+        if self.profile_deadline is None:
+            return timeout
+        remaining = max(0, self.profile_deadline - time.monotonic())
+        if remaining < timeout:
+            self.budget_exhausted = True  # What the wait was for may be missing from the row
+        return min(timeout, remaining)
+
+    def wait_for(self, condition, timeout=10):
+        """WebDriverWait.until within the profile time budget, counting the time lost to timeouts."""
+        started = time.monotonic()
+        try:
+            return WebDriverWait(self.driver, self.wait_timeout(timeout)).until(condition)
+        except TimeoutException:
+            self.timeout_seconds_lost += time.monotonic() - started
+            raise
+        finally:
+            if self.profile_metrics is not None:
+                self.profile_metrics.add("wait", time.monotonic() - started)
+
+    def find_field(self, field, timeout=10, all_matches=False):
+        """
+        Wait for the first selector in `field`'s fallback chain that matches and return its
+        element (or every matching element). All variants are checked on each poll, so a
+        broken selector costs no extra timeout; the outcome feeds the registry's hit rates.
+        """
+        _, elements = self.match_field(field, timeout)
+        return elements if all_matches else elements[0]
+
+    def match_field(self, field, timeout=10):
+        """find_field returning (matched selector, elements), for extractors that re-query the page."""
+        chain = self.selectors.chain(field)
+
+        def first_match(driver):
+            for selector in chain:
+                elements = driver.find_elements(By.CSS_SELECTOR, selector)
+                if elements:
+                    return selector, elements
+            return False
+
+        try:
+            selector, elements = self.wait_for(first_match, self.selectors.timeout(field, timeout))
+        except TimeoutException:
+            self.selectors.record(field, chain, None)
+            raise
+        self.selectors.record(field, chain, selector)
+        return selector, elements
+
+    def find_field_in(self, scope, field):
+        """find_field without waiting, inside an already located element."""
+        chain = self.selectors.chain(field)
+        for selector in chain:
+            elements = scope.find_elements(By.CSS_SELECTOR, selector)
+            if elements:
+                self.selectors.record(field, chain, selector)
+                return elements[0]
+        self.selectors.record(field, chain, None)
+        raise NoSuchElementException(f"No selector matched for {field}")
+
+    def wait_until_ready(self, selector=None, timeout=None, quiet_period=None):
+        """Block until `selector` is present and the DOM has stopped changing; returns False on timeout."""
+        timeout = self.wait_timeout(self.ready_timeout if timeout is None else timeout)
+        quiet_period = self.quiet_period if quiet_period is None else quiet_period
+        started = time.monotonic()
+        try:
+            state = self.driver.execute_async_script(READINESS_SCRIPT, selector, quiet_period * 1000, timeout * 1000)
+            ready = bool(state and state.get("ready"))
+            if not ready:
+                self.timeout_seconds_lost += time.monotonic() - started
+            return ready
+        except Exception as e:
+            print(f"Readiness check failed: {e}")
+            return False
+        finally:
+            if self.profile_metrics is not None:
+                self.profile_metrics.add("wait", time.monotonic() - started)
+
+    def navigate(self, url, profile_page=False):
+        """
+        Load a page once the rate governor has budget for it. While a profile is being
+        scraped, the page is classified right away and BlockedPage is raised for anything
+        but a normal page, so the remaining waits and sections are skipped. Only the
+        profile page itself (`profile_page`), or the first page of the profile loaded when
+        no top-card column needs it, can mark the whole profile unavailable.
+        A page-load timeout raises PageLoadTimeout and fails the rest of the profile, which
+        the driver lifecycle then retries in a restarted browser.
+        """
+        if self.page_state not in (None, "normal"):
+            raise BlockedPage(self.page_state, url)  # An earlier page of this profile was blocked
+        if self.load_timed_out:
+            raise PageLoadTimeout(url)  # The browser already failed to load a page of this profile
+        self.governor.acquire(self.governor_sleep)
+        try:
+            self.driver.get(url)
+        except TimeoutException:
+            if self.page_state is not None:
+                self.load_timed_out = True  # Seen by scrape_connection even if a section swallows the exception
+            raise PageLoadTimeout(url)
+        if self.page_state is not None and self.detect_blocks:
+            state = self.classify_page()
+            profile_page = profile_page or not self.profile_classified  # Stands in for the profile page
+            self.profile_classified = True
+            if state == "unavailable" and not profile_page:
+                print(f"{url} is not available; its columns stay N/A.")
+            elif state != "normal":
+                self.page_state = state
+                raise BlockedPage(state, url)
+
+    def governor_sleep(self, seconds):
+        """Wait for page-load budget in full: the rate limit is never cut short by the profile time budget."""
+        self.sleep(seconds, budgeted=False)
+
+    def reload(self):
+        """Refresh the current page; counts against the rate budget like any other load."""
+        self.governor.acquire(self.governor_sleep)
+        self.driver.refresh()
+
+    def classify_page(self):
+        """One probe of the loaded page: normal, login_wall, challenge, throttled or unavailable."""
+        try:
+            return self.driver.execute_script(PAGE_STATE_SCRIPT) or "normal"
+        except Exception as e:
+            print(f"Error classifying page: {e}")
+            return "normal"
+
+    def pace(self):
+        """Deliberate pause between pages, independent of how long the page took to load."""
+        if self.rate_limited:
+            return  # Page loads are already spaced by the rate governor
+        low, high = self.floor_delay
+        self.sleep(random.uniform(low, high))
+
+    def wait_for_page(self, selector=None, fixed_delay=None, pace=True):
+        """
+        Wait after a navigation or scroll. The "fixed" strategy keeps the old guessed sleep
+        (`fixed_delay`, or random_pause when not given); "ready" returns as soon as the page
+        has settled and then applies the floor delay.
+        """
+        if self.wait_strategy == "ready":
+            self.wait_until_ready(selector)
+            if pace:
+                self.pace()
+        elif fixed_delay is None:
+            self.random_pause()
+        else:
+            self.sleep(fixed_delay)
+
     def random_pause(self):
         pause_duration = random.uniform(1, 2)
-        time.sleep(pause_duration)
+        self.sleep(pause_duration)
     
     def human_scroll(self):
         """Perform a small human-like scroll to trigger HTML and avoid bot detection."""
@@ -129,13 +816,13 @@ class LinkedInProfileScraper:
             for _ in range(scroll_times):
                 scroll_step = random.randint(200, 500)  # Small scroll step
                 self.driver.execute_script(f"window.scrollBy(0, {scroll_step});")
-                time.sleep(scroll_pause)  # Pause after each scroll step to avoid detection
+                self.sleep(scroll_pause)  # Pause after each scroll step to avoid detection
             
         except Exception as e:
             print(f"Error during human scroll: {e}")
 
-    def scroll_to_end(self):
-        """Scroll to the bottom of the page until content stops loading."""
+    def scroll_to_end(self, selector=None):
+        """Scroll to the bottom of the page until content stops loading; `selector` matches the list's items."""
         try:
             scroll_pause = random.uniform(1, 1.5)  # Pause between scrolls to simulate human behavior
             last_height = self.driver.execute_script("return document.body.scrollHeight")  # Initial page height
@@ -143,7 +830,10 @@ class LinkedInProfileScraper:
             while True:
                 # Scroll down by a small step
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(scroll_pause)
+                if self.wait_strategy == "ready":
+                    self.wait_until_ready(selector)  # Returns once lazy-loaded items stop arriving
+                else:
+                    self.sleep(scroll_pause)
                 
                 # Wait for new content to load
                 new_height = self.driver.execute_script("return document.body.scrollHeight")
@@ -162,111 +852,14 @@ class LinkedInProfileScraper:
         """Remove the trailing slash from a URL if present."""
         return url.rstrip("/")
 
-    def get_excel_connection_urls(self):
-        # Load URLs from the Excel file
-        excel_urls = set(map(self.normalize_url, self.load_urls_from_excel()))  # Use a set for faster lookups
-        if not excel_urls:
-            print("No URLs found in the Excel file.")
-            return []
-
-        # Navigate to the LinkedIn sent invitations page
-        self.driver.get("https://www.linkedin.com/mynetwork/invitation-manager/sent/")
-        time.sleep(2)  # Allow the page to load
-
-        pending_profiles = set()  # Store unique URLs globally
-        pending_connections = []  # Store scraped details
-        last_profile_url = None  # Track the last profile's URL
-        retry_count = 0  # Retry counter
-
-        while len(pending_connections) < len(excel_urls):
-            self.human_scroll()
-            time.sleep(1)
-
-            # Retrieve all currently loaded pending connection items
-            current_profiles = self.driver.find_elements(By.CSS_SELECTOR, 'li.invitation-card')
-
-            # Add URLs from current profiles to the cumulative set
-            for profile in current_profiles:
-                try:
-                    url = profile.find_element(By.CSS_SELECTOR, 'a[href*="linkedin.com/in/"]').get_attribute('href')
-                    pending_profiles.add(url)
-                except Exception:
-                    continue
-
-            # Scrape details for profiles in the Excel file
-            for url in pending_profiles:
-                # Skip URLs not in Excel or already processed
-                if url not in excel_urls or any(conn["profile_url"] == url for conn in pending_connections):
-                    continue
-
-                try:
-                    # Extract profile details
-                    message = "N/A"
-                    sent_time = "N/A"
-
-                    try:
-                        see_more_button = profile.find_element(By.CSS_SELECTOR, 'a.lt-line-clamp__more')
-                        self.driver.execute_script("arguments[0].click();", see_more_button)
-                        time.sleep(0.5)  # Allow time for the content to expand
-                    except Exception:
-                        pass  # If no button is found, proceed to scrape the visible text
-
-                    message_element = profile.find_elements(By.CSS_SELECTOR, '.invitation-card__custom-message span.lt-line-clamp__line')
-                    if message_element:
-                        message = message_element[0].text.strip() if message_element[0].text.strip() else "N/A"
-
-                    sent_time_element = profile.find_elements(By.CSS_SELECTOR, '.time-badge.t-12.t-black--light.t-normal')
-                    if sent_time_element:
-                        sent_time = sent_time_element[0].text.strip() if sent_time_element[0].text.strip() else "N/A"
-
-                    pending_connections.append({"profile_url": url, "message": message, "sent_time": sent_time})
-
-                except Exception as e:
-                    print(f"Error processing profile {url}: {e}")
-                    continue
-
-            # Check if all Excel URLs are processed
-            if all(url in {conn["profile_url"] for conn in pending_connections} for url in excel_urls):
-                print("All Excel URLs processed. Exiting loop.")
-                break
-
-            # Check for pagination if no new profiles are loaded
-            try:
-                current_last_url = current_profiles[-1].find_element(By.CSS_SELECTOR, 'a[href*="linkedin.com/in/"]').get_attribute('href')
-            except Exception:
-                current_last_url = None
+    def open_invitation_page(self, page=1):
+        """Load the sent-invitations list, optionally at a given pagination page."""
+        url = f"{self.base_url}/mynetwork/invitation-manager/sent/"
+        self.navigate(url if page <= 1 else f"{url}?page={page}")
+        self.wait_for_page('li.invitation-card', 2)  # Allow the page to load
 
-            if current_last_url == last_profile_url:
-                retry_count += 1
-                print(f"No new profiles loaded. Retry {retry_count}/2.")
-                time.sleep(3)
-                if retry_count >= 2:
-                    print("Attempting to navigate to the next page.")
-                    try:
-                        next_button = self.driver.find_element(By.CSS_SELECTOR, 'button.artdeco-pagination__button--next')
-                        if not next_button.get_attribute("disabled"):  # Check if the "Next" button is enabled
-                            self.driver.execute_script("arguments[0].click();", next_button)
-                            time.sleep(2)  # Allow time for the next page to load
-                            retry_count = 0  # Reset retry count
-                            continue  # Retry loading profiles on the new page
-                        else:
-                            print("No more pages to navigate. Exiting.")
-                            break
-                    except Exception as e:
-                        print(f"Failed to navigate to the next page: {e}")
-                        break
-            else:
-                retry_count = 0  # Reset retry count if new content is found
-
-            # Update the last profile URL
-            last_profile_url = current_last_url
-
-        return pending_connections
-
-    def get_unanswered_connection_urls(self, connection_range):
-        self.driver.get("https://www.linkedin.com/mynetwork/invitation-manager/sent/")
-
-        # Scrape the number of sent invitations for People
+    def read_pending_invite_count(self):
+        """Number of pending People invitations shown in the sent-invitations header, or None."""
         try:
             people_invites = WebDriverWait(self.driver, 10).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "button[aria-label*='sent People invitation'] span.artdeco-pill__text"))
@@ -275,104 +868,285 @@ class LinkedInProfileScraper:
             if match:
                 total_pending_invites = int(match.group(1).replace(",", ""))
                 print(f"Total Pending Invites: {total_pending_invites}")
-            else:
-                raise ValueError("No match found in 'people_invites'")
-
-            # Adjust the target count based on range and available invites
-            start_count = connection_range[0] - 1
-            end_count = min(connection_range[1], total_pending_invites)
+                return total_pending_invites
+            raise ValueError("No match found in 'people_invites'")
         except Exception as e:
             print(f"Failed to retrieve pending invites count: {e}")
-            start_count = connection_range[0] - 1
-            end_count = connection_range[1]
+            return None
+
+    def read_invitation_cards(self, offset):
+        """Expand and read the invitation cards from DOM index `offset` on, in at most two script calls."""
+        batch = self.driver.execute_script(INVITATION_CARDS_SCRIPT, offset, self.profile_link_selector, True, None)
+        if batch["expanded"]:
+            self.sleep(0.5)  # Let every expanded message render, once per batch
+            # Re-read the same cards only: any appended meanwhile still have their clamps
+            batch = self.driver.execute_script(
+                INVITATION_CARDS_SCRIPT, offset, self.profile_link_selector, False, len(batch["cards"])
+            )
+        return batch
 
-        pending_profiles = []  # Store URLs in a list to preserve order
+    def next_invitation_page(self):
+        """Click the pagination "Next" button; returns False on the last page."""
+        try:
+            next_button = self.driver.find_element(By.CSS_SELECTOR, 'button.artdeco-pagination__button--next')
+            if next_button.get_attribute("disabled"):  # Check if the "Next" button is enabled
+                print("No more pages to navigate. Exiting.")
+                return False
+            self.driver.execute_script("arguments[0].click();", next_button)
+            self.wait_for_page('li.invitation-card', 2)  # Allow time for the next page to load
+            return True
+        except Exception as e:
+            print(f"Failed to navigate to the next page: {e}")
+            return False
+
+    def invitation_page_for(self, start_index, total_invites=None):
+        """Pagination page holding the 0-based invitation `start_index`, or 1 when seeking is not possible."""
+        page_size = self.invitation_page_size
+        if not page_size or start_index < page_size:
+            return 1
+        if not total_invites:
+            # The page size cannot be checked against the pagination, and a wrong one would shift every position
+            print("Pending invite count unknown; not seeking.")
+            return 1
+
+        try:
+            page_numbers = self.driver.execute_script(PAGINATION_PAGES_SCRIPT) or []
+        except Exception as e:
+            print(f"Failed to read pagination: {e}")
+            return 1
+        if not page_numbers:
+            return 1  # Infinite scroll only, nothing to jump to
+        page_count = max(page_numbers)
+
+        # A page size that does not match the pagination would shift every position
+        if -(-total_invites // page_size) != page_count:
+            print(f"{total_invites} invites over {page_count} pages does not fit {page_size} per page; not seeking.")
+            return 1
+        return min(start_index // page_size + 1, page_count)
+
+    def iter_sent_invitations(self, first_position=0):
+        """
+        Yield (position, connection) for every invitation on the open sent-invitations page,
+        in list order and across pagination. Only cards appended since the previous read
+        are processed, so each card is read once. `first_position` is the list position of
+        the first card on the open page.
+        """
         seen_urls = set()  # Track unique URLs to avoid duplicates
-        pending_connections = []  # Store scraped details
-        last_profile_url = None  # Track the last profile's URL
+        position = first_position  # Index of the next unique invitation in the whole list
+        offset = 0  # DOM index of the first card not read yet
         retry_count = 0  # Retry counter
 
-        while len(pending_profiles) < end_count:
-            self.human_scroll()
-            time.sleep(1)
+        while True:
+            try:
+                batch = self.read_invitation_cards(offset)
+            except Exception as e:
+                print(f"Failed to read invitation cards: {e}")
+                return
 
-            # Retrieve all currently loaded pending connection items
-            current_profiles = self.driver.find_elements(By.CSS_SELECTOR, 'li.invitation-card')
+            if batch["total"] < offset:
+                offset = 0  # The list was re-rendered; seen_urls skips cards already yielded
+                continue
+            offset += len(batch["cards"])
 
-            # Add URLs from current profiles to the list, maintaining order
-            for profile in current_profiles:
-                try:
-                    url = profile.find_element(By.CSS_SELECTOR, 'a[href*="linkedin.com/in/"]').get_attribute('href')
-                    if url not in seen_urls:
-                        seen_urls.add(url)
-                        pending_profiles.append(url)
-                except Exception:
+            for card in batch["cards"]:
+                url = card["url"]
+                if not url or url in seen_urls:
                     continue
+                seen_urls.add(url)
+                yield position, {"profile_url": url, "message": card["message"], "sent_time": card["sent_time"]}
+                position += 1
 
-            # Scrape details for profiles within the specified range
-            for url in pending_profiles[start_count:end_count]:
-                # Skip URLs already processed
-                if any(conn["profile_url"] == url for conn in pending_connections):
+            if batch["cards"]:
+                retry_count = 0  # Reset retry count if new content is found
+            else:
+                retry_count += 1
+                print(f"No new profiles loaded. Retry {retry_count}/2.")
+                if retry_count >= 2:
+                    print("Attempting to navigate to the next page.")
+                    if not self.next_invitation_page():
+                        return
+                    offset = 0  # The next page starts a fresh list
+                    retry_count = 0
                     continue
+                self.wait_for_page(None, 3, pace=False)
 
-                try:
-                    # Extract profile details
-                    message = "N/A"
-                    sent_time = "N/A"
-
-                    try:
-                        see_more_button = profile.find_element(By.CSS_SELECTOR, 'a.lt-line-clamp__more')
-                        self.driver.execute_script("arguments[0].click();", see_more_button)
-                        time.sleep(0.5)  # Allow time for the content to expand
-                    except Exception:
-                        pass  # If no button is found, proceed to scrape the visible text
+            self.human_scroll()
+            self.wait_for_page('li.invitation-card', 1, pace=False)
 
-                    message_element = profile.find_elements(By.CSS_SELECTOR, '.invitation-card__custom-message span.lt-line-clamp__line')
-                    if message_element:
-                        message = message_element[0].text.strip() if message_element[0].text.strip() else "N/A"
+    def iter_excel_connections(self):
+        """Yield the sent invitations whose profile URL is listed in the Excel file, as they are found."""
+        # Load URLs from the Excel file
+        excel_urls = set(map(self.normalize_url, self.load_urls_from_excel()))  # Use a set for faster lookups
+        if not excel_urls:
+            print("No URLs found in the Excel file.")
+            return
+
+        if self.invitation_index:
+            # Local lookups after an incremental refresh instead of crawling until every URL is found
+            self.refresh_invitation_index()
+            entries = [self.invitation_index.get(url) for url in excel_urls]
+            pending = sorted((entry for entry in entries if entry and entry["status"] == "pending"), key=lambda entry: entry["position"])
+            print(f"{len(pending)} of {len(excel_urls)} Excel URLs have a pending invitation.")
+            for entry in pending:
+                yield self.invitation_index.connection_record(entry)
+            return
 
-                    sent_time_element = profile.find_elements(By.CSS_SELECTOR, '.time-badge.t-12.t-black--light.t-normal')
-                    if sent_time_element:
-                        sent_time = sent_time_element[0].text.strip() if sent_time_element[0].text.strip() else "N/A"
+        # Navigate to the LinkedIn sent invitations page
+        self.open_invitation_page()
 
-                    pending_connections.append({"profile_url": url, "message": message, "sent_time": sent_time})
+        remaining = set(excel_urls)
+        for _, connection in self.iter_sent_invitations():
+            url = self.normalize_url(connection["profile_url"])
+            if url not in remaining:
+                continue
+            remaining.discard(url)
+            yield connection
 
-                except Exception as e:
-                    print(f"Error processing profile {url}: {e}")
-                    continue
+            # Check if all Excel URLs are processed
+            if not remaining:
+                print("All Excel URLs processed. Exiting loop.")
+                return
 
-            # Check for pagination if no new profiles are loaded
+    def refresh_invitation_index(self, known_streak=3):
+        """
+        Bring the invitation index up to date. The list is newest first, so only the
+        invitations above the first `known_streak` already-indexed ones, listed in their
+        indexed order, are crawled. Everything above them is new or was re-sent and goes
+        to the top; the header count then tells whether any were withdrawn or accepted meanwhile.
+        """
+        index = self.invitation_index
+        self.open_invitation_page()
+        total = self.read_pending_invite_count()
+
+        if index.pending_count() == 0:
+            self.rebuild_invitation_index()
+            return
+
+        crawled = []
+        streak = 0
+        last_position = None
+        for _, connection in self.iter_sent_invitations():
+            crawled.append(connection)
+            entry = index.get(connection["profile_url"])
+            if entry is None or entry["status"] != "pending":
+                streak = 0
+            elif streak and entry["position"] == last_position + 1:
+                streak += 1
+            else:
+                streak = 1  # A re-sent invitation is out of its indexed order and starts a new streak
+            last_position = entry["position"] if streak else None
+            if streak >= known_streak:
+                break
+        newest = crawled[:len(crawled) - streak]
+        index.add_newest(newest)
+        print(f"Invitation index: {len(newest)} new or re-sent invitations.")
+
+        if total is None:
+            return
+        removed = index.pending_count() - total
+        if removed < 0:
+            print(f"Invitation index is missing {-removed} invitations.")
+            self.rebuild_invitation_index()
+        elif removed > 0:
+            print(f"{removed} indexed invitations were withdrawn or accepted; locating them.")
             try:
-                current_last_url = current_profiles[-1].find_element(By.CSS_SELECTOR, 'a[href*="linkedin.com/in/"]').get_attribute('href')
-            except Exception:
-                current_last_url = None
+                self.reconcile_invitation_index(removed, total)
+            except Exception as e:
+                print(f"Failed to reconcile the invitation index: {e}")
+                self.rebuild_invitation_index()
 
-            if current_last_url == last_profile_url:
-                retry_count += 1
-                print(f"No new profiles loaded. Retry {retry_count}/2.")
-                time.sleep(3)
-                if retry_count >= 2:
-                    print("Attempting to navigate to the next page.")
-                    try:
-                        next_button = self.driver.find_element(By.CSS_SELECTOR, 'button.artdeco-pagination__button--next')
-                        if not next_button.get_attribute("disabled"):  # Check if the "Next" button is enabled
-                            self.driver.execute_script("arguments[0].click();", next_button)
-                            time.sleep(2)  # Allow time for the next page to load
-                            retry_count = 0  # Reset retry count
-                            continue  # Retry loading profiles on the new page
-                        else:
-                            print("No more pages to navigate. Exiting.")
-                            break
-                    except Exception as e:
-                        print(f"Failed to navigate to the next page: {e}")
-                        break
-            else:
-                retry_count = 0  # Reset retry count if new content is found
+    def rebuild_invitation_index(self):
+        """Crawl the whole sent-invitations list into the index."""
+        print("Crawling every sent invitation into the index.")
+        self.open_invitation_page()
+        self.invitation_index.replace_all([connection for _, connection in self.iter_sent_invitations()])
+        print(f"Indexed {self.invitation_index.pending_count()} pending invitations.")
+
+    def reconcile_invitation_index(self, removed, total):
+        """
+        Find the `removed` invitations that left the list without crawling all of it.
+        Every removal shifts the later invitations up by one, so the indexed position of
+        a page's first card minus its real position counts the removals above it.
+        Bisecting over pages on that count leaves only the pages holding removals to crawl.
+        """
+        index = self.invitation_index
+        page_size = self.invitation_page_size
+        if not page_size:
+            raise ValueError("invitation_page_size is not set")
+        page_count = -(-total // page_size)
+        shifts = {page_count + 1: removed}  # Past the last page every removal is above
+
+        def shift(page):
+            if page not in shifts:
+                self.open_invitation_page(page)
+                cards = self.read_invitation_cards(0)["cards"]
+                first_url = next((card["url"] for card in cards if card["url"]), None)
+                entry = index.get(first_url) if first_url else None
+                if entry is None or entry["status"] != "pending":
+                    raise ValueError(f"first invitation on page {page} is not indexed")
+                shifts[page] = entry["position"] - (page - 1) * page_size
+            return shifts[page]
+
+        def first_indexed(page):
+            return (page - 1) * page_size + shift(page)
+
+        def crawl(page):
+            self.open_invitation_page(page)
+            seen = set()
+            for position, connection in self.iter_sent_invitations((page - 1) * page_size):
+                if position >= page * page_size:
+                    break
+                seen.add(normalize_profile_url(connection["profile_url"]))
+            index.touch(seen)
+            return [url for url in index.pending_urls_between(first_indexed(page), first_indexed(page + 1)) if url not in seen]
+
+        def bisect(low, high):
+            if shift(low) == shift(high):
+                return []  # No removals between these pages
+            if high == low + 1:
+                return crawl(low)
+            middle = (low + high) // 2
+            return bisect(low, middle) + bisect(middle, high)
+
+        if page_count <= 1:
+            gone = crawl(1)
+        else:
+            # Invitations indexed above the first card of page 1 are gone as well
+            gone = index.pending_urls_between(0, shift(1)) + bisect(1, page_count + 1)
+
+        index.mark_gone(gone)
+        print(f"Marked {len(gone)} invitations as withdrawn or accepted after probing {len(shifts) - 1} page(s).")
 
-            # Update the last profile URL
-            last_profile_url = current_last_url
+    def get_excel_connection_urls(self):
+        return list(self.iter_excel_connections())
+
+    def iter_unanswered_connections(self, connection_range):
+        """Yield the sent invitations at positions connection_range[0]..connection_range[1] (1-based), as they are read."""
+        self.navigate(f"{self.base_url}/mynetwork/invitation-manager/sent/")
+
+        # Adjust the target count based on range and available invites
+        total_pending_invites = self.read_pending_invite_count()
+        start_count = connection_range[0] - 1
+        end_count = connection_range[1] if total_pending_invites is None else min(connection_range[1], total_pending_invites)
+
+        # Jump straight to the page holding the range start instead of scrolling through earlier pages
+        first_position = 0
+        page = self.invitation_page_for(start_count, total_pending_invites)
+        if page > 1:
+            self.open_invitation_page(page)
+            first_position = (page - 1) * self.invitation_page_size
+            print(f"Jumped to page {page}, starting at invitation {first_position + 1}.")
+
+        for position, connection in self.iter_sent_invitations(first_position):
+            if position >= end_count:
+                break
+            if position >= start_count:
+                yield connection
+            if position + 1 >= end_count:
+                break  # Stop without scrolling for cards past the range
 
-        return pending_connections
+    def get_unanswered_connection_urls(self, connection_range):
+        return list(self.iter_unanswered_connections(connection_range))
 
 
     def click_see_more_button(self):
@@ -393,10 +1167,19 @@ class LinkedInProfileScraper:
     def scrape_experience(self, profile_url):
         # Navigate to the profile's experience details page
         experience_url = f"{profile_url}/details/experience/"
-        self.driver.get(experience_url)
-        self.random_pause()
+        cached_html = self.cached_page(profile_url, "experience")
+        if cached_html is not None:
+            return self.extract_snapshot(cached_html, "experience", experience_url)
+
+        self.navigate(experience_url)
+        self.wait_for_page('li.pvs-list__paged-list-item')
         self.human_scroll()
-        self.scroll_to_end()
+        self.scroll_to_end('li.pvs-list__paged-list-item')
+
+        if self.backend == "snapshot":
+            return self.scrape_experience_snapshot(profile_url, experience_url)
+        if self.experience_mode == "script":
+            return self.scrape_experience_script(profile_url)
 
         current_positions = {"Position Title": [], "Position Description": [], "Company Name": []}
         more_positions = []
@@ -409,9 +1192,8 @@ class LinkedInProfileScraper:
 
         try:
             # Wait for all experience list items to load
-            experience_items = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'li.pvs-list__paged-list-item'))
-            )
+            experience_items = self.find_field("detail_list_items", all_matches=True)
+            self.cache_page(profile_url, "experience")
 
             for experience in experience_items:
                 try:
@@ -594,7 +1376,99 @@ class LinkedInProfileScraper:
             return current_positions, more_positions_string, more_descriptions_string, more_skills_string, experiences, current_firm_experiences
 
         except Exception as e:
-            return {"Position Title": "N/A", "Company Name": "N/A"}, "N/A", "N/A", "N/A"
+            return {"Position Title": "N/A", "Company Name": "N/A"}, "N/A", "N/A", "N/A", [], []
+
+    def scrape_experience_script(self, profile_url):
+        """Extract the loaded experience list with one execute_script call instead of per-element lookups."""
+        try:
+            # Same readiness check as the element walk; the script reads the items it found
+            selector, _ = self.match_field("detail_list_items")
+            self.cache_page(profile_url, "experience")
+
+            extracted = self.driver.execute_script(EXPERIENCE_EXTRACTION_SCRIPT, self.selectors.chain("detail_list_items", selector))
+
+            # One wait plus one script call replace the element-by-element walk
+            saved = max(extracted.get("legacyCalls", 0) - 2, 0)
+            self.round_trips_saved += saved
+            print(f"Experience extracted in one call ({saved} round trips saved, {self.round_trips_saved} total).")
+
+            return self.build_experience_results(extracted.get("roles", []))
+
+        except Exception as e:
+            return {"Position Title": "N/A", "Company Name": "N/A"}, "N/A", "N/A", "N/A", [], []
+
+    def scrape_experience_snapshot(self, profile_url, experience_url):
+        """Extract the loaded experience list from a single page_source snapshot."""
+        try:
+            selector, _ = self.match_field("detail_list_items")
+            self.cache_page(profile_url, "experience")
+            return self.extract_snapshot(self.driver.page_source, "experience", experience_url,
+                                         matched={"detail_list_items": selector})
+        except Exception as e:
+            return {"Position Title": "N/A", "Company Name": "N/A"}, "N/A", "N/A", "N/A", [], []
+
+    def build_experience_results(self, roles):
+        """
+        Turn raw role entries (title, company, caption, description, skills, group)
+        into the same outputs scrape_experience builds from the live DOM.
+        """
+        current_positions = {"Position Title": [], "Position Description": [], "Company Name": []}
+        more_positions = []
+        more_descriptions = []
+        more_skills = []
+        experiences = []
+        current_firm_experiences = []
+
+        for _, group_roles in groupby(roles, key=lambda role: role["group"]):
+            role_dates = []  # Start/end dates for a company with multiple roles
+            has_current_role = False
+
+            for role in group_roles:
+                job_title = role["title"]
+                company_name = role["company"]
+
+                if role["caption"] is None:
+                    start_date, end_date = "N/A", "N/A"
+                else:
+                    start_date, end_date, _ = self.extract_dates_and_duration(role["caption"])
+
+                experiences.append({
+                    "start_date": start_date,
+                    "end_date": end_date
+                })
+
+                position_entry = (
+                    f"Position: {job_title} - Company: {company_name} - StartDate: {start_date} - EndDate: {end_date}"
+                )
+
+                more_descriptions.append(role["description"])
+                more_skills.append(role["skills"])
+
+                if role["grouped"]:
+                    role_dates.append((start_date, end_date))
+
+                if end_date == " ":
+                    current_positions["Position Title"].append(job_title)
+                    current_positions["Position Description"].append(role["description"])
+                    current_positions["Company Name"].append(company_name)
+                    more_positions.insert(0, position_entry)
+                    if role["grouped"]:
+                        has_current_role = True
+                    else:
+                        current_firm_experiences.append((start_date, end_date))
+                else:
+                    more_positions.append(position_entry)
+
+            if has_current_role:
+                current_firm_experiences.append(role_dates)
+
+        # Convert current positions into comma-separated strings for each column
+        current_positions = {k: ", ".join(v) for k, v in current_positions.items()}
+        more_positions_string = ',\n'.join(more_positions)
+        more_descriptions_string = ',\n'.join(more_descriptions)
+        more_skills_string = ',\n'.join(more_skills)
+
+        return current_positions, more_positions_string, more_descriptions_string, more_skills_string, experiences, current_firm_experiences
 
     def extract_dates_and_duration(self, date_range):
         """
@@ -687,10 +1561,14 @@ class LinkedInProfileScraper:
     def scrape_education(self, profile_url):
         # Navigate to the profile's education details page
         education_url = f"{profile_url}/details/education/"
-        self.driver.get(education_url)
-        self.random_pause()
+        cached_html = self.cached_page(profile_url, "education")
+        if cached_html is not None:
+            return self.extract_snapshot(cached_html, "education", education_url)
+
+        self.navigate(education_url)
+        self.wait_for_page('li.pvs-list__paged-list-item')
         self.human_scroll()
-        self.scroll_to_end()
+        self.scroll_to_end('li.pvs-list__paged-list-item')
 
         education_degree = "N/A"
         school_name = "N/A"
@@ -698,9 +1576,12 @@ class LinkedInProfileScraper:
 
         try:
             # Wait for all education list items to load
-            education_items = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'li.pvs-list__paged-list-item'))
-            )
+            selector, education_items = self.match_field("detail_list_items")
+            self.cache_page(profile_url, "education")
+
+            if self.backend == "snapshot":
+                return self.extract_snapshot(self.driver.page_source, "education", education_url,
+                                             matched={"detail_list_items": selector})
 
             for idx, education in enumerate(education_items):
                 try:
@@ -752,33 +1633,57 @@ class LinkedInProfileScraper:
         except Exception as e:
             print(f"Error locating education items.")
             return "N/A", "N/A", "N/A"
+
+    def build_education_results(self, entries):
+        """Turn raw education entries (index, school, degree, caption) into the scrape_education outputs."""
+        education_degree = "N/A"
+        school_name = "N/A"
+        more_educations = []
+
+        for entry in entries:
+            if entry["caption"] is None:
+                start_date, end_date = "N/A", "N/A"
+            else:
+                start_date, end_date, _ = self.extract_dates_and_duration(entry["caption"])
+
+            education_entry = (
+                f"Degree: {entry['degree']} - School Name: {entry['school']} - StartDate: {start_date} - EndDate: {end_date}"
+            )
+
+            # The first list item fills the main columns
+            if entry["index"] == 0:
+                education_degree = entry["degree"]
+                school_name = entry["school"]
+                more_educations.insert(0, education_entry)
+            else:
+                more_educations.append(education_entry)
+
+        return education_degree, school_name, ',\n'.join(more_educations)
         
     def scrape_contact_info(self, profile_url):
         contact_info_url = f"{profile_url}/overlay/contact-info/"
-        self.driver.get(contact_info_url)
-        self.random_pause()
-        
-        contact_info = {
-            "PhoneNumber": "N/A",
-            "Email Address": "N/A"
-        }
-        birthday = "N/A"
-        connected_on = "N/A"
+        cached_html = self.cached_page(profile_url, "contact")
+        if cached_html is not None:
+            return self.extract_snapshot(cached_html, "contact", contact_info_url)
+
+        self.navigate(contact_info_url)
+        self.wait_for_page('div.artdeco-modal__content')
 
         try:
             # Wait for the contact info modal to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'div.artdeco-modal__content'))
-            )
+            selector, (contact_modal, *_) = self.match_field("contact_modal")
 
             # Wait for the loader to disappear, if it exists
-            WebDriverWait(self.driver, 10).until_not(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'div.artdeco-loader'))
-            )
+            self.wait_for(lambda driver: not driver.find_elements(By.CSS_SELECTOR, 'div.artdeco-loader'))
+            self.cache_page(profile_url, "contact")
+
+            if self.backend == "snapshot":
+                return self.extract_snapshot(self.driver.page_source, "contact", contact_info_url,
+                                             matched={"contact_modal": selector})
 
             # Use JavaScript to extract the "Connected On" and "Birthday" information
             contact_data = self.driver.execute_script('''
-                let contactModal = document.querySelector('div.artdeco-modal__content');
+                let contactModal = arguments[0];
                 let data = { "email": "N/A", "phone": "N/A", "birthday": "N/A", "connectedOn": "N/A" };
                 
                 contactModal.querySelectorAll('section.pv-contact-info__contact-type').forEach(section => {
@@ -801,8 +1706,24 @@ class LinkedInProfileScraper:
                     }
                 });
                 return data;
-            ''')
+            ''', contact_modal)
+
+            return self.build_contact_results(contact_data)
 
+        except Exception as e:
+            print(f"Failed to scrape contact info: {e}")
+            return "N/A", "N/A", "N/A"
+
+    def build_contact_results(self, contact_data):
+        """Format the raw contact modal fields into (contact info, birthday, connected on)."""
+        contact_info = {
+            "PhoneNumber": "N/A",
+            "Email Address": "N/A"
+        }
+        birthday = "N/A"
+        connected_on = "N/A"
+
+        try:
             contact_info["Email Address"] = contact_data.get("email", "N/A")
             contact_info["PhoneNumber"] = contact_data.get("phone", "N/A")
             birthday_raw = contact_data.get("birthday", "N/A")
@@ -840,34 +1761,65 @@ class LinkedInProfileScraper:
         try:
             # Load the profile URL and navigate to the interests section (index 0)
             interest_url = f"{profile_url}/details/interests/?detailScreenTabIndex=0"
-            self.driver.get(interest_url)
-            time.sleep(2)  # Allow page to load
+            cached_html = self.cached_page(profile_url, "interest_tabs")
+            if cached_html is not None:
+                return self.cached_interests(profile_url, cached_html)
+
+            self.navigate(interest_url)
+            self.wait_for_page('div.artdeco-tablist', 2)  # Allow page to load
             self.human_scroll()
+            self.cache_page(profile_url, "interest_tabs")
 
-            # Extract the buttons to determine their index based on the interest names
-            interest_buttons = self.driver.find_elements(By.CSS_SELECTOR, 'div.artdeco-tablist button.artdeco-tab')
+            if self.backend == "snapshot":
+                interest_map = self.extract_snapshot(self.driver.page_source, "interest_tabs", interest_url)
+            else:
+                # Extract the buttons to determine their index based on the interest names
+                interest_buttons = self.driver.find_elements(By.CSS_SELECTOR, 'div.artdeco-tablist button.artdeco-tab')
 
-            # Map the interest names to their indices
-            interest_map = {}
-            for index, button in enumerate(interest_buttons):
-                try:
-                    tab_name = button.find_element(By.CSS_SELECTOR, 'span[aria-hidden="true"]').text.strip()
-                    if tab_name in relevant_interests:
-                        interest_map[tab_name] = index
-                except Exception as e:
-                    continue
+                # Map the interest names to their indices
+                interest_map = {}
+                for index, button in enumerate(interest_buttons):
+                    try:
+                        tab_name = button.find_element(By.CSS_SELECTOR, 'span[aria-hidden="true"]').text.strip()
+                        if tab_name in relevant_interests:
+                            interest_map[tab_name] = index
+                    except Exception as e:
+                        continue
 
             print(f"Detected Interests: {interest_map}")
 
             # Now navigate to each relevant interest tab using its index and scrape items
             for interest_name, tab_index in interest_map.items():
                 interest_url = f"{profile_url}/details/interests/?detailScreenTabIndex={tab_index}"
-                self.driver.get(interest_url)
-                time.sleep(2)
-                self.human_scroll()
+                if self.interests_mode == "tabs":
+                    # Switch tabs on the already loaded page and load the whole list
+                    self.open_interest_tab(tab_index)
+                else:
+                    self.navigate(interest_url)
+                    self.wait_for_page('li.pvs-list__paged-list-item', 2)
+                    self.human_scroll()
+                self.cache_page(profile_url, f"interests:{interest_name}")
+
+                if self.backend == "snapshot":
+                    scraped_interests[interest_name].extend(
+                        self.extract_snapshot(self.driver.page_source, "interests", interest_url, interest_name=interest_name)
+                    )
+                    continue
 
-                # Extract all the interest items (name and URL)
-                interest_items = self.driver.find_elements(By.CSS_SELECTOR, 'li.pvs-list__paged-list-item')
+                if self.interests_mode == "tabs":
+                    # All items of the tab in one call
+                    interest_items = self.driver.execute_script(INTEREST_ITEMS_SCRIPT, self.selectors.chain("detail_list_items")) or []
+                    scraped_interests[interest_name].extend(
+                        f"{interest_name}: {name} - URL: {url}" for name, url in interest_items
+                    )
+                    continue
+
+                # Extract all the interest items (name and URL) with the first list selector that matches
+                interest_items = []
+                for selector in self.selectors.chain("detail_list_items"):
+                    interest_items = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                    if interest_items:
+                        break
                 for item in interest_items:
                     try:
                         # Scrape the interest name
@@ -904,20 +1856,65 @@ class LinkedInProfileScraper:
             print(f"Error navigating to interests: {e}")
             return {interest: [] for interest in relevant_interests}
 
+    def cached_interests(self, profile_url, tabs_html):
+        """Build the interest columns from the cached tab list and the cached page of each tab."""
+        scraped_interests = {interest: [] for interest in snapshot_parser.RELEVANT_INTERESTS}
+        interest_map = self.extract_snapshot(tabs_html, "interest_tabs", f"{profile_url}/details/interests/?detailScreenTabIndex=0")
+        for interest_name, tab_index in interest_map.items():
+            html = self.cached_page(profile_url, f"interests:{interest_name}")
+            if html is not None:
+                interest_url = f"{profile_url}/details/interests/?detailScreenTabIndex={tab_index}"
+                scraped_interests[interest_name].extend(
+                    self.extract_snapshot(html, "interests", interest_url, interest_name=interest_name)
+                )
+        return {key: '\n'.join(value) for key, value in scraped_interests.items()}
+
+    def open_interest_tab(self, tab_index):
+        """Click an interest tab in-page, wait for its panel to be shown and load every item of it."""
+        self.driver.execute_script(
+            "const tabs = document.querySelectorAll('div.artdeco-tablist button.artdeco-tab');"
+            "if (tabs[arguments[0]]) tabs[arguments[0]].click();",
+            tab_index
+        )
+        try:
+            # The previous tab's list is still in the page, so wait for this tab's panel itself
+            self.wait_for(lambda driver: driver.execute_script(INTEREST_TAB_SHOWN_SCRIPT, tab_index))
+        except TimeoutException:
+            print(f"Interest tab {tab_index} did not open.")
+        self.load_all_interest_items()
+
+    def load_all_interest_items(self, max_rounds=30):
+        """Scroll and press "Show more" until the visible interest list stops growing."""
+        previous_count = -1
+        for _ in range(max_rounds):
+            count = self.driver.execute_script(INTEREST_LOAD_MORE_SCRIPT, self.selectors.chain("detail_list_items"))
+            if count == previous_count:
+                break
+            previous_count = count
+            self.wait_until_ready('li.pvs-list__paged-list-item')
+        return previous_count
+
     def scrape_profiles_for_you(self, profile_url):
         # Navigate to the "Profiles for You" section of the profile
         profiles_for_you_url = f"{profile_url}/overlay/browsemap-recommendations/"
-        self.driver.get(profiles_for_you_url)
-        self.random_pause()
+        cached_html = self.cached_page(profile_url, "profiles_for_you")
+        if cached_html is not None:
+            return self.extract_snapshot(cached_html, "profiles_for_you", profiles_for_you_url)
+
+        self.navigate(profiles_for_you_url)
+        self.wait_for_page('li.artdeco-list__item')
         self.human_scroll()
 
         profiles_data = []
 
         try:
             # Wait for the list of profile links to load
-            profile_items = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'li.artdeco-list__item'))
-            )
+            selector, profile_items = self.match_field("browsemap_items")
+            self.cache_page(profile_url, "profiles_for_you")
+
+            if self.backend == "snapshot":
+                return self.extract_snapshot(self.driver.page_source, "profiles_for_you", profiles_for_you_url,
+                                             matched={"browsemap_items": selector})
 
             for item in profile_items:
                 try:
@@ -951,54 +1948,130 @@ class LinkedInProfileScraper:
             print(f"Error scraping 'Profiles for You': {e}")
             return "N/A"
 
+    def cached_page(self, profile_url, kind):
+        """
+        HTML of one of the profile's pages from the page cache, or None when it has to be loaded.
+        In cache-only mode a miss returns an empty page, so the extractors produce N/A offline;
+        misses are counted per page kind and reported at the end of the run.
+        """
+        html = self.page_cache.get(profile_url, kind) if self.page_cache else None
+        if html is None and self.cache_only:
+            kind = kind.split(":")[0]  # One count for all interest tabs
+            self.cache_misses[kind] = self.cache_misses.get(kind, 0) + 1
+            return EMPTY_PAGE
+        return html
+
+    def add_cache_misses(self, counts):
+        """Merge a worker's (or worker process's) cache-miss counts into this scraper's report."""
+        for kind, misses in counts.items():
+            self.cache_misses[kind] = self.cache_misses.get(kind, 0) + misses
+
+    def merge_worker_counters(self, worker):
+        """Add a pool worker's cache misses and saved round trips to this scraper's run report."""
+        self.add_cache_misses(worker.cache_misses)
+        self.round_trips_saved += worker.round_trips_saved
+
+    def cache_page(self, profile_url, kind):
+        """Store the currently loaded page in the page cache and the HTML archive."""
+        if not self.page_cache and not self.html_archive:
+            return
+        try:
+            html = self.driver.page_source
+            if self.page_cache:
+                self.page_cache.put(profile_url, kind, html)
+            if self.html_archive:
+                self.html_archive.add(profile_url, kind, html)
+        except Exception as e:
+            print(f"Error caching the {kind} page of {profile_url}: {e}")
+
+    def extract_snapshot(self, html, kind, page_url=None, fields=(), interest_name=None, matched=None):
+        """
+        Parse a page_source snapshot (or a file written by save_html_content) and return
+        the same values the matching live-DOM scrape_* method returns for that page.
+        Fields are looked up through the same fallback chains find_field uses, starting
+        with the selector find_field `matched` on this page, if any.
+        """
+        data = snapshot_parser.extract_page(html, kind, base_url=page_url, fields=fields,
+                                            selectors=self.selectors.chains(matched))
+
+        if kind == "experience":
+            if data is None:
+                return {"Position Title": "N/A", "Company Name": "N/A"}, "N/A", "N/A", "N/A", [], []
+            return self.build_experience_results(data)
+        if kind == "education":
+            if data is None:
+                return "N/A", "N/A", "N/A"
+            return self.build_education_results(data)
+        if kind == "contact":
+            if data is None:
+                return "N/A", "N/A", "N/A"
+            return self.build_contact_results(data)
+        if kind == "interests":
+            return [f"{interest_name}: {name} - URL: {url}" for name, url in data]
+        if kind == "profiles_for_you":
+            if data is None:
+                return "N/A"
+            return "\n".join(
+                f"Name: {entry['name']}, URL: {entry['url']}, Description: {entry['description']}" for entry in data
+            )
+        return data
+
     def scrape_profile(self, url):
-        self.driver.get(url)
-        self.random_pause()
-        self.human_scroll()
+        if self.profile_time_budget is not None:
+            self.profile_deadline = time.monotonic() + self.profile_time_budget
+
+        # Sections finished before a crash are taken from the checkpoint
+        cached_sections = self.checkpoint.load_sections(url) if self.checkpoint and self.resume else {}
+
+        # Each page the selected columns need is loaded exactly once
+        planned = {visit.kind for visit in plan_page_visits(self.include_columns)}
+
+        # A cached copy of the profile page replaces loading it
+        top_card_html = None
+        if "top_card" in planned and "top_card" not in cached_sections:
+            top_card_html = self.cached_page(url, "top_card")
+        if "top_card" in planned and ("top_card" in cached_sections or top_card_html is not None):
+            self.profile_classified = True  # Available when it was saved: a missing sub-page does not block it
+
+        if "top_card" in planned and "top_card" not in cached_sections and top_card_html is None:
+            self.mark_section("load_top_card")
+            self.navigate(url, profile_page=True)
+            self.wait_for_page('h1')
+            self.human_scroll()
 
         result = {
                     "flagshipProfileUrl": url
                 }
-
-        # Define column-method mappings
-        METHOD_COLUMN_MAP = {
-            "scrape_name": {"fullName"},
-            "scrape_summary": {"summary"},
-            "scrape_headline": {"headline"},
-            "scrape_location": {"location"},
-            "scrape_connections": {"numOfConnections"},
-            "scrape_degree": {"Degree"},
-            "scrape_contact_info": {"ContactInfo", "Birthday", "ConnectedOn"},
-            "scrape_experience": {
-                "Position Title", "Position Description", "Company Name",
-                "More Positions", "Descriptions", "Skills"
-            },
-            "scrape_education": {"Education Degree", "SchoolName", "More Educations"},
-            "scrape_total_experience": {"Total Years of Exp(in Yrs)"},
-            "scrape_current_firm_experience": {"Exp in Current Firm(In Yrs.Months)"},
-            "scrape_interests": {
-                "Interest: Groups", "Interest: Newsletters",
-                "Interest: Companies", "Interest: Top Voices",
-                "Interest: Schools"
-            },
-            "scrape_profiles_for_you": {"Profiles for You"},
-            "scrape_connection_status": {"Connection Status"},  # New Column
-
-        }
-
-        if METHOD_COLUMN_MAP["scrape_name"].intersection(self.include_columns):
+        for section_data in cached_sections.values():
+            result.update(section_data)
+
+        # The snapshot backend parses every top-card field from one page_source copy,
+        # the probe mode reads them all with one script call after a single wait
+        scrape_top_card = "top_card" in planned and "top_card" not in cached_sections
+        live_top_card = scrape_top_card and top_card_html is None and self.backend != "snapshot" and self.top_card_mode != "probe"
+        if scrape_top_card and top_card_html is not None:
+            self.mark_section("scrape_top_card")
+            result.update(self.extract_snapshot(top_card_html, "top_card", url, fields=TOP_CARD_COLUMNS.intersection(self.include_columns)))
+        elif scrape_top_card and self.backend == "snapshot":
+            self.mark_section("scrape_top_card")
+            result.update(self.scrape_top_card_snapshot(url))
+        elif scrape_top_card and not live_top_card:
+            self.mark_section("scrape_top_card")
+            result.update(self.scrape_top_card_probe())
+
+        if live_top_card and METHOD_COLUMN_MAP["scrape_name"].intersection(self.include_columns):
+            self.mark_section("scrape_name")
             try:
                 # Scrape full name from the h1 tag
-                full_name = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.TAG_NAME, 'h1'))
-                ).text
+                full_name = self.find_field("fullName").text
             except Exception as e:
                 full_name = "N/A"
                 print(f"Failed to scrape name: {e}")
             result["fullName"] = full_name
             
 
-        if METHOD_COLUMN_MAP["scrape_summary"].intersection(self.include_columns):
+        if live_top_card and METHOD_COLUMN_MAP["scrape_summary"].intersection(self.include_columns):
+            self.mark_section("scrape_summary")
             try:
                 # Locate all sections with the potential "About" heading
                 sections = self.driver.find_elements(By.CSS_SELECTOR, 'section.artdeco-card')
@@ -1013,7 +2086,7 @@ class LinkedInProfileScraper:
 
                         if heading_text == "About":
                             # Locate the summary within the correct "About" section
-                            summary_element = section.find_element(By.CSS_SELECTOR, 'div.display-flex.ph5.pv3 span[aria-hidden="true"]')
+                            summary_element = self.find_field_in(section, "summary")
                             summary = summary_element.text.strip()
 
                             # Check for unwanted phrases
@@ -1033,24 +2106,22 @@ class LinkedInProfileScraper:
             # Add the scraped or default summary to the result
             result["summary"] = summary
 
-        if METHOD_COLUMN_MAP["scrape_headline"].intersection(self.include_columns):
+        if live_top_card and METHOD_COLUMN_MAP["scrape_headline"].intersection(self.include_columns):
+            self.mark_section("scrape_headline")
             try:
                 # Scrape headline from the div with class text-body-medium
-                headline = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, 'div.text-body-medium'))
-                ).text
+                headline = self.find_field("headline").text
             except Exception as e:
                 headline = "N/A"
                 print(f"Failed to scrape headline: {e}")
             result["headline"] = headline
 
         # Check for "Connection Status"
-        if METHOD_COLUMN_MAP["scrape_connection_status"].intersection(self.include_columns):
+        if live_top_card and METHOD_COLUMN_MAP["scrape_connection_status"].intersection(self.include_columns):
+            self.mark_section("scrape_connection_status")
             try:
                 # Locate the svg icon first, then find its parent button
-                clock_svg = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, 'svg[data-test-icon="clock-small"]'))
-                )
+                clock_svg = self.find_field("connection_status")
                 pending_button = clock_svg.find_element(By.XPATH, './ancestor::button')
                 
                 # Verify the button contains the "Pending" text
@@ -1063,22 +2134,22 @@ class LinkedInProfileScraper:
 
             result["Connection Status"] = connection_status
         
-        if METHOD_COLUMN_MAP["scrape_location"].intersection(self.include_columns):
+        if live_top_card and METHOD_COLUMN_MAP["scrape_location"].intersection(self.include_columns):
+            self.mark_section("scrape_location")
             try:
                 # Scraping the location
-                location = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, 'span.text-body-small.inline.t-black--light.break-words'))
-                ).text
+                location = self.find_field("location").text
             except Exception as e:
                 location = "N/A"
                 print(f"Failed to scrape location: {e}")
             result["location"] = location
             
         
-        if METHOD_COLUMN_MAP["scrape_connections"].intersection(self.include_columns):
+        if live_top_card and METHOD_COLUMN_MAP["scrape_connections"].intersection(self.include_columns):
+            self.mark_section("scrape_connections")
             try:
                 # Scrape number of followers or connections
-                num_of_connections = self.driver.find_element(By.CSS_SELECTOR, 'p.text-body-small').text
+                num_of_connections = self.find_field("connections", timeout=0).text  # Present once the top card is
 
                 # Use regex to extract only the first numeric value and remove commas
                 match = re.search(r'\d{1,3}(?:,\d{3})*', num_of_connections)  # Extracts the first occurrence like 1,600
@@ -1093,19 +2164,24 @@ class LinkedInProfileScraper:
                 print(f"Failed to scrape followers: {e}")
             result["numOfConnections"] = num_of_connections
 
-        if METHOD_COLUMN_MAP["scrape_degree"].intersection(self.include_columns):
+        if live_top_card and METHOD_COLUMN_MAP["scrape_degree"].intersection(self.include_columns):
+            self.mark_section("scrape_degree")
             try:
                 # Scrape degree information
-                degree_element = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, 'span.dist-value'))
-                )
+                degree_element = self.find_field("degree")
                 degree = degree_element.text.strip()  # Get the degree text (e.g., '3rd')
             except Exception as e:
                 degree = "N/A"
                 print(f"Failed to scrape degree: {e}")
             result["Degree"] = degree
 
-        if METHOD_COLUMN_MAP["scrape_contact_info"].intersection(self.include_columns):        
+        if scrape_top_card and top_card_html is None:
+            self.cache_page(url, "top_card")
+        if scrape_top_card:
+            self.checkpoint_section(url, "top_card", result, TOP_CARD_COLUMNS)
+
+        if "contact" in planned and "contact" not in cached_sections:
+            self.mark_section("scrape_contact_info")
             try:
                 contact_info, birthday, connected_on = self.scrape_contact_info(url)
             except:
@@ -1115,8 +2191,10 @@ class LinkedInProfileScraper:
             result["ContactInfo"] = contact_info
             result["Birthday"] = birthday
             result["ConnectedOn"] = connected_on
+            self.checkpoint_section(url, "contact", result, METHOD_COLUMN_MAP["scrape_contact_info"])
 
-        if METHOD_COLUMN_MAP["scrape_experience"].intersection(self.include_columns):
+        if "experience" in planned and "experience" not in cached_sections:
+            self.mark_section("scrape_experience")
             # Call scrape_experience with profile URL
             current_positions, more_positions, more_descriptions, more_skills, experiences, current_firm_experiences = self.scrape_experience(url)
 
@@ -1142,9 +2220,12 @@ class LinkedInProfileScraper:
                 "Descriptions": more_descriptions,
                 "Skills": more_skills,
             })
-            
+            self.checkpoint_section(url, "experience", result, METHOD_COLUMN_MAP["scrape_experience"].union(
+                METHOD_COLUMN_MAP["scrape_total_experience"], METHOD_COLUMN_MAP["scrape_current_firm_experience"]
+            ))
 
-        if METHOD_COLUMN_MAP["scrape_education"].intersection(self.include_columns):
+        if "education" in planned and "education" not in cached_sections:
+            self.mark_section("scrape_education")
             # Call scrape_education with profile URL
             education_degree, school_name, more_educations = self.scrape_education(url)
             result.update({
@@ -1152,8 +2233,10 @@ class LinkedInProfileScraper:
                 "SchoolName": school_name,
                 "More Educations": more_educations,
             })
+            self.checkpoint_section(url, "education", result, METHOD_COLUMN_MAP["scrape_education"])
 
-        if METHOD_COLUMN_MAP["scrape_interests"].intersection(self.include_columns):
+        if "interests" in planned and "interests" not in cached_sections:
+            self.mark_section("scrape_interests")
             # Scrape interests and map to the correct columns
             interest_data = self.scrape_interests(url)
             result.update({
@@ -1163,8 +2246,10 @@ class LinkedInProfileScraper:
                 "Interest: Top Voices": interest_data.get("Top Voices", "N/A"),
                 "Interest: Schools": interest_data.get("Schools", "N/A"),
             })
+            self.checkpoint_section(url, "interests", result, METHOD_COLUMN_MAP["scrape_interests"])
 
-        if METHOD_COLUMN_MAP["scrape_profiles_for_you"].intersection(self.include_columns):
+        if "profiles_for_you" in planned and "profiles_for_you" not in cached_sections:
+            self.mark_section("scrape_profiles_for_you")
             try:
                 # Call scrape_profiles_for_you with the current profile URL
                 profiles_for_you_data = self.scrape_profiles_for_you(url)
@@ -1172,9 +2257,74 @@ class LinkedInProfileScraper:
             except Exception as e:
                 result["Profiles for You"] = "N/A"
                 print(f"Failed to scrape 'Profiles for You' section: {e}")
+            self.checkpoint_section(url, "profiles_for_you", result, METHOD_COLUMN_MAP["scrape_profiles_for_you"])
 
         return {k: v for k, v in result.items() if k in self.include_columns}
 
+    def describe_plan(self):
+        """Print the page loads per profile for this scraper's columns and settings (dry run)."""
+        return describe_plan(self.include_columns, f"{self.base_url}/in/<profile>", interests_mode=self.interests_mode)
+
+    def checkpoint_section(self, url, section, result, columns):
+        """Record the columns a finished section added to `result`."""
+        if not self.checkpoint or self.page_state not in (None, "normal") or self.load_timed_out:
+            return  # Nothing from a blocked or timed-out profile is kept
+        if self.budget_exhausted:
+            return  # A section cut short by the time budget is scraped again by a resumed run
+        try:
+            self.checkpoint.save_section(url, section, {k: v for k, v in result.items() if k in columns})
+        except Exception as e:
+            print(f"Error saving checkpoint for {url} ({section}): {e}")
+
+    def scrape_top_card_probe(self):
+        """Wait once for the top card, then resolve every requested field with a single probe."""
+        fields = TOP_CARD_COLUMNS.intersection(self.include_columns)
+        if not fields:
+            return {}
+
+        probe = {}
+        try:
+            self.find_field("fullName")
+            probe = self.driver.execute_script(TOP_CARD_PROBE_SCRIPT, self.selectors.chains()) or {}
+        except Exception as e:
+            print(f"Top card did not load: {e}")
+
+        # Absent elements resolve immediately to the same defaults the per-field waits produce
+        result = {
+            "fullName": probe.get("fullName") or "N/A",
+            "headline": probe.get("headline") or "N/A",
+            "location": probe.get("location") or "N/A",
+            "Degree": probe.get("degree") or "N/A",
+        }
+
+        summary = probe.get("summary") or "N/A"
+        if "You've previously worked with" in summary or "You've previously worked together" in summary:
+            summary = "N/A"
+        result["summary"] = summary
+
+        pending = probe.get("pending") or ""
+        result["Connection Status"] = pending if "Pending" in pending else "-"
+
+        match = re.search(r'\d{1,3}(?:,\d{3})*', probe.get("connections") or "")
+        result["numOfConnections"] = int(match.group(0).replace(',', '')) if match else "N/A"
+
+        return {k: v for k, v in result.items() if k in fields}
+
+    def scrape_top_card_snapshot(self, url):
+        """Parse the requested top-card fields from a single snapshot of the loaded profile page."""
+        fields = TOP_CARD_COLUMNS.intersection(self.include_columns)
+        if not fields:
+            return {}
+
+        matched = {}
+        try:
+            # Wait once for the top card instead of once per field
+            matched["fullName"], _ = self.match_field("fullName")
+        except Exception as e:
+            print(f"Top card did not load: {e}")
+
+        return self.extract_snapshot(self.driver.page_source, "top_card", url, fields=fields, matched=matched)
+
     def calculate_current_firm_experience(self, current_firm_experiences):
         """
         Calculate the total experience for current firm experiences.
@@ -1256,23 +2406,7 @@ class LinkedInProfileScraper:
 
             # Write data rows
             for row in data:
-                row_data = []
-                for col in ordered_columns:
-                    if col == "flagshipProfileUrl":
-                        url = row.get("flagshipProfileUrl", "")
-                        title = self.generate_custom_title(row.get("fullName", ""), row.get("summary", ""))
-                        if title != "No Title Available":
-                            # Add hyperlink with the generated title
-                            # cell = f'=HYPERLINK("{url}", "{title}")'
-                            cell = f'=HYPERLINK("{url}", "{url}")'
-                        else:
-                            # Use the URL as-is
-                            cell = f'=HYPERLINK("{url}", "{url}")'
-                        row_data.append(cell)
-                    else:
-                        # Add normal data for other columns
-                        row_data.append(row.get(col, "N/A"))
-                sheet.append(row_data)
+                sheet.append(excel_row(row, ordered_columns))
 
             # Save the workbook
             workbook.save(output_file)
@@ -1289,70 +2423,286 @@ class LinkedInProfileScraper:
         except Exception as e:
             print(f"Error saving to {output_file}: {e}")
 
-    def run(self):
-        self.login()
-        profiles_data = []
+    def harvest_key(self):
+        """Identifies the harvest settings: the connection range, or the Excel file's path and contents."""
+        if not self.excel_file_path:
+            return f"range:{self.connection_range[0]}-{self.connection_range[1]}"
+        try:
+            with open(self.excel_file_path, "rb") as file:
+                digest = hashlib.sha256(file.read()).hexdigest()
+        except OSError:
+            digest = "unreadable"
+        return f"excel:{self.excel_file_path}:{digest}"
+
+    def iter_harvest(self):
+        """Yield the pending connections to scrape as they are harvested, reusing the checkpointed list when resuming."""
+        harvest_key = self.harvest_key()
+
+        if self.checkpoint and self.resume:
+            pending_connections = self.checkpoint.load_harvest(harvest_key)
+            if pending_connections is not None:
+                print(f"Resuming with {len(pending_connections)} checkpointed connections.")
+                yield from pending_connections
+                return
 
         # Load URLs from Excel if the file path is provided
         if self.excel_file_path:
             print("Retrieving data for URLs from Excel file...")
-            pending_connections = self.get_excel_connection_urls()
+            connections = self.iter_excel_connections()
         else:
             print("Retrieving URLs via scraping...")
-            pending_connections = self.get_unanswered_connection_urls(self.connection_range)
+            connections = self.iter_unanswered_connections(self.connection_range)
+
+        pending_connections = []
+        for connection in connections:
+            pending_connections.append(connection)
+            yield connection
+
+        # Only a complete harvest is checkpointed
+        if self.checkpoint:
+            self.checkpoint.save_harvest(harvest_key, pending_connections)
+
+    def harvest_connections(self):
+        """Collect the pending connections to scrape, reusing the checkpointed list when resuming."""
+        return list(self.iter_harvest())
+
+    def open_output_sink(self):
+        """Return the streaming writer for run(), or None when the workbook is rewritten after every profile."""
+        if self.output_mode != "stream":
+            return None
+        return StreamingExcelSink(self.output_file, self.include_columns)
+
+    def connection_url(self, connection):
+        """Return the profile URL of a harvested connection entry, or None if the entry is unusable."""
+        if not isinstance(connection, dict):
+            print(f"Skipping malformed connection entry: {connection}")
+            return None  # Skip if not a valid dictionary
+
+        url = connection.get("profile_url", "")
+
+        # Ensure `url` is extracted correctly
+        if isinstance(url, dict):
+            url = url.get("profile_url", "")
+
+        if not isinstance(url, str) or not url.strip():
+            print(f"Skipping invalid URL: {url}")
+            return None  # Skip invalid or empty URLs
+        return url.strip().rstrip("/")  # Sub-page URLs are built by appending "/details/..."
+
+    def scrape_connection(self, url, connection):
+        """Scrape one harvested connection and return its output row, or None on failure."""
+        message = connection.get("message", "N/A")
+        sent_time = connection.get("sent_time", "N/A")
+
+        print(f"Scraping profile: {url}...")  # ✅ Ensure each URL is different
+
+        if self.metrics:
+            self.profile_metrics = ProfileMetrics(url)
+        status = "error"
+        self.page_state = "normal"  # navigate() classifies every page of this profile
+        self.profile_classified = False  # Whether a page of it has been classified yet
+        self.load_timed_out = False
+        self.budget_exhausted = False
+
+        try:
+            # scrape_profile loads every page it needs itself
+            lost_before = self.timeout_seconds_lost
+            profile_data = self.scrape_profile(url)
+            print(f"Time lost to timeouts: {self.timeout_seconds_lost - lost_before:.1f}s (total {self.timeout_seconds_lost:.1f}s)")
+            if self.page_state != "normal":
+                raise BlockedPage(self.page_state, url)  # A section swallowed it; its N/A columns are not a row
+            if self.load_timed_out:
+                raise PageLoadTimeout(url)  # Likewise for a page that never loaded
+            status = "ok"
+
+            # ✅ **Ensure data is tied to the specific profile**
+            profile_data["profile_url"] = url
+            profile_data["message"] = message
+            profile_data["sent time"] = sent_time
+            return profile_data
+        except BlockedPage as e:
+            status = e.state
+            print(f"Stopped scraping {url}: {e}")
+            return None
+        except Exception as e:
+            print(f"Error scraping {url}: {e}")
+            return None
+        finally:
+            self.last_page_state, self.page_state = self.page_state, None
+            self.last_load_timed_out, self.load_timed_out = self.load_timed_out, False
+            self.last_budget_exhausted, self.budget_exhausted = self.budget_exhausted, False
+            self.profile_deadline = None  # Waits outside profile scraping are not budgeted
+            if self.profile_metrics is not None:
+                report = self.profile_metrics.finish(status)
+                self.profile_metrics = None
+                self.metrics.record(report)
+                print(f"Profile time: {report['seconds']:.1f}s (sleep {report['sleep']:.1f}s, wait {report['wait']:.1f}s, "
+                      f"active {report['active']:.1f}s, {report['round_trips']} WebDriver calls)")
+
+    def handle_blocked_page(self, url, state):
+        """Back off after a blocked profile page; returns whether the profile is worth trying again."""
+        if state == "unavailable":
+            print(f"{url} is unavailable; skipping it.")
+            return False
 
+        # Every worker (and every process sharing the rate state) waits out the backoff
+        self.governor.back_off(state, self.backoff_base, self.backoff_max)
+        if state == "login_wall":
+            self.driver_cache.mark_session(self.user_data_dir, valid=False)
+            try:
+                restored = self.restore_session()
+            except Exception as e:
+                print(f"Error restoring the session: {e}")
+                restored = False
+            if not restored:
+                print("Session expired and cookies.pkl could not restore it.")
+                return False
+            self.driver_cache.mark_session(self.user_data_dir)
+        return True
+
+    def scrape_job(self, url, connection):
+        """Return the output row for one connection, from the checkpoint when an earlier run finished it."""
+        # Profiles finished by an earlier run are re-emitted from the checkpoint, not re-scraped
+        profile_data = self.checkpoint.completed_row(url) if self.checkpoint and self.resume else None
+        if profile_data is not None:
+            print(f"Skipping completed profile: {url}")
+            return profile_data
+
+        for attempt in range(self.block_retries + 1):
+            if self.lifecycle:
+                profile_data = self.lifecycle.scrape(url, connection)  # Retried in a new browser if this one dies
+            else:
+                profile_data = self.scrape_connection(url, connection)
+            if self.last_page_state in (None, "normal"):
+                self.governor.clear_backoff()
+                break
+            if not self.handle_blocked_page(url, self.last_page_state):
+                break
+            if attempt < self.block_retries:
+                print(f"Re-queueing {url} after the {self.last_page_state} page.")
+        if profile_data is not None and self.page_cache and not self.cache_only:
+            self.page_cache.put_connection(url, connection)
+        if profile_data is not None and self.checkpoint and self.last_budget_exhausted:
+            self.checkpoint.mark_profile_partial(url, profile_data)  # Its N/A columns are filled by a resumed run
+        elif profile_data is not None and self.checkpoint:
+            self.checkpoint.mark_profile_done(url, profile_data)
+        elif self.checkpoint and self.last_page_state not in (None, "normal"):
+            self.checkpoint.mark_profile_blocked(url, self.last_page_state)  # Scraped again by a resumed run
+        return profile_data
+
+    def iter_jobs(self, pending_connections):
+        """Validate and de-duplicate harvested connections into (url, connection) jobs as they arrive."""
         processed_urls = set()  # Track URLs to ensure no duplicates
 
         for connection in pending_connections:
-            if not isinstance(connection, dict):
-                print(f"Skipping malformed connection entry: {connection}")
-                continue  # Skip if not a valid dictionary
-            
-            url = connection.get("profile_url", "").strip()
-
-            # Ensure `url` is extracted correctly
-            if isinstance(url, dict):  
-                url = url.get("profile_url", "").strip()
+            url = self.connection_url(connection)
+            if not url:
+                continue
 
-            if not isinstance(url, str) or not url:
-                print(f"Skipping invalid URL: {url}")
-                continue  # Skip invalid or empty URLs
-            
             # 🚀 **Fix duplicate URL issue**
             if url in processed_urls:
                 print(f"Skipping duplicate URL: {url}")
                 continue
             processed_urls.add(url)  # Add to processed URLs set
+            yield url, connection
 
-            message = connection.get("message", "N/A")
-            sent_time = connection.get("sent_time", "N/A")
+    def build_jobs(self, pending_connections):
+        """Validate and de-duplicate harvested connections into (url, connection) jobs."""
+        return list(self.iter_jobs(pending_connections))
 
-            print(f"Scraping profile: {url}...")  # ✅ Ensure each URL is different
+    def scrape_jobs(self, jobs):
+        """Yield one row per job in input order, using the worker pool when more than one worker is configured."""
+        if self.workers <= 1 or self.cache_only:
+            for url, connection in jobs:
+                yield self.scrape_job(url, connection)
+            return
 
-            try:
-                # Ensure **each profile is actually scraped fresh**
-                self.driver.get(url)  
-                time.sleep(2)  # Give time for page to load before scraping
+        pool = ScraperPool(self, self.workers, pace_interval=self.pace_interval)
+        try:
+            yield from pool.imap(jobs)
+        finally:
+            pool.shutdown()
+
+    def run(self):
+        if self.checkpoint and not self.resume:
+            self.checkpoint.reset()  # A fresh run starts with an empty checkpoint
+        if self.checkpoint and self.checkpoint.use_columns(self.include_columns):
+            print("INCLUDE_COLUMNS changed since the checkpoint was written; scraping every profile again.")
+        if self.checkpoint and self.resume:
+            blocked = self.checkpoint.blocked_profiles()
+            if blocked:
+                print(f"Retrying {len(blocked)} profile(s) the previous run gave up on after blocked pages.")
+            partial = self.checkpoint.partial_profiles()
+            if partial:
+                print(f"Finishing {len(partial)} profile(s) the previous run's time budget cut short.")
+
+        if self.cache_only:
+            # Re-extract every cached profile without a browser
+            rows = self.scrape_jobs(self.build_jobs(self.page_cache.connections()))
+        elif self.pipeline:
+            self.login()
+            # Rows arrive while the harvest is still running
+            rows = ScraperPipeline(self, self.workers, self.pace_interval, self.queue_size).rows()
+        else:
+            self.login()
+            pending_connections = self.harvest_connections()
+            jobs = self.build_jobs(pending_connections)
+            rows = self.scrape_jobs(jobs)
+        sink = self.open_output_sink()
+        profiles_data = None if sink else []  # Only the workbook mode keeps every row to rewrite the xlsx
 
-                profile_data = self.scrape_profile(url)
+        try:
+            for profile_data in rows:
+                if profile_data is None:
+                    continue
 
-                # ✅ **Ensure data is tied to the specific profile**
-                profile_data["profile_url"] = url
-                profile_data["message"] = message
-                profile_data["sent time"] = sent_time
+                if sink:
+                    # Appended once to the journal by the writer thread
+                    sink.write(profile_data)
+                else:
+                    profiles_data.append(profile_data)
 
-                profiles_data.append(profile_data)
+                    # Save progress (avoids losing data if script crashes)
+                    self.save_to_excel(profiles_data)
+        finally:
+            rows.close()  # Stop the workers and close their browsers
 
-                # Save progress (avoids losing data if script crashes)
-                self.save_to_excel(profiles_data)
-            except Exception as e:
-                print(f"Error scraping {url}: {e}")
-                continue
+            # Build the final workbook from the journal once
+            if sink:
+                sink.close()
 
         # Final cleanup
-        self.driver.quit()
+        self.selectors.save()
+        print(self.selectors.report())
+        if self.round_trips_saved:
+            print(f"Experience script mode saved {self.round_trips_saved} WebDriver round trips.")
+        self.quit_driver()
+        if self.rate_limited or self.governor.backoffs:
+            print(self.governor.report())
+        if self.page_cache:
+            stats = self.page_cache.stats()
+            print(f"Page cache: {stats['hits']} hits, {stats['misses']} misses, {stats['entries']} pages in {stats['bytes'] / 1e6:.1f} MB")
+            if self.cache_misses:
+                print("Pages missing from the cache (their columns are N/A): " +
+                      ", ".join(f"{kind} {count}" for kind, count in sorted(self.cache_misses.items())))
+            self.page_cache.close()
+        if self.html_archive:
+            self.html_archive.close()
+        if self.checkpoint:
+            self.checkpoint.close()
+        if self.invitation_index:
+            self.invitation_index.close()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrape LinkedIn profiles of pending connections.")
+    parser.add_argument("--resume", action="store_true", help="Continue the previous run from its checkpoint")
+    parser.add_argument("--dry-run", action="store_true", help="Print the page loads per profile for INCLUDE_COLUMNS and exit")
+    parser.add_argument("--metrics", help="Append per-profile timings and WebDriver call counts to this JSONL file")
+    parser.add_argument("--prometheus", help="Write aggregate histograms to this Prometheus textfile")
+    parser.add_argument("--cache-only", action="store_true", help="Re-extract profiles from the page cache without a browser")
+    parser.add_argument("--base-url", default="https://www.linkedin.com", help="Site to scrape, e.g. http://127.0.0.1:8765 for mock_linkedin.py")
+    args = parser.parse_args()
+
     # Columns to include in the output
     INCLUDE_COLUMNS = [
         "fullName",
@@ -1387,6 +2737,7 @@ if __name__ == "__main__":
         "message",
         "sent time",
     ]
+
     output_file = "linkedin_output.xlsx"  # Output file
     connection_range = (92, 94)  # Specify the range of connections to scrape
     excel_file_path = "linkedin_profiles.xlsx"  # Replace with actual Excel file path or set to None
@@ -1395,6 +2746,46 @@ if __name__ == "__main__":
         include_columns=INCLUDE_COLUMNS,
         connection_range=connection_range,
         # excel_file_path=excel_file_path  # Pass the Excel file path here
+        # experience_mode="script",  # Extract the experience list in a single execute_script call
+        # backend="snapshot",  # Parse one page_source snapshot per page with lxml instead of live DOM lookups
+        # output_mode="workbook",  # Rewrite the whole workbook after every profile instead of streaming rows
+        resume=args.resume,
+        base_url=args.base_url,
+        metrics_file=args.metrics,
+        # page_cache_dir="page_cache",  # Keep compressed snapshots of every page to re-run with other columns
+        # cache_ttl=7 * 24 * 3600,  # Seconds a cached page stays valid
+        # cache_max_bytes=2 * 1024 ** 3,  # Evict the oldest pages beyond this size
+        cache_only=args.cache_only,
+        launch_browser=not args.dry_run,
+        # selector_stats_file=None,  # Keep selector hit rates in memory only
+        # browser_profile="lean",  # Block images, media, fonts and analytics; see benchmarks/page_weight.py
+        # headless=True,  # No window; the viewport is window_size
+        # user_data_dir="chrome_profile",  # Keep the browser profile (and login) between runs for a warm start
+        # browser_binary="/usr/bin/chromium",  # Chrome to run; also settable with $CHROME_BINARY
+        # recycle_every=200,  # Restart the browser every 200 profiles to shed leaked memory
+        # max_memory_mb=3000,  # ...or as soon as the browser's processes use more than this
+        # max_pages_per_minute=8,  # Page-load budget for the account, shared by all workers
+        # max_pages_per_hour=300,
+        # rate_state_file="rate_state.json",  # Share the budget with other scraper processes on this machine
+        # detect_blocks=False,  # Don't classify pages for login walls, challenges and throttling
+        # backoff_base=120,  # First backoff after a blocked page (seconds), doubled per block in a row
+        # html_archive_dir="html_archive",  # Append every loaded page to a compressed, URL-indexed archive
+        prometheus_file=args.prometheus,
+        # workers=3,  # Browser processes scraping profiles in parallel, all seeded from cookies.pkl
+        # pipeline=True,  # Harvest invitations in this browser while `workers` other browsers scrape profiles
+        # queue_size=20,  # Jobs and rows buffered between pipeline stages
+        # pace_interval=5,  # Minimum seconds between profile starts across all workers
+        # wait_strategy="ready",  # Continue as soon as each page has settled instead of sleeping a fixed time
+        # floor_delay=(0.5, 1.0),  # Deliberate pause after each page in "ready" mode
+        # top_card_mode="probe",  # One wait for the top card, then every optional field in a single probe
+        # profile_time_budget=60,  # Cap the total waiting per profile (seconds)
+        # interests_mode="tabs",  # Load the interests page once and switch tabs in-page
+        # invitation_index_file="invitations.db",  # Keep a local index of sent invitations for Excel-mode lookups
+        # invitation_page_size=None,  # Always scroll from page 1 instead of jumping to the page holding connection_range
     )
 
+    if args.dry_run:
+        scraper.describe_plan()
+        raise SystemExit(0)
+
     scraper.run()
\ No newline at end of file
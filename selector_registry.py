@@ -0,0 +1,168 @@
+import os
+import json
+import tempfile
+import threading
+from collections import deque
+
+# Ordered fallback selectors (CSS) for every field the live scrapers wait for.
+# The first entry is the selector the scraper has always used.
+SELECTOR_FALLBACKS = {
+    "fullName": ['h1', 'div.pv-text-details__left-panel h1'],
+    "headline": ['div.text-body-medium', 'div[data-generated-suggestion-target]'],
+    "location": [
+        'span.text-body-small.inline.t-black--light.break-words',
+        'div.pv-text-details__left-panel span.text-body-small.inline',
+        'span.text-body-small.inline',
+    ],
+    "degree": ['span.dist-value', 'span.distance-badge span.visually-hidden'],
+    "connection_status": ['svg[data-test-icon="clock-small"]', 'button[aria-label^="Pending"] svg'],
+    "connections": ['p.text-body-small', 'ul.pv-top-card--list li.text-body-small'],
+    "summary": [
+        'div.display-flex.ph5.pv3 span[aria-hidden="true"]',
+        'div.inline-show-more-text span[aria-hidden="true"]',
+    ],
+    "detail_list_items": ['li.pvs-list__paged-list-item', 'div.pvs-list__container li.artdeco-list__item'],
+    "browsemap_items": ['li.artdeco-list__item', 'section.artdeco-card li.pvs-list__paged-list-item'],
+    "contact_modal": ['div.artdeco-modal__content', 'section.pv-contact-info'],
+}
+
+# Fields every loaded page of their kind has. The others (pending badge, degree,
+# summary...) are legitimately absent on many profiles, so their hit rate follows
+# the profile mix and says nothing about a broken selector.
+REQUIRED_FIELDS = {"fullName", "detail_list_items", "contact_modal"}
+
+
+class SelectorRegistry:
+    """
+    Fallback chains for field selectors with persisted per-selector hit counts.
+    chain() orders a field's selectors by smoothed hit rate, so a variant that
+    stopped matching drops behind the one that works. Each field also keeps a rolling
+    window of outcomes; when the recent hit rate of a required field collapses against
+    its history an alert is printed and timeout() shortens the wait for that field.
+    """
+
+    def __init__(self, path="selector_stats.json", fallbacks=None, window=50, collapse_ratio=0.5,
+                 collapsed_timeout=2, save_every=100, required_fields=None):
+        self.path = path
+        self.fallbacks = fallbacks or SELECTOR_FALLBACKS
+        self.required_fields = REQUIRED_FIELDS if required_fields is None else required_fields
+        self.window = window
+        self.collapse_ratio = collapse_ratio
+        self.collapsed_timeout = collapsed_timeout
+        self.save_every = save_every
+        self.lock = threading.Lock()
+        self.selector_counts = {}  # field -> {selector: [hits, misses]}
+        self.field_counts = {}  # field -> [hits, attempts]
+        self.recent = {}  # field -> deque of recent outcomes
+        self.collapsed = set()
+        self.unsaved = 0
+        self.load()
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                stats = json.load(file)
+            self.selector_counts = stats.get("selectors", {})
+            self.field_counts = stats.get("fields", {})
+        except Exception as e:
+            print(f"Error loading selector stats from {self.path}: {e}")
+
+    def save(self):
+        if not self.path:
+            return
+        with self.lock:
+            # Serialized under the lock: pool threads keep recording while the file is written
+            stats = json.dumps({"selectors": self.selector_counts, "fields": self.field_counts}, indent=2)
+            self.unsaved = 0
+        temp_path = None
+        try:
+            # A temp file per call, so concurrent saves never write into each other's file
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=os.path.dirname(os.path.abspath(self.path)),
+                                             prefix=f"{os.path.basename(self.path)}.", suffix=".tmp", delete=False) as file:
+                temp_path = file.name
+                file.write(stats)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            print(f"Error saving selector stats to {self.path}: {e}")
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def chain(self, field, first=None):
+        """
+        The field's selectors, historically most successful first (ties keep the default order).
+        `first` moves a selector already seen to match on the current page to the front.
+        """
+        counts = self.selector_counts.get(field, {})
+
+        def rate(selector):
+            hits, misses = counts.get(selector, (0, 0))
+            return (hits + 1) / (hits + misses + 2)
+
+        chain = sorted(self.fallbacks[field], key=rate, reverse=True)
+        if first is not None:
+            chain = [first] + [selector for selector in chain if selector != first]
+        return chain
+
+    def chains(self, matched=None):
+        """
+        Every field's chain, for extractors that run outside find_field (snapshots and scripts).
+        `matched` maps fields to the selector find_field matched on the page being extracted.
+        """
+        matched = matched or {}
+        return {field: self.chain(field, matched.get(field)) for field in self.fallbacks}
+
+    def timeout(self, field, default):
+        """Seconds to wait for a field: short while its hit rate has collapsed."""
+        return min(default, self.collapsed_timeout) if field in self.collapsed else default
+
+    def record(self, field, chain, matched):
+        """Record one lookup: `matched` is the selector that hit, or None when the whole chain missed."""
+        with self.lock:
+            counts = self.selector_counts.setdefault(field, {})
+            for selector in chain:
+                entry = counts.setdefault(selector, [0, 0])
+                if selector == matched:
+                    entry[0] += 1
+                    break
+                entry[1] += 1  # Tried before the match and not present
+
+            totals = self.field_counts.setdefault(field, [0, 0])
+            history_rate = totals[0] / totals[1] if totals[1] else None
+            totals[0] += matched is not None
+            totals[1] += 1
+
+            recent = self.recent.setdefault(field, deque(maxlen=self.window))
+            recent.append(matched is not None)
+            self._check_collapse(field, recent, history_rate)
+
+            self.unsaved += 1
+            save_now = self.unsaved >= self.save_every
+
+        if save_now:
+            self.save()
+
+    def _check_collapse(self, field, recent, history_rate):
+        if field not in self.required_fields or len(recent) < self.window or not history_rate:
+            return
+        recent_rate = sum(recent) / len(recent)
+        if recent_rate < history_rate * self.collapse_ratio:
+            if field not in self.collapsed:
+                self.collapsed.add(field)
+                print(f"ALERT: selector hit rate for '{field}' fell to {recent_rate:.0%} (historically {history_rate:.0%}). "
+                      f"Tried: {', '.join(self.chain(field))}")
+        elif field in self.collapsed:
+            self.collapsed.discard(field)
+            print(f"Selector hit rate for '{field}' recovered to {recent_rate:.0%}.")
+
+    def report(self):
+        """Hit rate of every field and selector, for logging at the end of a run."""
+        lines = []
+        for field in sorted(self.field_counts):
+            hits, attempts = self.field_counts[field]
+            lines.append(f"{field}: {hits}/{attempts} found")
+            for selector in self.chain(field):
+                selector_hits, misses = self.selector_counts.get(field, {}).get(selector, (0, 0))
+                lines.append(f"    {selector_hits:>6} hit {misses:>6} miss  {selector}")
+        return "\n".join(lines)
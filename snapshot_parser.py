@@ -0,0 +1,386 @@
+import re
+import lxml.html
+
+from selector_registry import SELECTOR_FALLBACKS
+
+# Host-side extraction from a single page_source snapshot. Every function here
+# uses the same selectors as the live-DOM scrape_* methods in scraper.py (for the
+# registry fields, the fallback chains in `selectors`, best first) and returns plain
+# picklable data, so it can run on HTML saved by save_html_content or in a worker
+# process while the browser loads the next page.
+
+RELEVANT_INTERESTS = ['Groups', 'Newsletters', 'Companies', 'Top Voices', 'Schools']
+
+
+def load_html(html, base_url=None):
+    """Parse an HTML string, resolving relative links the way get_attribute('href') does."""
+    root = lxml.html.fromstring(html)
+    if base_url:
+        root.make_links_absolute(base_url)
+    return root
+
+
+def load_html_file(file_path, base_url=None):
+    """Parse a page written by save_html_content."""
+    with open(file_path, "r", encoding="utf-8") as file:
+        return load_html(file.read(), base_url)
+
+
+def element_text(element):
+    """Approximate Selenium's .text: <br> becomes a newline and whitespace runs collapse."""
+    if element is None:
+        return ""
+
+    parts = []
+
+    def collect(node):
+        if node.tag == "br":
+            parts.append("\n")
+            return
+        if not isinstance(node.tag, str) or node.tag in ("script", "style"):
+            return  # Comments and processing instructions carry no visible text
+        if node.text:
+            parts.append(node.text)
+        for child in node:
+            collect(child)
+            if child.tail:
+                parts.append(child.tail)
+
+    collect(element)
+    lines = "".join(parts).split("\n")
+    return "\n".join(" ".join(line.split()) for line in lines).strip()
+
+
+def first(root, selector):
+    """Return the first element matching a CSS selector, or None."""
+    matches = root.cssselect(selector)
+    return matches[0] if matches else None
+
+
+def first_of(root, chain):
+    """The first element of the first selector in a fallback chain that matches, or None."""
+    for selector in chain:
+        element = first(root, selector)
+        if element is not None:
+            return element
+    return None
+
+
+def select_all(root, chain):
+    """Every element of the first selector in a fallback chain that matches anything."""
+    for selector in chain:
+        matches = root.cssselect(selector)
+        if matches:
+            return matches
+    return []
+
+
+def parse_top_card(root, fields, selectors=SELECTOR_FALLBACKS):
+    """
+    Extract the top-card fields requested in `fields` from a profile page.
+    Missing elements resolve to the same defaults scrape_profile uses.
+    """
+    result = {}
+
+    if "fullName" in fields:
+        name_element = first_of(root, selectors["fullName"])
+        result["fullName"] = element_text(name_element) if name_element is not None else "N/A"
+
+    if "summary" in fields:
+        summary = "N/A"
+        for section in root.cssselect('section.artdeco-card'):
+            heading_element = first(section, 'h2.pvs-header__title span[aria-hidden="true"]')
+            if heading_element is None or element_text(heading_element) != "About":
+                continue
+            summary_element = first_of(section, selectors["summary"])
+            if summary_element is None:
+                continue
+            summary = element_text(summary_element)
+            if "You've previously worked with" in summary or "You've previously worked together" in summary:
+                summary = "N/A"
+            break
+        result["summary"] = summary
+
+    if "headline" in fields:
+        headline_element = first_of(root, selectors["headline"])
+        result["headline"] = element_text(headline_element) if headline_element is not None else "N/A"
+
+    if "Connection Status" in fields:
+        connection_status = "-"
+        clock_svg = first_of(root, selectors["connection_status"])
+        if clock_svg is not None:
+            pending_button = next(clock_svg.iterancestors('button'), None)
+            label = first(pending_button, 'span.artdeco-button__text') if pending_button is not None else None
+            if label is not None and "Pending" in element_text(label):
+                connection_status = element_text(label)
+        result["Connection Status"] = connection_status
+
+    if "location" in fields:
+        location_element = first_of(root, selectors["location"])
+        result["location"] = element_text(location_element) if location_element is not None else "N/A"
+
+    if "numOfConnections" in fields:
+        num_of_connections = "N/A"
+        connections_element = first_of(root, selectors["connections"])
+        if connections_element is not None:
+            match = re.search(r'\d{1,3}(?:,\d{3})*', element_text(connections_element))
+            if match:
+                num_of_connections = int(match.group(0).replace(',', ''))
+        result["numOfConnections"] = num_of_connections
+
+    if "Degree" in fields:
+        degree_element = first_of(root, selectors["degree"])
+        result["Degree"] = element_text(degree_element) if degree_element is not None else "N/A"
+
+    return result
+
+
+def _description(scope):
+    parts = []
+    for span in scope.cssselect('.t-14.t-normal.t-black span[aria-hidden="true"]'):
+        text = element_text(span)
+        if text and not span.cssselect('strong') and not span.cssselect('svg'):
+            parts.append(text)
+    return " ".join(parts) if parts else "N/A"
+
+
+def _skills(item):
+    for span in item.cssselect('span[aria-hidden="true"]'):
+        text = element_text(span)
+        if "Skills:" in text:
+            return text.replace("Skills:", "").strip()
+    return "N/A"
+
+
+def parse_experience_roles(root, selectors=SELECTOR_FALLBACKS):
+    """
+    Return the raw role entries of an experience details page, in the format
+    consumed by LinkedInProfileScraper.build_experience_results.
+    Returns None when the page has no experience list.
+    """
+    items = select_all(root, selectors["detail_list_items"])
+    if not items:
+        return None
+
+    processed_anchors = set()  # Nested list items repeat the anchors of their parent company
+    roles = []
+
+    for index, item in enumerate(items):
+        company_name_elements = item.cssselect('.t-bold span[aria-hidden="true"]')
+        if len(company_name_elements) > 1:
+            # Company with multiple roles: the first anchor is the company itself
+            company_name = element_text(company_name_elements[0])
+            anchors = item.cssselect('a.optional-action-target-wrapper.display-flex.flex-column.full-width')
+            for anchor in anchors[1:]:
+                if anchor in processed_anchors:
+                    continue
+                processed_anchors.add(anchor)
+
+                role_element = first(anchor, '.mr1.hoverable-link-text.t-bold span[aria-hidden="true"]')
+                caption_element = first(anchor, '.pvs-entity__caption-wrapper[aria-hidden="true"]')
+                roles.append({
+                    "group": index,
+                    "grouped": True,
+                    "title": element_text(role_element) if role_element is not None else "N/A",
+                    "company": company_name,
+                    "caption": element_text(caption_element) if caption_element is not None else None,
+                    "description": _description(anchor),
+                    "skills": _skills(item),
+                })
+            continue
+
+        mr1 = first(item, '.mr1')
+        job_title_element = first(mr1, 'span[aria-hidden="true"]') if mr1 is not None else None
+        if job_title_element is None:
+            continue
+        job_title = element_text(job_title_element)
+        if job_title == "N/A":
+            continue
+
+        company_name_element = first(item, '.t-14.t-normal span[aria-hidden="true"]')
+        if company_name_element is not None:
+            company_name = element_text(company_name_element).split('·')[0].strip()
+        else:
+            company_name = "N/A"
+
+        anchor_element = first(item, 'a.optional-action-target-wrapper')
+        if anchor_element is None or anchor_element in processed_anchors:
+            continue
+        processed_anchors.add(anchor_element)
+
+        caption_element = first(item, '.pvs-entity__caption-wrapper')
+        if caption_element is None:
+            continue
+
+        roles.append({
+            "group": index,
+            "grouped": False,
+            "title": job_title,
+            "company": company_name,
+            "caption": element_text(caption_element),
+            "description": _description(item),
+            "skills": _skills(item),
+        })
+
+    return roles
+
+
+def parse_education_entries(root, selectors=SELECTOR_FALLBACKS):
+    """
+    Return raw education entries (index, school, degree, caption) of an education
+    details page, or None when the page has no education list.
+    """
+    items = select_all(root, selectors["detail_list_items"])
+    if not items:
+        return None
+
+    entries = []
+    for index, item in enumerate(items):
+        school_element = first(item, '.t-bold span[aria-hidden="true"]')
+        if school_element is None:
+            continue
+
+        degree_element = first(item, '.t-14.t-normal span[aria-hidden="true"]')
+        degree_text = element_text(degree_element) if degree_element is not None else "N/A"
+        if degree_text.replace(" ", "").isdigit():
+            degree_text = "N/A"
+
+        caption_element = first(item, '.pvs-entity__caption-wrapper[aria-hidden="true"]')
+        entries.append({
+            "index": index,
+            "school": element_text(school_element),
+            "degree": degree_text,
+            "caption": element_text(caption_element) if caption_element is not None else None,
+        })
+    return entries
+
+
+def parse_contact_info(root, selectors=SELECTOR_FALLBACKS):
+    """Return the raw contact modal fields, or None when the modal is missing."""
+    contact_modal = first_of(root, selectors["contact_modal"])
+    if contact_modal is None:
+        return None
+
+    data = {"email": "N/A", "phone": "N/A", "birthday": "N/A", "connectedOn": "N/A"}
+    for section in contact_modal.cssselect('section.pv-contact-info__contact-type'):
+        header = element_text(first(section, 'h3'))
+        value_element = first(section, 'span.t-14.t-black.t-normal')
+        if 'Email' in header:
+            email_element = first(section, "a[href^='mailto:']")
+            if email_element is not None:
+                data["email"] = email_element.get('href', '').replace('mailto:', '')
+        elif 'Phone' in header:
+            if value_element is not None:
+                data["phone"] = element_text(value_element)
+        elif 'Birthday' in header:
+            if value_element is not None:
+                data["birthday"] = element_text(value_element)
+        elif 'Connected' in header:
+            if value_element is not None:
+                data["connectedOn"] = element_text(value_element)
+    return data
+
+
+def parse_interest_tabs(root, selectors=SELECTOR_FALLBACKS):
+    """Map the relevant interest tab names to their detailScreenTabIndex."""
+    interest_map = {}
+    for index, button in enumerate(root.cssselect('div.artdeco-tablist button.artdeco-tab')):
+        tab_name_element = first(button, 'span[aria-hidden="true"]')
+        if tab_name_element is None:
+            continue
+        tab_name = element_text(tab_name_element)
+        if tab_name in RELEVANT_INTERESTS:
+            interest_map[tab_name] = index
+    return interest_map
+
+
+def active_panel(root):
+    """
+    The tab panel the interests page shows, matched like INTEREST_TAB_SHOWN_SCRIPT: the
+    panel whose id the selected tab's aria-controls names, then the one with its data-tab,
+    else the first one without the hidden attribute. Pages without tab panels are returned whole.
+    """
+    panels = root.cssselect('[role="tabpanel"]')
+    if not panels:
+        return root
+    selected = first(root, 'button.artdeco-tab[aria-selected="true"]')
+    if selected is not None:
+        for attribute, panel_attribute in (('aria-controls', 'id'), ('data-tab', 'data-tab')):
+            value = selected.get(attribute)
+            if value is None:
+                continue
+            for panel in panels:
+                if panel.get(panel_attribute) == value:
+                    return panel
+    for panel in panels:
+        if panel.get('hidden') is None:
+            return panel
+    return panels[0]
+
+
+def parse_interest_items(root, selectors=SELECTOR_FALLBACKS):
+    """Return (name, url) pairs for the items of the currently shown interests tab."""
+    items = []
+    # Every tab's panel is in the page source; the hidden ones render no text live
+    for item in select_all(active_panel(root), selectors["detail_list_items"]):
+        name_element = first(item, 'div.hoverable-link-text.t-bold span[aria-hidden="true"]')
+        if name_element is None:
+            name_element = first(item, 'span.visually-hidden')
+        name = element_text(name_element) if name_element is not None else ""
+        if not name:
+            continue
+
+        url = "N/A"
+        url_elements = item.cssselect('a.optional-action-target-wrapper')
+        if len(url_elements) > 1:
+            url = url_elements[1].get('href')
+        elif url_elements:
+            url = url_elements[0].get('href')
+        items.append((name, url))
+    return items
+
+
+def parse_profiles_for_you(root, selectors=SELECTOR_FALLBACKS):
+    """Return raw browsemap entries (name, url, description), or None when the list is missing."""
+    items = select_all(root, selectors["browsemap_items"])
+    if not items:
+        return None
+
+    profiles = []
+    for item in items:
+        name_element = first(item, 'div.hoverable-link-text.t-bold span[aria-hidden="true"]')
+        url_element = first(item, 'a.optional-action-target-wrapper')
+        if name_element is None or url_element is None:
+            continue
+
+        name = element_text(name_element)
+        profile_link = (url_element.get('href') or '').split('?')[0]
+        description_element = first(item, 'div.t-14.t-normal.display-flex.align-items-center span[aria-hidden="true"]')
+        description = element_text(description_element) if description_element is not None else "N/A"
+
+        if name and profile_link:
+            profiles.append({"name": name, "url": profile_link, "description": description})
+    return profiles
+
+
+# Page kinds understood by extract_page, keyed by the parser that handles them
+PAGE_PARSERS = {
+    "experience": parse_experience_roles,
+    "education": parse_education_entries,
+    "contact": parse_contact_info,
+    "interests": parse_interest_items,
+    "interest_tabs": parse_interest_tabs,
+    "profiles_for_you": parse_profiles_for_you,
+}
+
+
+def extract_page(html, kind, base_url=None, fields=(), selectors=None):
+    """
+    Parse one snapshot and return the raw data for its page kind ("top_card" needs `fields`).
+    `selectors` maps registry fields to their fallback chains (default: SELECTOR_FALLBACKS).
+    """
+    root = load_html(html, base_url)
+    selectors = selectors or SELECTOR_FALLBACKS
+    if kind == "top_card":
+        return parse_top_card(root, set(fields), selectors)
+    return PAGE_PARSERS[kind](root, selectors)
@@ -0,0 +1,33 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_linkedin import MockDriver
+from navigation_planner import METHOD_COLUMN_MAP
+from scraper import LinkedInProfileScraper
+
+ALL_COLUMNS = sorted(set().union(*METHOD_COLUMN_MAP.values()))
+MOCK_BASE = "http://mock.linkedin"
+SLUGS = ["alice-a", "bob-b", "carol-c", "dave-d", "erin-e", "frank-f", "grace-g", "heidi-h"]
+
+
+@pytest.fixture
+def make_scraper(tmp_path):
+    """Scraper without a browser, driving a MockDriver with no sleeps or waits."""
+
+    def make(**options):
+        options.setdefault("include_columns", ALL_COLUMNS)
+        options.setdefault("checkpoint_file", None)
+        scraper = LinkedInProfileScraper(
+            str(tmp_path / "out.xlsx"), launch_browser=False, selector_stats_file=None,
+            driver_cache_file=None, base_url=MOCK_BASE, **options
+        )
+        scraper.driver = MockDriver(base=MOCK_BASE)
+        scraper.sleep = lambda seconds, budgeted=True: None
+        scraper.wait_timeout = lambda timeout: 0  # Mock pages are complete as soon as they load
+        return scraper
+
+    return make
@@ -0,0 +1,93 @@
+import pytest
+
+from conftest import ALL_COLUMNS, MOCK_BASE, SLUGS
+from mock_linkedin import MockLinkedIn, fake_profile
+from navigation_planner import METHOD_COLUMN_MAP
+import snapshot_parser
+
+# The live contact scrape is a single script, which MockDriver cannot run
+DOM_COLUMNS = [column for column in ALL_COLUMNS if column not in METHOD_COLUMN_MAP["scrape_contact_info"]]
+DRIFT_COLUMNS = ["headline", "Position Title", "Company Name", "More Positions"]
+
+
+@pytest.mark.parametrize("slug", SLUGS)
+def test_snapshot_backend_matches_live_dom(make_scraper, slug):
+    url = f"{MOCK_BASE}/in/{slug}"
+    live = make_scraper(backend="live", experience_mode="dom", top_card_mode="wait").scrape_profile(url)
+    snapshot = make_scraper(backend="snapshot").scrape_profile(url)
+
+    assert {column: snapshot.get(column) for column in DOM_COLUMNS} == {column: live.get(column) for column in DOM_COLUMNS}
+
+
+@pytest.mark.parametrize("slug", SLUGS)
+def test_snapshot_interests_only_read_the_shown_tab(make_scraper, slug):
+    row = make_scraper(backend="snapshot", include_columns=["Interest: Companies"]).scrape_profile(f"{MOCK_BASE}/in/{slug}")
+
+    companies = fake_profile(slug)["interests"].get("Companies", [])[:20]  # The first page of the list
+    shown = row["Interest: Companies"].split("\n") if row["Interest: Companies"] else []
+    assert [item.split(" - URL: ")[0] for item in shown] == [f"Companies: {name}" for name in companies]
+
+
+@pytest.mark.parametrize("slug", SLUGS)
+def test_snapshot_contact_info_matches_profile(make_scraper, slug):
+    profile = fake_profile(slug)
+    row = make_scraper(backend="snapshot", include_columns=["ContactInfo", "Birthday"]).scrape_profile(f"{MOCK_BASE}/in/{slug}")
+
+    contact = []
+    if profile["phone"]:
+        contact.append(f"PhoneNumber: {profile['phone']}")
+    if profile["email"]:
+        contact.append(f"Email Address: {profile['email']}")
+    assert row["ContactInfo"] == (", ".join(contact) or "N/A")
+    assert row["Birthday"] == ("15-Nov" if profile["birthday"] else "N/A")
+
+
+@pytest.mark.parametrize("slug", SLUGS)
+def test_snapshot_of_clicked_interest_tab_reads_that_tab_only(make_scraper, slug):
+    columns = [column for column in ALL_COLUMNS if column.startswith("Interest: ")]
+    url = f"{MOCK_BASE}/in/{slug}"
+    reloaded = make_scraper(backend="snapshot", include_columns=columns).scrape_profile(url)
+    clicked = make_scraper(backend="snapshot", include_columns=columns, interests_mode="tabs").scrape_profile(url)
+
+    assert clicked == reloaded
+    for tab, names in fake_profile(slug)["interests"].items():
+        shown = clicked[f"Interest: {tab}"].split("\n") if clicked.get(f"Interest: {tab}") else []
+        assert [item.split(" - URL: ")[0] for item in shown] == [f"{tab}: {name}" for name in names[:20]]
+
+
+class DriftedSite(MockLinkedIn):
+    """Markup where only the fallback selectors of the headline and the detail lists still match."""
+
+    def top_card(self, profile):
+        return super().top_card(profile).replace('<div class="text-body-medium">', '<div data-generated-suggestion-target="x">')
+
+    def experience(self, base, profile):
+        html = super().experience(base, profile).replace('class="pvs-list__paged-list-item"', 'class="artdeco-list__item"')
+        return html.replace("<main><ul>", '<main><div class="pvs-list__container"><ul>').replace("</ul></main>", "</ul></div></main>")
+
+
+@pytest.mark.parametrize("slug", SLUGS[:3])
+def test_backends_follow_the_same_fallback_selectors(make_scraper, slug):
+    url = f"{MOCK_BASE}/in/{slug}"
+    rows = []
+    for options in ({"backend": "live", "experience_mode": "dom", "top_card_mode": "wait"}, {"backend": "snapshot"}):
+        scraper = make_scraper(include_columns=DRIFT_COLUMNS, **options)
+        scraper.driver.site = DriftedSite()
+        rows.append(scraper.scrape_profile(url))
+    live, snapshot = rows
+
+    assert snapshot == live
+    assert live["headline"] == fake_profile(slug)["headline"]
+    assert live["Position Title"] != "N/A"
+
+
+def test_shown_interest_panel_is_found_through_aria_controls():
+    # Panels hidden by CSS rather than the hidden attribute, and no data-tab: only aria-controls links them
+    root = snapshot_parser.load_html('''<div class="artdeco-tablist">
+        <button class="artdeco-tab" aria-selected="false" aria-controls="panel-a"><span aria-hidden="true">Companies</span></button>
+        <button class="artdeco-tab" aria-selected="true" aria-controls="panel-b"><span aria-hidden="true">Groups</span></button>
+    </div>
+    <div role="tabpanel" id="panel-a"><ul><li class="pvs-list__paged-list-item"><span class="visually-hidden">Acme</span></li></ul></div>
+    <div role="tabpanel" id="panel-b"><ul><li class="pvs-list__paged-list-item"><span class="visually-hidden">Chess Club</span></li></ul></div>''')
+
+    assert snapshot_parser.parse_interest_items(root) == [("Chess Club", "N/A")]
@@ -0,0 +1,58 @@
+from conftest import MOCK_BASE
+from mock_linkedin import MockLinkedIn, page
+from rate_governor import RateGovernor
+
+COLUMNS = ["fullName", "Education Degree"]
+
+
+def classify_as_unavailable(scraper, path):
+    scraper.classify_page = lambda: "unavailable" if path in scraper.driver.current_url else "normal"
+
+
+class NoEducationSite(MockLinkedIn):
+    def education(self, profile):
+        return page("Not found", "<h1>Page not found</h1>")
+
+
+def test_missing_sub_page_keeps_the_profile(make_scraper):
+    scraper = make_scraper(include_columns=COLUMNS)
+    scraper.driver.site = NoEducationSite()
+    classify_as_unavailable(scraper, "/details/education")
+
+    row = scraper.scrape_job(f"{MOCK_BASE}/in/alice-a", {})
+
+    assert row["fullName"] != "N/A"
+    assert row["Education Degree"] == "N/A"
+
+
+def test_unavailable_profile_is_recorded_for_a_resume(make_scraper, tmp_path):
+    scraper = make_scraper(include_columns=COLUMNS, checkpoint_file=str(tmp_path / "checkpoint.db"))
+    url = f"{MOCK_BASE}/in/alice-a"
+    classify_as_unavailable(scraper, url)
+
+    assert scraper.scrape_job(url, {}) is None
+    assert scraper.checkpoint.blocked_profiles() == {url: "unavailable"}
+    assert scraper.checkpoint.completed_row(url) is None
+
+
+def test_one_strike_per_backoff_window(capsys):
+    governor = RateGovernor()
+    first = governor.back_off("throttled", base=60)
+    second = governor.back_off("throttled", base=60)  # Another worker's page from before the backoff
+
+    assert second <= first
+    assert governor.buckets["strikes"] == 1
+    assert governor.backoffs == 1
+
+
+def test_unavailable_profile_is_detected_without_top_card_columns(make_scraper, tmp_path):
+    scraper = make_scraper(include_columns=["Education Degree"], checkpoint_file=str(tmp_path / "checkpoint.db"))
+    url = f"{MOCK_BASE}/in/alice-a"
+    classify_as_unavailable(scraper, url)
+    loads = []
+    get = scraper.driver.get
+    scraper.driver.get = lambda page_url: (loads.append(page_url), get(page_url))
+
+    assert scraper.scrape_job(url, {}) is None
+    assert scraper.checkpoint.blocked_profiles() == {url: "unavailable"}
+    assert len(loads) == 1  # The education page is classified: no extra profile page load
@@ -0,0 +1,28 @@
+from checkpoint import CheckpointStore
+
+
+def test_changed_columns_drop_finished_work_but_keep_the_harvest(tmp_path):
+    store = CheckpointStore(str(tmp_path / "checkpoint.db"))
+    assert not store.use_columns(["fullName", "headline"])
+    store.save_harvest("range:0-10", [{"profile_url": "https://www.linkedin.com/in/a"}])
+    store.save_section("https://www.linkedin.com/in/a", "top_card", {"fullName": "A"})
+    store.mark_profile_done("https://www.linkedin.com/in/a", {"fullName": "A"})
+
+    assert not store.use_columns(["headline", "fullName"])  # Same set, other order
+    assert store.completed_row("https://www.linkedin.com/in/a") == {"fullName": "A"}
+
+    assert store.use_columns(["fullName", "headline", "location"])
+    assert store.completed_row("https://www.linkedin.com/in/a") is None
+    assert store.load_sections("https://www.linkedin.com/in/a") == {}
+    assert store.load_harvest("range:0-10") == [{"profile_url": "https://www.linkedin.com/in/a"}]
+    store.close()
+
+
+def test_harvest_key_follows_the_excel_contents(make_scraper, tmp_path):
+    excel_file = tmp_path / "connections.xlsx"
+    excel_file.write_bytes(b"first version")
+    scraper = make_scraper(excel_file_path=str(excel_file))
+    first_key = scraper.harvest_key()
+
+    excel_file.write_bytes(b"second version")
+    assert scraper.harvest_key() != first_key
@@ -0,0 +1,34 @@
+from selenium.common.exceptions import TimeoutException
+
+from conftest import MOCK_BASE
+from driver_lifecycle import DriverLifecycle
+from mock_linkedin import MockDriver
+
+COLUMNS = ["fullName", "Education Degree", "Interest: Companies"]
+
+
+class StuckEducationDriver(MockDriver):
+    """Browser whose education page never finishes loading."""
+
+    def get(self, url):
+        if "/details/education" in url:
+            raise TimeoutException("Timed out receiving message from renderer")
+        super().get(url)
+
+
+def test_page_load_timeout_restarts_the_browser_and_retries(make_scraper, tmp_path):
+    scraper = make_scraper(include_columns=COLUMNS, checkpoint_file=str(tmp_path / "checkpoint.db"))
+    url = f"{MOCK_BASE}/in/alice-a"
+    scraper.driver = StuckEducationDriver(base=MOCK_BASE)
+    scraper.init_driver = lambda: MockDriver(base=MOCK_BASE)
+    scraper.login_from_cookies = lambda: None
+    scraper.lifecycle = DriverLifecycle(scraper)
+    try:
+        row = scraper.scrape_job(url, {})
+    finally:
+        scraper.lifecycle.stop()
+
+    assert scraper.lifecycle.restarts == 1
+    assert row["fullName"] != "N/A"
+    assert row["Education Degree"] != "N/A"
+    assert scraper.checkpoint.completed_row(url) == row
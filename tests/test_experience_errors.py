@@ -0,0 +1,24 @@
+import pytest
+
+from conftest import MOCK_BASE
+from mock_linkedin import MockLinkedIn, page
+
+
+class NoExperienceSite(MockLinkedIn):
+    """Mock site whose experience page never shows a list."""
+
+    def experience(self, base, profile):
+        return page("Experience", "<main><h2>Nothing to see here</h2></main>")
+
+
+@pytest.mark.parametrize("backend, experience_mode", [("live", "dom"), ("live", "script"), ("snapshot", "dom")])
+def test_failed_experience_page_keeps_the_profile(make_scraper, backend, experience_mode):
+    scraper = make_scraper(backend=backend, experience_mode=experience_mode,
+                           include_columns=["fullName", "Position Title", "More Positions", "Total Years of Exp(in Yrs)"])
+    scraper.driver.site = NoExperienceSite()
+
+    row = scraper.scrape_profile(f"{MOCK_BASE}/in/alice-a")
+
+    assert row["fullName"] != "N/A"
+    assert row["Position Title"] == "N/A"
+    assert row["More Positions"] == "N/A"
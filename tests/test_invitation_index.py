@@ -0,0 +1,67 @@
+from conftest import MOCK_BASE
+from mock_linkedin import MockLinkedIn
+
+
+def make_indexed_scraper(make_scraper, tmp_path):
+    scraper = make_scraper(invitation_index_file=str(tmp_path / "invitations.db"), invitation_page_size=10)
+    scraper.driver.site = MockLinkedIn(invites=60, page_size=10)
+    loads = []
+    get = scraper.driver.get
+    scraper.driver.get = lambda url: (loads.append(url), get(url))
+    return scraper, loads
+
+
+def url(slug):
+    return f"{MOCK_BASE}/in/{slug}"
+
+
+def assert_index_matches(scraper):
+    index = scraper.invitation_index
+    assert index.pending_count() == len(scraper.driver.site.invitations)
+    for position, slug in enumerate(scraper.driver.site.invitations):
+        entry = index.get(url(slug))
+        assert (entry["status"], entry["position"]) == ("pending", position)
+
+
+def test_refresh_indexes_only_the_new_invitations(make_scraper, tmp_path):
+    scraper, loads = make_indexed_scraper(make_scraper, tmp_path)
+    scraper.refresh_invitation_index()  # Empty index: one full crawl
+    assert_index_matches(scraper)
+
+    scraper.driver.site.invitations[:0] = ["new-one", "new-two"]
+    loads.clear()
+    scraper.refresh_invitation_index()
+
+    assert_index_matches(scraper)
+    assert loads == [f"{MOCK_BASE}/mynetwork/invitation-manager/sent/"]  # Stopped at the known invitations on page 1
+
+
+def test_reconcile_finds_removed_invitations_without_a_full_crawl(make_scraper, tmp_path):
+    scraper, loads = make_indexed_scraper(make_scraper, tmp_path)
+    scraper.refresh_invitation_index()
+
+    site = scraper.driver.site
+    removed = [site.invitations[12], site.invitations[15]]  # Both on page 2
+    for slug in removed:
+        site.invitations.remove(slug)
+    loads.clear()
+    scraper.refresh_invitation_index()
+
+    assert_index_matches(scraper)
+    assert [scraper.invitation_index.get(url(slug))["status"] for slug in removed] == ["gone", "gone"]
+    assert not [load for load in loads if load.endswith(("?page=5", "?page=6"))]  # Pages below the removals were never read
+
+
+def test_refresh_moves_a_re_sent_invitation_to_the_top(make_scraper, tmp_path):
+    scraper, loads = make_indexed_scraper(make_scraper, tmp_path)
+    scraper.refresh_invitation_index()
+
+    site = scraper.driver.site
+    site.invitations.remove("person-42")
+    site.invitations[:0] = ["person-42", "new-one"]  # Re-sent above a new invitation
+    loads.clear()
+    scraper.refresh_invitation_index()
+
+    assert_index_matches(scraper)
+    assert scraper.invitation_index.get(url("person-42"))["position"] == 0
+    assert loads == [f"{MOCK_BASE}/mynetwork/invitation-manager/sent/"]
@@ -0,0 +1,19 @@
+def test_no_seeking_without_the_invite_total(make_scraper):
+    scraper = make_scraper(invitation_page_size=100)
+    scraper.driver.execute_script = lambda script, *args: [1, 2, 3]  # Three pagination pages
+
+    assert scraper.invitation_page_for(250, None) == 1
+    assert scraper.invitation_page_for(250, 300) == 3
+    assert scraper.invitation_page_for(250, 450) == 1  # 450 invites do not fit 3 pages of 100
+
+
+def test_harvested_urls_scrape_every_sub_page(make_scraper):
+    scraper = make_scraper(include_columns=["fullName", "Position Title", "SchoolName"])
+    site = scraper.driver.site
+
+    jobs = scraper.build_jobs(scraper.get_unanswered_connection_urls((1, 2)))
+    rows = [scraper.scrape_job(url, connection) for url, connection in jobs]
+
+    assert len(rows) == 2
+    assert all(row["Position Title"] != "N/A" and row["SchoolName"] != "N/A" for row in rows)
+    assert "not_found" not in site.requests
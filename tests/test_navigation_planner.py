@@ -0,0 +1,17 @@
+from navigation_planner import estimate_page_loads, estimate_seconds, plan_page_visits
+
+INTERESTS = ["fullName", "Interest: Groups"]
+
+
+def test_tabs_mode_loads_the_interests_page_once():
+    plan = plan_page_visits(INTERESTS)
+
+    assert estimate_page_loads(plan, interests_mode="tabs") == 2
+    assert estimate_page_loads(plan, interests_mode="reload") > 2
+    assert estimate_seconds(plan, interests_mode="tabs") < estimate_seconds(plan, interests_mode="reload")
+
+
+def test_profile_without_top_card_columns_costs_no_extra_load():
+    assert estimate_page_loads(plan_page_visits(["Education Degree"])) == 1
+    assert estimate_page_loads(plan_page_visits(["fullName", "Education Degree"])) == 2
+    assert estimate_page_loads(plan_page_visits(["message"])) == 0
@@ -0,0 +1,36 @@
+import pytest
+from openpyxl import load_workbook
+
+from output_sink import StreamingExcelSink
+
+
+def test_workbook_is_built_once_on_close(tmp_path, monkeypatch):
+    exports = []
+    export_excel = StreamingExcelSink.export_excel
+    monkeypatch.setattr(StreamingExcelSink, "export_excel", lambda self: exports.append(1) or export_excel(self))
+
+    sink = StreamingExcelSink(str(tmp_path / "out.xlsx"), ["fullName", "headline"])
+    for number in range(60):
+        sink.write({"fullName": f"Person {number}", "headline": "Engineer"})
+    output_file = sink.close()
+
+    assert exports == [1]
+    rows = list(load_workbook(output_file).active.values)
+    assert rows[0] == ("fullName", "headline")
+    assert len(rows) == 61
+
+
+def test_existing_journal_is_not_overwritten(tmp_path):
+    journal = tmp_path / "out.jsonl"
+    journal.write_text('{"fullName": "Earlier run"}\n', encoding="utf-8")
+
+    with pytest.raises(FileExistsError):
+        StreamingExcelSink(str(tmp_path / "out.xlsx"), ["fullName"], journal_path=str(journal))
+    assert journal.read_text(encoding="utf-8") == '{"fullName": "Earlier run"}\n'
+
+
+def test_each_run_gets_its_own_journal(tmp_path):
+    sink = StreamingExcelSink(str(tmp_path / "out.xlsx"), ["fullName"])
+    sink.close(export=False)
+    assert sink.journal_path.startswith(str(tmp_path / "out_"))
+    assert sink.journal_path.endswith(".jsonl")
@@ -0,0 +1,43 @@
+import random
+
+from conftest import MOCK_BASE
+from page_cache import PageCache
+from test_backend_parity import DOM_COLUMNS
+
+
+def test_cache_only_run_matches_live_run_and_counts_misses(make_scraper, tmp_path):
+    cache_directory = str(tmp_path / "cache")
+    cached_url, uncached_url = f"{MOCK_BASE}/in/alice-a", f"{MOCK_BASE}/in/bob-b"
+
+    live = make_scraper(backend="live", experience_mode="dom", page_cache_dir=cache_directory)
+    live_row = live.scrape_profile(cached_url)
+    live.page_cache.close()
+
+    offline = make_scraper(page_cache_dir=cache_directory, cache_only=True)
+    offline.driver = None  # Any page load would fail
+    offline_row = offline.scrape_profile(cached_url)
+    assert {column: offline_row.get(column) for column in DOM_COLUMNS} == {column: live_row.get(column) for column in DOM_COLUMNS}
+    assert offline.cache_misses == {}
+
+    offline.scrape_profile(uncached_url)
+    assert offline.cache_misses == {kind: 1 for kind in ("top_card", "contact", "experience", "education", "interest_tabs", "profiles_for_you")}
+
+
+def test_cache_only_run_keeps_the_live_checkpoint(make_scraper, tmp_path):
+    checkpoint_file = str(tmp_path / "checkpoint.db")
+    scraper = make_scraper(page_cache_dir=str(tmp_path / "cache"), cache_only=True, checkpoint_file=checkpoint_file)
+    assert scraper.checkpoint.path != checkpoint_file
+
+
+def test_puts_past_the_size_limit_evict_during_the_run(tmp_path):
+    cache = PageCache(str(tmp_path / "cache"), max_bytes=20000)
+    rng = random.Random(7)
+    for number in range(50):
+        html = "".join(rng.choice("abcdefghij") for _ in range(2000))  # Incompressible enough to need a file each
+        cache.put(f"{MOCK_BASE}/in/p{number}", "top_card", html)
+        assert cache.stored_bytes <= cache.max_bytes
+
+    files = [path for path in (tmp_path / "cache").rglob("*.html.gz")]
+    assert sum(path.stat().st_size for path in files) <= cache.max_bytes
+    assert cache.get(f"{MOCK_BASE}/in/p49", "top_card") is not None  # The newest pages are kept
+    assert cache.get(f"{MOCK_BASE}/in/p0", "top_card") is None
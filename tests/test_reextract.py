@@ -0,0 +1,54 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import reextract
+from conftest import ALL_COLUMNS, MOCK_BASE, SLUGS
+from html_archive import HtmlArchive
+from test_backend_parity import DOM_COLUMNS
+
+
+def archive_live_run(make_scraper, archive_directory):
+    """Scrape the mock profiles in DOM mode while archiving every page; returns the rows by URL."""
+    scraper = make_scraper(backend="live", experience_mode="dom", html_archive_dir=str(archive_directory))
+    rows = {}
+    for slug in SLUGS:
+        url = f"{MOCK_BASE}/in/{slug}"
+        rows[url] = scraper.scrape_profile(url)
+    scraper.html_archive.close()
+    return rows
+
+
+def test_reextracted_rows_match_the_live_run(make_scraper, tmp_path):
+    live_rows = archive_live_run(make_scraper, tmp_path / "archive")
+
+    reextract.init_worker(str(tmp_path / "archive"), str(tmp_path / "out.xlsx"), ALL_COLUMNS)
+    archive = HtmlArchive(str(tmp_path / "archive"))
+    tasks = reextract.build_tasks(archive, {})
+    archive.close()
+
+    assert sorted(task[0] for task in tasks) == sorted(live_rows)
+    for task in tasks:
+        row, _, _ = reextract.extract_profile(task)
+        live = live_rows[task[0]]
+        assert {column: row.get(column) for column in DOM_COLUMNS} == {column: live.get(column) for column in DOM_COLUMNS}
+
+
+def test_reextract_reports_dropped_profiles(make_scraper, tmp_path, monkeypatch, capsys):
+    archive_live_run(make_scraper, tmp_path / "archive")
+    broken = f"{MOCK_BASE}/in/{SLUGS[0]}"
+    scrape_profile = reextract.LinkedInProfileScraper.scrape_profile
+
+    def failing_scrape_profile(self, url):
+        if url == broken:
+            raise RuntimeError("parser crashed")
+        return scrape_profile(self, url)
+
+    # Threads instead of processes, so the patched extractor is the one that runs
+    monkeypatch.setattr(reextract, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr(reextract.LinkedInProfileScraper, "scrape_profile", failing_scrape_profile)
+
+    rows = reextract.reextract(str(tmp_path / "archive"), str(tmp_path / "out.xlsx"), ALL_COLUMNS, workers=1)
+
+    assert rows == len(SLUGS) - 1
+    output = capsys.readouterr().out
+    assert f"Dropped 1 of {len(SLUGS)} profiles" in output
+    assert broken in output
@@ -0,0 +1,58 @@
+import threading
+
+from selector_registry import SelectorRegistry
+
+
+def record_run(registry, field, hits, misses):
+    chain = registry.chain(field)
+    for _ in range(hits):
+        registry.record(field, chain, chain[0])
+    for _ in range(misses):
+        registry.record(field, chain, None)
+
+
+def test_optional_field_absent_on_many_profiles_never_collapses():
+    registry = SelectorRegistry(path=None, window=10)
+    record_run(registry, "connection_status", hits=40, misses=20)  # No pending invitation on these profiles
+
+    assert "connection_status" not in registry.collapsed
+    assert registry.timeout("connection_status", 10) == 10
+
+
+def test_required_field_collapse_shortens_its_wait():
+    registry = SelectorRegistry(path=None, window=10)
+    record_run(registry, "fullName", hits=40, misses=20)
+
+    assert "fullName" in registry.collapsed
+    assert registry.timeout("fullName", 10) == registry.collapsed_timeout
+
+
+def test_selector_matched_on_the_page_leads_the_extractor_chain():
+    registry = SelectorRegistry(path=None)
+    fallback = registry.chain("detail_list_items")[-1]
+
+    chains = registry.chains({"detail_list_items": fallback})
+
+    assert chains["detail_list_items"][0] == fallback
+    assert sorted(chains["detail_list_items"]) == sorted(registry.chain("detail_list_items"))
+    assert chains["fullName"] == registry.chain("fullName")
+
+
+def test_saves_while_recording_from_other_threads(tmp_path):
+    registry = SelectorRegistry(path=str(tmp_path / "stats.json"), save_every=1)
+    chain = registry.chain("headline")
+
+    def record(thread):
+        for number in range(100):
+            registry.record(f"field-{thread}-{number}", chain, chain[0])  # Every record adds dict keys
+
+    threads = [threading.Thread(target=record, args=(thread,)) for thread in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    registry.save()
+
+    saved = SelectorRegistry(path=str(tmp_path / "stats.json"))
+    assert len(saved.field_counts) == 400
+    assert list(tmp_path.iterdir()) == [tmp_path / "stats.json"]
@@ -0,0 +1,41 @@
+import scraper as scraper_module
+from conftest import MOCK_BASE
+
+
+def test_budget_caps_sleeps_and_ends_with_the_profile(make_scraper, monkeypatch):
+    scraper = make_scraper(profile_time_budget=0.2, include_columns=["fullName", "Position Title"])
+    del scraper.sleep, scraper.wait_timeout  # Use the real, budgeted versions
+    slept = []
+    monkeypatch.setattr(scraper_module.time, "sleep", slept.append)
+
+    row = scraper.scrape_connection(f"{MOCK_BASE}/in/alice-a", {})
+
+    assert row["fullName"] != "N/A"
+    assert slept and max(slept) <= 0.2
+    assert scraper.profile_deadline is None
+
+    scraper.sleep(1.5)  # Outside a profile nothing is cut short
+    assert slept[-1] == 1.5
+
+
+def test_profile_cut_short_by_the_budget_is_finished_on_resume(make_scraper, monkeypatch, tmp_path):
+    columns = ["fullName", "Position Title"]
+    checkpoint_file = str(tmp_path / "checkpoint.db")
+    url = f"{MOCK_BASE}/in/alice-a"
+    monkeypatch.setattr(scraper_module.time, "sleep", lambda seconds: None)
+
+    scraper = make_scraper(profile_time_budget=0, include_columns=columns, checkpoint_file=checkpoint_file)
+    del scraper.wait_timeout  # Every budgeted wait is cut short
+    assert scraper.scrape_job(url, {}) is not None
+    assert scraper.checkpoint.partial_profiles() == [url]
+    assert scraper.checkpoint.completed_row(url) is None
+    assert scraper.checkpoint.load_sections(url) == {}
+    assert scraper.checkpoint.blocked_profiles() == {}
+    scraper.checkpoint.close()
+
+    resumed = make_scraper(include_columns=columns, checkpoint_file=checkpoint_file, resume=True)
+    row = resumed.scrape_job(url, {})
+
+    assert row["fullName"] != "N/A" and row["Position Title"] != "N/A"
+    assert resumed.checkpoint.completed_row(url) == row
+    assert resumed.checkpoint.partial_profiles() == []
@@ -0,0 +1,49 @@
+from worker_pool import ScraperPipeline, ScraperPool
+
+
+class OwnerWithoutWorkers:
+    """Harvesting scraper whose worker browsers all fail to start."""
+
+    def __init__(self):
+        self.scraped = []
+
+    def spawn_worker(self):
+        raise RuntimeError("Chrome failed to start")
+
+    def iter_harvest(self):
+        yield from ({"profile_url": f"https://www.linkedin.com/in/p{number}"} for number in range(3))
+
+    def iter_jobs(self, connections):
+        for connection in connections:
+            yield connection["profile_url"], connection
+
+    def scrape_job(self, url, connection):
+        self.scraped.append(url)
+        return {"profile_url": url}
+
+
+def test_pipeline_scrapes_in_the_owner_when_no_worker_starts():
+    owner = OwnerWithoutWorkers()
+    rows = list(ScraperPipeline(owner, workers=2).rows())
+
+    assert [row["profile_url"] for row in rows] == owner.scraped
+    assert len(rows) == 3
+
+
+def test_pools_report_the_counters_of_every_worker(make_scraper):
+    for pool_class, workers in ((ScraperPool, 2), (ScraperPipeline, 1)):  # One spawned worker each
+        owner = make_scraper()
+        worker = make_scraper()
+        worker.login_from_cookies = lambda: None
+        owner.spawn_worker = lambda: worker
+        owner.cache_misses = {"experience": 1}
+        owner.round_trips_saved = 5
+        worker.cache_misses = {"experience": 2, "contact": 1}
+        worker.round_trips_saved = 7
+
+        pool = pool_class(owner, workers=workers)
+        pool.start()
+        pool.shutdown()
+
+        assert owner.cache_misses == {"experience": 3, "contact": 1}
+        assert owner.round_trips_saved == 12
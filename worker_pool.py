@@ -0,0 +1,259 @@
+import time
+import queue
+import threading
+
+
+class PaceLimiter:
+    """Global pacing shared by every worker: at most one profile start per `interval` seconds."""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.next_start = 0.0
+
+    def wait(self):
+        if self.interval <= 0:
+            return
+        with self.lock:
+            now = time.monotonic()
+            start_at = max(now, self.next_start)
+            self.next_start = start_at + self.interval
+        if start_at > now:
+            time.sleep(start_at - now)
+
+
+class ScraperPool:
+    """
+    Runs profile scraping across several browser processes that share one login
+    session. The scraper that harvested the connections is reused as the first
+    worker; the others are started with spawn_worker() and seeded from cookies.pkl.
+    """
+
+    def __init__(self, owner, workers, pace_interval=0.0):
+        self.owner = owner
+        self.size = workers
+        self.pacer = PaceLimiter(pace_interval)
+        self.scrapers = []
+
+    def start(self):
+        self.scrapers = [self.owner]
+
+        # Drivers are started one at a time: undetected_chromedriver patches its binary on startup
+        for number in range(1, self.size):
+            try:
+                worker = self.owner.spawn_worker()
+                worker.login_from_cookies()
+                self.scrapers.append(worker)
+                print(f"Worker {number} ready.")
+            except Exception as e:
+                print(f"Failed to start worker {number}: {e}")
+
+        print(f"Scraping with {len(self.scrapers)} browser(s).")
+
+    def shutdown(self):
+        """Quit every spawned browser after merging its counters into the owner; the owner's driver is left to run()."""
+        for worker in self.scrapers[1:]:
+            self.owner.merge_worker_counters(worker)
+            try:
+                worker.quit_driver()
+            except Exception as e:
+                print(f"Error closing worker browser: {e}")
+        self.scrapers = []
+
+    def _work(self, scraper, jobs, results):
+        while True:
+            job = jobs.get()
+            if job is None:
+                break
+
+            index, (url, connection) = job
+            row = None
+            try:
+                self.pacer.wait()
+                row = scraper.scrape_job(url, connection)
+            except Exception as e:
+                print(f"Worker error on {url}: {e}")
+            finally:
+                results.put((index, row))
+
+    def imap(self, job_list):
+        """Scrape (url, connection) jobs concurrently and yield their rows in input order (None on failure)."""
+        if not self.scrapers:
+            self.start()
+
+        jobs = queue.Queue()
+        results = queue.Queue()
+        for index, job in enumerate(job_list):
+            jobs.put((index, job))
+        for _ in self.scrapers:
+            jobs.put(None)  # One stop marker per worker
+
+        threads = [
+            threading.Thread(target=self._work, args=(scraper, jobs, results), name=f"scraper-{number}", daemon=True)
+            for number, scraper in enumerate(self.scrapers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        # Reorder buffer: rows finished out of order wait for their predecessors
+        finished = {}
+        next_index = 0
+        try:
+            while next_index < len(job_list):
+                index, row = results.get()
+                finished[index] = row
+                while next_index in finished:
+                    yield finished.pop(next_index)
+                    next_index += 1
+        finally:
+            # Drain remaining jobs so workers stop promptly if the consumer bails out
+            while True:
+                try:
+                    jobs.get_nowait()
+                except queue.Empty:
+                    break
+            for _ in threads:
+                jobs.put(None)
+            for thread in threads:
+                thread.join()
+
+
+class ScraperPipeline:
+    """
+    Overlaps the invitation harvest with profile scraping. The owner's browser
+    harvests and feeds (url, connection) jobs into a bounded queue, spawned browsers
+    scrape them into a second bounded queue of rows, and the caller drains that queue
+    as the writer stage. Full queues block the stage before them, so memory stays
+    bounded however long the harvest is. The owner joins the scrapers once the
+    harvest is done. Rows are yielded in completion order (None on failure).
+    """
+
+    def __init__(self, owner, workers, pace_interval=0.0, queue_size=20):
+        self.owner = owner
+        self.size = max(1, workers)  # The harvesting browser cannot scrape at the same time
+        self.pacer = PaceLimiter(pace_interval)
+        self.jobs = queue.Queue(maxsize=queue_size)
+        self.results = queue.Queue(maxsize=queue_size)
+        self.stop = threading.Event()
+        self.scrapers = []
+
+    def start(self):
+        for number in range(1, self.size + 1):
+            try:
+                worker = self.owner.spawn_worker()
+                worker.login_from_cookies()
+                self.scrapers.append(worker)
+                print(f"Worker {number} ready.")
+            except Exception as e:
+                print(f"Failed to start worker {number}: {e}")
+
+        print(f"Harvesting with 1 browser, scraping with {len(self.scrapers)}.")
+
+    def shutdown(self):
+        """Quit every spawned browser after merging its counters into the owner; the owner's driver is left to run()."""
+        for worker in self.scrapers:
+            self.owner.merge_worker_counters(worker)
+            try:
+                worker.quit_driver()
+            except Exception as e:
+                print(f"Error closing worker browser: {e}")
+        self.scrapers = []
+
+    def _put(self, target, item):
+        """Blocking put that gives up once the pipeline is stopping."""
+        while not self.stop.is_set():
+            try:
+                target.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _harvest(self, scrapers):
+        try:
+            count = 0
+            for job in self.owner.iter_jobs(self.owner.iter_harvest()):
+                if not self._put(self.jobs, job):
+                    return
+                count += 1
+            print(f"Harvest finished: {count} profiles queued.")
+        except Exception as e:
+            print(f"Harvest failed: {e}")
+        finally:
+            for _ in range(scrapers):
+                self._put(self.jobs, None)  # One stop marker per scraper
+
+        # The harvesting browser is free now
+        self._work(self.owner)
+
+    def _work(self, scraper):
+        try:
+            while not self.stop.is_set():
+                try:
+                    job = self.jobs.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                if job is None:
+                    break
+
+                url, connection = job
+                row = None
+                try:
+                    self.pacer.wait()
+                    row = scraper.scrape_job(url, connection)
+                except Exception as e:
+                    print(f"Worker error on {url}: {e}")
+                if not self._put(self.results, row):
+                    break
+        finally:
+            self._put(self.results, StopIteration)  # This stage is finished
+
+    def _owner_rows(self):
+        """No scraping browser started: harvest everything, then scrape in the harvesting browser."""
+        print("No scraping browser could be started; scraping in the harvesting browser after the harvest.")
+        jobs = list(self.owner.iter_jobs(self.owner.iter_harvest()))  # Scraping in between would leave the invitation list
+        for url, connection in jobs:
+            row = None
+            try:
+                self.pacer.wait()
+                row = self.owner.scrape_job(url, connection)
+            except Exception as e:
+                print(f"Worker error on {url}: {e}")
+            yield row
+
+    def rows(self):
+        """Run the pipeline and yield profile rows as soon as they are scraped."""
+        self.start()
+        if not self.scrapers:
+            yield from self._owner_rows()
+            return
+
+        # The owner's thread harvests first and scrapes afterwards, so it sends one extra stop marker
+        threads = [threading.Thread(target=self._harvest, args=(len(self.scrapers) + 1,), name="harvester", daemon=True)]
+        threads += [
+            threading.Thread(target=self._work, args=(scraper,), name=f"scraper-{number}", daemon=True)
+            for number, scraper in enumerate(self.scrapers, start=1)
+        ]
+        for thread in threads:
+            thread.start()
+
+        running = len(threads)
+        try:
+            while running:
+                row = self.results.get()
+                if row is StopIteration:
+                    running -= 1
+                    continue
+                yield row
+        finally:
+            # Unblock any stage waiting on a full queue, then wait for all of them
+            self.stop.set()
+            for thread in threads:
+                while thread.is_alive():
+                    for pending in (self.jobs, self.results):
+                        try:
+                            pending.get_nowait()
+                        except queue.Empty:
+                            pass
+                    thread.join(timeout=0.1)
+            self.shutdown()